@@ -0,0 +1,72 @@
+"""Times the JSON backends of `JSONDecoder` on a synthetic page.
+
+The page mimics a `rates_of_exchange` response, the records are flat
+dictionaries of strings like every endpoint of the Fiscal Data API.
+
+    $ python benchmarks/bench_json_decoders.py --records 10000
+"""
+
+import json
+import timeit
+import argparse
+import importlib.util
+
+from treasury.session import JSONDecoder
+
+
+def synthetic_page(records: int) -> bytes:
+    """Builds the body of a page holding `records` records."""
+
+    data = [
+        {
+            'record_date': '2020-{month:02d}-{day:02d}'.format(month=index % 12 + 1, day=index % 28 + 1),
+            'country': 'Country {index}'.format(index=index % 170),
+            'currency': 'Currency {index}'.format(index=index % 170),
+            'country_currency_desc': 'Country {index}-Currency {index}'.format(index=index % 170),
+            'exchange_rate': '{rate:.3f}'.format(rate=index * 0.137),
+            'effective_date': '2020-03-31',
+            'src_line_nbr': str(index % 170 + 1),
+            'record_fiscal_year': '2020',
+            'record_fiscal_quarter': '2',
+            'record_calendar_year': '2020',
+            'record_calendar_quarter': '1',
+            'record_calendar_month': '03',
+            'record_calendar_day': '31'
+        }
+        for index in range(records)
+    ]
+
+    content = {
+        'data': data,
+        'meta': {'count': records, 'total-count': records, 'total-pages': 1},
+        'links': {'self': '&page%5Bnumber%5D=1&page%5Bsize%5D={size}'.format(size=records), 'next': None}
+    }
+
+    return json.dumps(content).encode('utf-8')
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    body = synthetic_page(records=args.records)
+
+    print('{records} records, {size:.1f} MB'.format(records=args.records, size=len(body) / 1e6))
+
+    for backend in JSONDecoder.BACKENDS:
+
+        if backend != 'json' and importlib.util.find_spec(backend) is None:
+            print('{backend:>8}: not installed'.format(backend=backend))
+            continue
+
+        decode = JSONDecoder(backend=backend).decode
+        best = min(timeit.repeat(lambda: decode(body), number=1, repeat=args.repeat))
+
+        print('{backend:>8}: {ms:7.2f} ms/page'.format(backend=backend, ms=best * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -29,6 +29,19 @@ setup(
         'requests>=2.24.0'
     ],
 
+    # Define optional dependencies.
+    extras_require={
+        'async': ['httpx>=0.23.0'],
+        'fast': ['orjson>=3.6.0'],
+        'pandas': ['pandas>=2.0.0', 'numpy>=1.20.0'],
+        'arrow': ['pyarrow>=8.0.0', 'numpy>=1.20.0']
+    },
+
+    # Define the command line tools.
+    entry_points={
+        'console_scripts': ['treasury=treasury.cli:main']
+    },
+
     # Specify folder content.
     packages=find_namespace_packages(
         include=['treasury']
@@ -0,0 +1,283 @@
+import json
+import time
+import asyncio
+import unittest
+import requests
+
+from unittest import IsolatedAsyncioTestCase
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from treasury.session import RetryPolicy
+from treasury.rate_limit import RateLimiter
+from treasury.hedging import HedgingPolicy
+from treasury.concurrency import AdaptiveConcurrencyLimiter
+from treasury.circuit import CircuitBreaker
+from treasury.circuit import CircuitOpenError
+from treasury.other_data import OtherData
+from treasury.pagination import Paginator
+from treasury.pagination import RecordCollector
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed.')
+class AsyncFederalTreasuryTest(IsolatedAsyncioTestCase):
+
+    """Will perform a unit test for the `AsyncFederalTreasuryClient`."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up the `AsyncFederalTreasuryClient` with a mocked transport."""
+
+        from treasury.async_client import AsyncFederalTreasuryClient
+
+        self.requests = []
+        self.statuses = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+
+            self.requests.append(request)
+            status_code = self.statuses.pop(0) if self.statuses else 200
+
+            page_number = request.url.params['page[number]']
+
+            if request.url.params.get('format') == 'csv':
+                return httpx.Response(
+                    status_code=status_code,
+                    content='page\r\n{page}\r\n'.format(page=page_number).encode('utf-8')
+                )
+
+            return httpx.Response(
+                status_code=status_code,
+                content=json.dumps({
+                    'data': [{'page': page_number}],
+                    'meta': {'total-pages': 12},
+                    'links': {'next': None if page_number == '12' else '&page%5Bnumber%5D={n}'.format(
+                        n=int(page_number) + 1
+                    )}
+                }).encode('utf-8')
+            )
+
+        self.client = AsyncFederalTreasuryClient(
+            retry_policy=RetryPolicy(max_attempts=2, backoff_factor=0)
+        )
+        self.client.treasury_session._http_session = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+    async def test_services_return_awaitables(self):
+        """Make sure the shared services can be awaited."""
+
+        other_data_service = self.client.other_data()
+
+        self.assertIsInstance(other_data_service, OtherData)
+
+        content = await other_data_service.debt_to_penny(page_number=3)
+
+        self.assertEqual(content['data'], [{'page': '3'}])
+        self.assertNotIn('fields', self.requests[0].url.params)
+
+    async def test_fans_out_concurrently(self):
+        """Make sure many requests can run on one event loop."""
+
+        other_data_service = self.client.other_data()
+
+        pages = await asyncio.gather(*[
+            other_data_service.debt_to_penny(page_number=page_number)
+            for page_number in range(1, 21)
+        ])
+
+        self.assertEqual(
+            [content['data'][0]['page'] for content in pages],
+            [str(page_number) for page_number in range(1, 21)]
+        )
+
+    async def test_fetch_all_in_parallel(self):
+        """Make sure `fetch_all(parallel=N)` keeps the page order."""
+
+        records = await self.client.fetch_all(
+            self.client.other_data().debt_to_penny,
+            parallel=4
+        )
+
+        self.assertEqual(
+            [record['page'] for record in records],
+            [str(page_number) for page_number in range(1, 13)]
+        )
+
+    async def test_collect_in_parallel_folds_pages_as_they_arrive(self):
+        """Make sure `acollect(parallel=N)` appends contiguous pages before the last one arrives."""
+
+        collector = RecordCollector()
+        collected = []
+
+        await Paginator().acollect(
+            self.client.other_data().debt_to_penny,
+            collector=collector,
+            parallel=4,
+            progress=lambda done, total: collected.append(len(collector.build()))
+        )
+
+        self.assertEqual(collected[0], 1)
+        self.assertEqual(collected, sorted(collected))
+        self.assertEqual(
+            [record['page'] for record in collector.build()],
+            [str(page_number) for page_number in range(1, 13)]
+        )
+
+    async def test_iter_records(self):
+        """Make sure `iter_records` is an async generator over every page."""
+
+        records = [
+            record async for record in self.client.iter_records(self.client.other_data().debt_to_penny)
+        ]
+
+        self.assertEqual(len(records), 12)
+
+    async def test_retries_and_raises(self):
+        """Make sure the retry policy and error handling are shared."""
+
+        self.statuses = [503, 503]
+
+        with self.assertRaises(requests.HTTPError):
+            await self.client.other_data().debt_to_penny()
+
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_stream_records(self):
+        """Make sure `stream_records` parses the page as it arrives."""
+
+        async with await self.client.stream_records(self.client.other_data().debt_to_penny) as stream:
+            records = [record async for record in stream]
+
+        self.assertEqual(records, [{'page': '1'}])
+        self.assertEqual(stream.meta, {'total-pages': 12})
+
+    async def asyncTearDown(self) -> None:
+        """Teardown the `AsyncFederalTreasuryClient` Client."""
+
+        await self.client.close()
+
+
+    async def test_fetch_all_as_csv(self):
+        """Make sure CSV pages are streamed and stop at the `total-pages` of the probe."""
+
+        records = await self.client.fetch_all(
+            self.client.other_data().debt_to_penny,
+            page_size=1,
+            wire_format='csv'
+        )
+
+        self.assertEqual([record['page'] for record in records], [str(page_number) for page_number in range(1, 13)])
+        self.assertEqual([request.url.params['format'] for request in self.requests[:2]], ['json', 'csv'])
+
+
+    async def test_rate_limiter_spaces_concurrent_requests(self):
+        """Make sure requests gathered at once wait for their tokens without blocking the loop."""
+
+        self.client.treasury_session.rate_limiter = RateLimiter(rate=100, burst=2)
+        start = time.monotonic()
+
+        await asyncio.gather(*[
+            self.client.other_data().debt_to_penny(page_number=page_number)
+            for page_number in range(1, 6)
+        ])
+
+        self.assertEqual(len(self.requests), 5)
+        self.assertGreaterEqual(time.monotonic() - start, 0.029)
+
+    async def test_identical_requests_in_flight_share_one_call(self):
+        """Make sure tasks asking for the same page at once await one request."""
+
+        other_data_service = self.client.other_data()
+
+        pages = await asyncio.gather(*[
+            other_data_service.debt_to_penny(sort=['-record_date'], page_size=1)
+            for _ in range(8)
+        ])
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertTrue(all(content is pages[0] for content in pages))
+
+        self.statuses = [400, 400]
+
+        results = await asyncio.gather(*[
+            other_data_service.debt_to_penny(page_number=2)
+            for _ in range(3)
+        ], return_exceptions=True)
+
+        self.assertEqual(len(self.requests), 2)
+        self.assertTrue(all(isinstance(result, requests.HTTPError) for result in results))
+
+    async def test_hedged_request_cancels_the_slow_one(self):
+        """Make sure a slow GET is sent again, and the slow request is cancelled."""
+
+        cancelled = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+
+            self.requests.append(request)
+
+            if len(self.requests) == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+            return httpx.Response(status_code=200, content=json.dumps({'data': [{'hedge': True}]}).encode('utf-8'))
+
+        self.client.treasury_session.hedging_policy = HedgingPolicy(max_delay=0.02, budget=1.0)
+        self.client.treasury_session._http_session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        content = await self.client.other_data().debt_to_penny()
+
+        self.assertEqual(content['data'], [{'hedge': True}])
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    async def test_cancelled_hedges_do_not_cut_the_concurrency_limit(self):
+        """Make sure the slow attempts cancelled by hedging free their slot without a backoff."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+
+            self.requests.append(request)
+
+            # Every first attempt hangs until its hedge wins.
+            if len(self.requests) % 2:
+                await asyncio.sleep(5)
+
+            return httpx.Response(status_code=200, content=json.dumps({'data': []}).encode('utf-8'))
+
+        concurrency_limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=4)
+
+        self.client.treasury_session.hedging_policy = HedgingPolicy(max_delay=0.02, budget=1.0)
+        self.client.treasury_session.concurrency_limiter = concurrency_limiter
+        self.client.treasury_session._http_session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        for page_number in range(1, 4):
+            await self.client.other_data().debt_to_penny(page_number=page_number)
+
+        # Lets the cancelled attempts unwind.
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(len(self.requests), 6)
+        self.assertEqual(concurrency_limiter.limit(endpoint='/v2/accounting/od/debt_to_penny'), 4)
+        self.assertEqual(concurrency_limiter.in_flight(endpoint='/v2/accounting/od/debt_to_penny'), 0)
+
+    async def test_circuit_breaker_fails_fast_while_open(self):
+        """Make sure an endpoint family failing past the threshold is not called anymore."""
+
+        self.client.treasury_session.circuit_breaker = CircuitBreaker(failure_threshold=1)
+        self.statuses = [503, 503]
+
+        with self.assertRaises(requests.HTTPError):
+            await self.client.other_data().debt_to_penny()
+
+        with self.assertRaises(CircuitOpenError):
+            await self.client.other_data().debt_to_penny(page_number=2)
+
+        self.assertEqual(len(self.requests), 2)
+
+if __name__ == '__main__':
+    unittest.main()
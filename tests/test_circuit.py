@@ -0,0 +1,67 @@
+import time
+import unittest
+
+from unittest import TestCase
+from treasury.circuit import CircuitBreaker
+from treasury.circuit import CircuitOpenError
+
+RECEIVABLES = '/v2/debt/tror/collected_outstanding_recv'
+DELINQUENT = '/v2/debt/tror/delinquent_debt'
+PENNY = '/v2/accounting/od/debt_to_penny'
+
+
+class CircuitBreakerTest(TestCase):
+
+    """Will perform a unit test for the `CircuitBreaker`."""
+
+    def test_opens_after_consecutive_failures_of_a_family(self):
+        """Make sure the circuit opens after `failure_threshold` failures in a row, for its family only."""
+
+        breaker = CircuitBreaker(failure_threshold=3)
+
+        breaker.record_failure(endpoint=RECEIVABLES)
+        breaker.record_failure(endpoint=DELINQUENT)
+        breaker.record_response(endpoint=RECEIVABLES, status_code=404)
+        breaker.record_failure(endpoint=RECEIVABLES)
+        breaker.record_response(endpoint=RECEIVABLES, status_code=503)
+
+        self.assertEqual(breaker.state(endpoint=DELINQUENT), 'closed')
+
+        breaker.record_response(endpoint=DELINQUENT, status_code=429)
+
+        self.assertEqual(breaker.state(endpoint=DELINQUENT), 'open')
+        self.assertFalse(breaker.allow(endpoint=RECEIVABLES))
+        self.assertTrue(breaker.allow(endpoint=PENNY))
+
+        with self.assertRaises(CircuitOpenError):
+            breaker.check(endpoint=RECEIVABLES)
+
+    def test_half_opens_for_a_single_probe(self):
+        """Make sure one probe is let through after `reset_timeout`, and decides the state."""
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.02)
+        breaker.record_failure(endpoint=RECEIVABLES)
+
+        time.sleep(0.03)
+
+        self.assertTrue(breaker.allow(endpoint=RECEIVABLES))
+        self.assertEqual(breaker.state(endpoint=RECEIVABLES), 'half_open')
+        self.assertFalse(breaker.allow(endpoint=DELINQUENT))
+
+        breaker.record_failure(endpoint=RECEIVABLES)
+
+        self.assertEqual(breaker.state(endpoint=RECEIVABLES), 'open')
+        self.assertFalse(breaker.allow(endpoint=RECEIVABLES))
+
+        time.sleep(0.03)
+
+        self.assertTrue(breaker.allow(endpoint=RECEIVABLES))
+
+        breaker.record_response(endpoint=RECEIVABLES, status_code=200)
+
+        self.assertEqual(breaker.state(endpoint=RECEIVABLES), 'closed')
+        self.assertTrue(breaker.allow(endpoint=DELINQUENT))
+
+
+if __name__ == '__main__':
+    unittest.main()
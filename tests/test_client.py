@@ -102,6 +102,33 @@ class FederalTreasuryTest(TestCase):
             OffsetProgram
         )
 
+    def test_services_share_pooled_session(self):
+        """Make sure every service reuses the same pooled `requests.Session`."""
+
+        http_session = self.client.treasury_session.http_session
+
+        self.assertIs(
+            self.client.other_data().treasury_session.http_session,
+            http_session
+        )
+
+        self.assertIs(
+            self.client.daily_treasury_statements().treasury_session.http_session,
+            http_session
+        )
+
+    def test_context_manager_closes_pool(self):
+        """Make sure leaving the client context closes the pooled session."""
+
+        with FederalTreasuryClient() as treasury_client:
+            http_session = treasury_client.treasury_session.http_session
+
+        self.assertIsNone(treasury_client.treasury_session._http_session)
+        self.assertIsNot(
+            treasury_client.treasury_session.http_session,
+            http_session
+        )
+
     def tearDown(self) -> None:
         """Teardown the `FederalTreasuryClient` Client."""
 
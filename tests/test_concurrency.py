@@ -0,0 +1,128 @@
+import asyncio
+import threading
+import unittest
+
+from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase
+from treasury.concurrency import endpoint_family
+from treasury.concurrency import AdaptiveConcurrencyLimiter
+
+PENNY = '/v2/accounting/od/debt_to_penny'
+RATES = '/v2/accounting/od/rates_of_exchange'
+STATEMENT = '/v1/accounting/dts/dts_table_1'
+
+
+class AdaptiveConcurrencyLimiterTest(TestCase):
+
+    """Will perform a unit test for the `AdaptiveConcurrencyLimiter`."""
+
+    def test_families_are_endpoint_folders(self):
+        """Make sure the endpoints of a folder share a family."""
+
+        self.assertEqual(endpoint_family(PENNY), '/v2/accounting/od/*')
+        self.assertEqual(endpoint_family(PENNY), endpoint_family(RATES + '/'))
+        self.assertNotEqual(endpoint_family(PENNY), endpoint_family(STATEMENT))
+
+    def test_raises_the_limit_while_latency_holds(self):
+        """Make sure a full round of steady requests raises the cap by about one."""
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=6)
+
+        for _ in range(4):
+            limiter.acquire(endpoint=PENNY)
+
+        for _ in range(4):
+            limiter.release(endpoint=PENNY, latency=0.25)
+
+        self.assertEqual(limiter.limit(endpoint=RATES), 4)
+
+        for _ in range(40):
+            limiter.acquire(endpoint=PENNY)
+            limiter.release(endpoint=PENNY, latency=0.25)
+
+        self.assertEqual(limiter.limit(endpoint=PENNY), 6)
+        self.assertEqual(limiter.in_flight(endpoint=PENNY), 0)
+
+    def test_backs_off_once_per_burst_of_overloads(self):
+        """Make sure concurrent `429`s halve the cap of their family only."""
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8)
+
+        for _ in range(8):
+            limiter.acquire(endpoint=PENNY)
+
+        limiter.release(endpoint=PENNY, latency=0.25)
+
+        for _ in range(7):
+            limiter.release(endpoint=PENNY, latency=0.25, overloaded=True)
+
+        self.assertEqual(limiter.limit(endpoint=PENNY), 4)
+        self.assertEqual(limiter.limit(endpoint=STATEMENT), 8)
+
+    def test_latency_spikes_back_off(self):
+        """Make sure a request far slower than usual cuts the cap, down to the floor."""
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=1, max_limit=2)
+
+        limiter.acquire(endpoint=PENNY)
+        limiter.release(endpoint=PENNY, latency=0.0)
+        limiter.acquire(endpoint=PENNY)
+        limiter.release(endpoint=PENNY, latency=5.0)
+
+        self.assertEqual(limiter.limit(endpoint=PENNY), 1)
+
+    def test_blocks_threads_past_the_limit(self):
+        """Make sure a thread waits for a slot to be released."""
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        limiter.acquire(endpoint=PENNY)
+
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: (limiter.acquire(endpoint=RATES), acquired.set()))
+        thread.start()
+
+        self.assertFalse(acquired.wait(timeout=0.05))
+
+        limiter.release(endpoint=PENNY, latency=0.1)
+        thread.join(timeout=1)
+
+        self.assertTrue(acquired.is_set())
+        self.assertEqual(limiter.in_flight(endpoint=PENNY), 1)
+
+    def test_rejects_inconsistent_limits(self):
+        """Make sure the limits and the backoff are checked."""
+
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=4)
+
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimiter(backoff=1)
+
+
+class AsyncAdaptiveConcurrencyLimiterTest(IsolatedAsyncioTestCase):
+
+    """Will perform a unit test for the `AdaptiveConcurrencyLimiter` on an event loop."""
+
+    async def test_tasks_wait_for_a_slot(self):
+        """Make sure tasks past the limit run once earlier ones release their slot."""
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        peak = 0
+
+        async def request():
+
+            nonlocal peak
+
+            await limiter.aacquire(endpoint=PENNY)
+            peak = max(peak, limiter.in_flight(endpoint=PENNY))
+            await asyncio.sleep(0.01)
+            limiter.release(endpoint=PENNY, latency=0.01)
+
+        await asyncio.wait_for(asyncio.gather(*[request() for _ in range(6)]), timeout=2)
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(limiter.in_flight(endpoint=PENNY), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import csv
+import io
+import unittest
+
+from unittest import TestCase
+from treasury.csv_stream import CSVRecordParser
+from treasury.csv_stream import CSVRecordStream
+from treasury.pagination import Paginator
+from treasury.other_data import OtherData
+
+
+class FakeCSVSession():
+
+    """Answers JSON probes and streamed CSV pages from an in-memory dataset."""
+
+    def __init__(self, records: list, labels: dict = None) -> None:
+
+        self.records = records
+        self.labels = labels or {}
+        self.requests = []
+
+    def make_request(self, method: str, endpoint: str, params: dict = None, stream: bool = False, **kwargs):
+
+        self.requests.append(dict(params))
+
+        page_number = int(params['page[number]'])
+        page_size = int(params['page[size]'])
+        records = self.records[(page_number - 1) * page_size:page_number * page_size]
+
+        if not stream:
+            return {
+                'data': records,
+                'meta': {
+                    'count': len(records),
+                    'total-count': len(self.records),
+                    'total-pages': len(self.records),
+                    'labels': self.labels,
+                    'dataTypes': {'record_date': 'DATE', 'amount': 'CURRENCY'}
+                }
+            }
+
+        body = io.StringIO(newline='')
+        writer = csv.writer(body)
+        writer.writerow([self.labels.get(field, field) for field in self.records[0]])
+        writer.writerows([list(record.values()) for record in records])
+        encoded = body.getvalue().encode('utf-8')
+
+        return CSVRecordStream(chunks=[encoded[i:i + 5] for i in range(0, len(encoded), 5)])
+
+
+class CSVRecordParserTest(TestCase):
+
+    """Will perform a unit test for the `CSVRecordParser`."""
+
+    def setUp(self) -> None:
+        """Set up a CSV body with awkward values."""
+
+        self.body = (
+            '﻿record_date,note,amount\r\n'
+            '2020-01-01,"quoted, with a comma",1.50\r\n'
+            '2020-01-02,"two\r\nlines and ""quotes""",null\r\n'
+            '2020-01-03,é,3'
+        ).encode('utf-8')
+
+        self.records = [
+            {'record_date': '2020-01-01', 'note': 'quoted, with a comma', 'amount': '1.50'},
+            {'record_date': '2020-01-02', 'note': 'two\r\nlines and "quotes"', 'amount': 'null'},
+            {'record_date': '2020-01-03', 'note': 'é', 'amount': '3'}
+        ]
+
+    def test_yields_records_across_any_chunk_boundary(self):
+        """Make sure the records survive being split anywhere, even inside a character."""
+
+        for chunk_size in (1, 2, 3, 7, 64, len(self.body)):
+
+            stream = CSVRecordStream(
+                chunks=(self.body[i:i + chunk_size] for i in range(0, len(self.body), chunk_size))
+            )
+
+            self.assertEqual(list(stream), self.records)
+            self.assertIsNone(stream.meta)
+
+    def test_waits_for_the_end_of_quoted_line_breaks(self):
+        """Make sure a row is not parsed before its quoted value is closed."""
+
+        parser = CSVRecordParser()
+        cut = self.body.index(b'lines')
+
+        self.assertEqual(parser.feed(self.body[:cut]), self.records[:1])
+        self.assertEqual(parser.feed(self.body[cut:]), self.records[1:2])
+        self.assertEqual(parser.close(), self.records[2:])
+
+    def test_truncated_quoted_value_raises(self):
+        """Make sure a body cut off inside a quoted value raises a `ValueError`."""
+
+        parser = CSVRecordParser()
+        parser.feed(self.body[:self.body.index(b'lines')])
+
+        with self.assertRaises(ValueError):
+            parser.close()
+
+
+class CSVPaginationTest(TestCase):
+
+    """Will perform a unit test for `Paginator.iter_csv_pages`."""
+
+    def test_fetch_all_pulls_csv_pages(self):
+        """Make sure the CSV pages get the `meta` of the probe and stop at the last page."""
+
+        records = [{'record_date': '2020-01-{day:02d}'.format(day=day), 'amount': str(day)} for day in range(1, 26)]
+        session = FakeCSVSession(records=records, labels={'record_date': 'Record Date', 'amount': 'Amount'})
+
+        columns = Paginator().fetch_all(
+            OtherData(session=session).debt_to_penny,
+            page_size=10,
+            wire_format='csv',
+            as_columns=True
+        )
+
+        self.assertEqual(list(columns['amount']), [float(day) for day in range(1, 26)])
+        self.assertEqual(len(columns['record_date']), 25)
+        self.assertEqual([params['format'] for params in session.requests], ['json', 'csv', 'csv', 'csv'])
+
+    def test_rejects_parallel_csv_pulls(self):
+        """Make sure CSV pages are not requested in parallel."""
+
+        session = FakeCSVSession(records=[{'record_date': '2020-01-01', 'amount': '1'}])
+
+        with self.assertRaises(ValueError):
+            Paginator().fetch_all(OtherData(session=session).debt_to_penny, parallel=4, wire_format='csv')
+
+        with self.assertRaises(ValueError):
+            Paginator().fetch_all(OtherData(session=session).debt_to_penny, wire_format='xml')
+
+
+if __name__ == '__main__':
+    unittest.main()
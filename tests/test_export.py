@@ -0,0 +1,128 @@
+import tempfile
+import unittest
+
+from unittest import TestCase
+from treasury.other_data import OtherData
+
+try:
+    import pyarrow
+    import pyarrow.dataset
+except ImportError:
+    pyarrow = None
+
+
+class FakePagedSession():
+
+    """Serves a dataset one page at a time."""
+
+    def __init__(self, records: list) -> None:
+
+        self.records = records
+
+    def make_request(self, method: str, endpoint: str, params: dict = None, **kwargs) -> dict:
+
+        page_number = int(params['page[number]'])
+        page_size = int(params['page[size]'])
+        total_pages = -(-len(self.records) // page_size)
+
+        return {
+            'data': self.records[(page_number - 1) * page_size:page_number * page_size],
+            'meta': {
+                'total-count': len(self.records),
+                'total-pages': total_pages,
+                'dataTypes': {'record_date': 'DATE', 'record_fiscal_year': 'YEAR', 'amount': 'CURRENCY'}
+            },
+            'links': {'next': '&page%5Bnumber%5D={n}'.format(n=page_number + 1) if page_number < total_pages else None}
+        }
+
+
+@unittest.skipIf(pyarrow is None, 'pyarrow is not installed.')
+class DatasetExporterTest(TestCase):
+
+    """Will perform a unit test for the `DatasetExporter`."""
+
+    def setUp(self) -> None:
+        """Set up a three page dataset and an output directory."""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.service = OtherData(session=FakePagedSession(records=[
+            {'record_date': '2019-12-31', 'record_fiscal_year': '2020', 'amount': '1.5'},
+            {'record_date': '2020-09-30', 'record_fiscal_year': '2020', 'amount': 'null'},
+            {'record_date': '2020-10-31', 'record_fiscal_year': '2021', 'amount': '3'},
+            {'record_date': '2021-01-31', 'record_fiscal_year': 'null', 'amount': '4'},
+            {'record_date': '2021-02-28', 'record_fiscal_year': '2021', 'amount': '5'}
+        ]))
+
+    def test_partitions_by_fiscal_year(self):
+        """Make sure the pages are written to one directory per fiscal year."""
+
+        from treasury.export import DatasetExporter
+
+        result = DatasetExporter(
+            directory=self.directory.name,
+            partition_by='record_fiscal_year',
+            page_size=2
+        ).export(self.service.debt_to_penny)
+
+        self.assertEqual(result.rows, 5)
+        self.assertEqual(
+            sorted(path.split('/')[-2] for path in result.files),
+            ['record_fiscal_year=2020', 'record_fiscal_year=2021', 'record_fiscal_year=__HIVE_DEFAULT_PARTITION__']
+        )
+
+        table = pyarrow.dataset.dataset(result.path, format='parquet', partitioning='hive').to_table()
+
+        self.assertEqual(sorted(table.column('amount').to_pylist(), key=str), [1.5, 3.0, 4.0, 5.0, None])
+
+    def test_date_fields_partition_by_year(self):
+        """Make sure a date field is partitioned by its year, in Arrow IPC files."""
+
+        from treasury.export import DatasetExporter
+
+        result = DatasetExporter(
+            directory=self.directory.name,
+            file_format='arrow',
+            partition_by='record_date',
+            page_size=2
+        ).export(self.service.debt_to_penny)
+
+        self.assertEqual(
+            sorted(path.split('/')[-2] for path in result.files),
+            ['record_date_year=2019', 'record_date_year=2020', 'record_date_year=2021']
+        )
+        self.assertTrue(all(path.endswith('.arrow') for path in result.files))
+
+    def test_pages_missing_a_field_are_filled_with_nulls(self):
+        """Make sure a field absent from a later page is written as nulls."""
+
+        from treasury.export import DatasetExporter
+
+        del self.service.treasury_session.records[4]['amount']
+
+        result = DatasetExporter(directory=self.directory.name, page_size=2).export(self.service.debt_to_penny)
+        table = pyarrow.dataset.dataset(result.path, format='parquet').to_table()
+
+        self.assertEqual(result.rows, 5)
+        self.assertEqual(table.column('amount').to_pylist()[4], None)
+
+    def test_rejects_unknown_partition_fields(self):
+        """Make sure a missing partition field raises a `ValueError`."""
+
+        from treasury.export import DatasetExporter
+
+        dataset_exporter = DatasetExporter(directory=self.directory.name, partition_by='missing', page_size=2)
+
+        with self.assertRaises(ValueError):
+            dataset_exporter.export(self.service.debt_to_penny)
+
+        with self.assertRaises(ValueError):
+            dataset_exporter.export(self.service.debt_to_penny, fields=['record_date'])
+
+    def tearDown(self) -> None:
+        """Remove the output directory."""
+
+        self.directory.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+from unittest import TestCase
+from datetime import date
+from treasury.columns import ColumnBuilder
+from treasury.frames import to_arrow
+from treasury.frames import to_dataframe
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def dataset_page() -> dict:
+    """Builds a page with a column of each kind and a missing value in each."""
+
+    return {
+        'data': [
+            {'record_date': '2020-01-31', 'amt': '1.5', 'line': '1', 'desc': 'Gold'},
+            {'record_date': 'null', 'amt': 'null', 'line': '2', 'desc': 'null'}
+        ],
+        'meta': {
+            'dataTypes': {'record_date': 'DATE', 'amt': 'CURRENCY', 'line': 'INTEGER', 'desc': 'STRING'}
+        }
+    }
+
+
+class FramesTest(TestCase):
+
+    """Will perform a unit test for `to_dataframe` and `to_arrow`."""
+
+    @unittest.skipIf(pandas is None, 'pandas is not installed.')
+    def test_to_dataframe_sets_dtypes(self):
+        """Make sure the frame gets the dtypes of the `dataTypes`."""
+
+        frame = to_dataframe(ColumnBuilder().append(dataset_page()).append(dataset_page()))
+
+        self.assertEqual(len(frame), 4)
+        self.assertEqual(str(frame['record_date'].dtype), 'datetime64[s]')
+        self.assertEqual(str(frame['amt'].dtype), 'float64')
+        self.assertEqual(str(frame['line'].dtype), 'int64')
+        self.assertEqual(str(frame['desc'].dtype), 'string')
+        self.assertTrue(pandas.isna(frame['record_date'][1]))
+        self.assertEqual(frame['record_date'][0].date(), date(2020, 1, 31))
+
+    @unittest.skipIf(pandas is None, 'pandas is not installed.')
+    def test_to_dataframe_keeps_dates_outside_nanosecond_range(self):
+        """Make sure dates before 1677 and after 2262 don't wrap around."""
+
+        content = dataset_page()
+        content['data'][0]['record_date'] = '1600-01-01'
+        content['data'][1]['record_date'] = '2300-12-31'
+
+        frame = to_dataframe(content)
+
+        self.assertEqual(frame['record_date'][0].date(), date(1600, 1, 1))
+        self.assertEqual(frame['record_date'][1].date(), date(2300, 12, 31))
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed.')
+    def test_to_arrow_sets_types(self):
+        """Make sure the table gets the types of the `dataTypes`, with nulls."""
+
+        table = to_arrow(dataset_page())
+
+        self.assertEqual(str(table.schema.field('record_date').type), 'date32[day]')
+        self.assertEqual(table.column('record_date').to_pylist(), [date(2020, 1, 31), None])
+        self.assertEqual(table.column('amt').to_pylist(), [1.5, None])
+        self.assertEqual(table.column('line').to_pylist(), [1, 2])
+        self.assertEqual(table.column('desc').to_pylist(), ['Gold', None])
+
+    def test_rejects_other_results(self):
+        """Make sure only pages and builders are accepted."""
+
+        if pandas is None:
+            with self.assertRaises(ImportError):
+                to_dataframe(dataset_page())
+        else:
+            with self.assertRaises(TypeError):
+                to_dataframe([{'record_date': '2020-01-31'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from unittest import TestCase
+from treasury.hedging import HedgingPolicy
+
+PENNY = '/v2/accounting/od/debt_to_penny'
+
+
+class HedgingPolicyTest(TestCase):
+
+    """Will perform a unit test for the `HedgingPolicy`."""
+
+    def test_delay_follows_the_percentile_of_the_family(self):
+        """Make sure the delay is the percentile of the recent latencies, within its bounds."""
+
+        policy = HedgingPolicy(percentile=0.9, min_delay=0.05, max_delay=2.0, min_samples=10, window=10)
+
+        self.assertEqual(policy.delay_for(endpoint=PENNY), 2.0)
+
+        for latency in range(1, 11):
+            policy.record(endpoint=PENNY, latency=latency / 10)
+
+        self.assertAlmostEqual(policy.delay_for(endpoint='/v2/accounting/od/rates_of_exchange'), 0.9)
+        self.assertEqual(policy.delay_for(endpoint='/v1/accounting/dts/dts_table_1'), 2.0)
+
+        for _ in range(10):
+            policy.record(endpoint=PENNY, latency=0.001)
+
+        self.assertEqual(policy.delay_for(endpoint=PENNY), 0.05)
+
+    def test_hedges_stay_within_the_budget(self):
+        """Make sure no more than `budget` of the requests are hedged."""
+
+        policy = HedgingPolicy(budget=0.1)
+        hedges = 0
+
+        for _ in range(100):
+            policy.delay_for(endpoint=PENNY)
+            hedges += policy.try_hedge()
+
+        self.assertEqual(hedges, 10)
+        self.assertEqual(policy.hedges, 10)
+
+    def test_rejects_invalid_settings(self):
+        """Make sure the percentile and the budget are checked."""
+
+        with self.assertRaises(ValueError):
+            HedgingPolicy(percentile=1.5)
+
+        with self.assertRaises(ValueError):
+            HedgingPolicy(budget=-0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
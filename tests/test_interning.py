@@ -0,0 +1,64 @@
+import json
+import unittest
+
+from unittest import TestCase
+from treasury.interning import StringInterner
+
+
+def decoded_page(start: int, count: int) -> dict:
+    """Decodes a page of records, each holding its own copy of every string."""
+
+    records = [
+        {
+            'record_date': '2020-01-{day:02d}'.format(day=n % 28 + 1),
+            'agency_nm': ['Treasury', 'Defense', 'Energy'][n % 3],
+            'note': 'note {n}'.format(n=n),
+            'amount': n
+        }
+        for n in range(start, start + count)
+    ]
+
+    return json.loads(json.dumps({'data': records}))
+
+
+class StringInternerTest(TestCase):
+
+    """Will perform a unit test for the `StringInterner`."""
+
+    def test_low_cardinality_fields_share_their_values(self):
+        """Make sure repeated values end up as one object, and unique ones are left alone."""
+
+        string_interner = StringInterner(sample_size=100)
+
+        first = string_interner.decode(decoded_page(start=0, count=100), endpoint='/v2/debt/tror/data_act_compliance')
+        second = string_interner.decode(decoded_page(start=100, count=100), endpoint='/v2/debt/tror/data_act_compliance')
+
+        self.assertEqual(
+            string_interner.categorical_fields('/v2/debt/tror/data_act_compliance'),
+            frozenset(['record_date', 'agency_nm'])
+        )
+        self.assertIs(first['data'][0]['agency_nm'], second['data'][98]['agency_nm'])
+        self.assertIs(first['data'][1]['record_date'], second['data'][13]['record_date'])
+        self.assertNotIn('note', string_interner.dictionaries['/v2/debt/tror/data_act_compliance'])
+        self.assertEqual(second['data'][5]['note'], 'note 105')
+        self.assertEqual(string_interner.categorical_fields('/v1/other'), frozenset())
+
+    def test_fields_outgrowing_the_limit_are_dropped(self):
+        """Make sure a field that turns out to have many values stops being encoded."""
+
+        string_interner = StringInterner(max_distinct=30, max_ratio=1.0, sample_size=10)
+
+        string_interner.decode(decoded_page(start=0, count=10), endpoint='/v1/accounting/dts/dts_table_1')
+        self.assertIn('note', string_interner.categorical_fields('/v1/accounting/dts/dts_table_1'))
+
+        string_interner.decode(decoded_page(start=10, count=30), endpoint='/v1/accounting/dts/dts_table_1')
+
+        self.assertEqual(
+            string_interner.categorical_fields('/v1/accounting/dts/dts_table_1'),
+            frozenset(['record_date', 'agency_nm'])
+        )
+        self.assertNotIn('note', string_interner.dictionaries['/v1/accounting/dts/dts_table_1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import time
+import tempfile
+import unittest
+
+from unittest import TestCase
+from treasury.rate_limit import RateLimiter
+from treasury.rate_limit import FileRateLimiter
+
+
+class RateLimiterTest(TestCase):
+
+    """Will perform a unit test for the `RateLimiter`."""
+
+    def test_burst_then_paces_at_the_rate(self):
+        """Make sure the burst is free and the next requests are spaced by `1 / rate`."""
+
+        rate_limiter = RateLimiter(rate=50, burst=3)
+        delays = [rate_limiter.reserve() for _ in range(5)]
+
+        self.assertEqual(delays[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(delays[3], 0.02, delta=0.005)
+        self.assertAlmostEqual(delays[4], 0.04, delta=0.005)
+
+    def test_acquire_waits_for_the_refill(self):
+        """Make sure `acquire` blocks until a token is available."""
+
+        rate_limiter = RateLimiter(rate=100, burst=1)
+        start = time.monotonic()
+
+        for _ in range(4):
+            rate_limiter.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.029)
+
+    def test_rejects_empty_buckets(self):
+        """Make sure a bucket that never refills is refused."""
+
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+
+        with self.assertRaises(ValueError):
+            RateLimiter(burst=0)
+
+
+@unittest.skipIf(os.name != 'posix', 'The `FileRateLimiter` needs `fcntl`.')
+class FileRateLimiterTest(TestCase):
+
+    """Will perform a unit test for the `FileRateLimiter`."""
+
+    def test_limiters_on_one_file_share_the_budget(self):
+        """Make sure two limiters, like two processes, take from the same bucket."""
+
+        with tempfile.TemporaryDirectory() as folder:
+
+            path = os.path.join(folder, 'fiscal_data.bucket')
+            first = FileRateLimiter(path=path, rate=50, burst=2)
+            second = FileRateLimiter(path=path, rate=50, burst=2)
+
+            self.assertEqual(first.reserve(), 0.0)
+            self.assertEqual(second.reserve(), 0.0)
+            self.assertAlmostEqual(first.reserve(), 0.02, delta=0.005)
+            self.assertAlmostEqual(second.reserve(), 0.04, delta=0.005)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import sys
+import unittest
+
+from unittest import TestCase
+from treasury.records import record_type
+from treasury.records import record_type_name
+from treasury.records import RecordTupleCollector
+from treasury.pagination import Paginator
+from treasury.other_data import OtherData
+
+
+class FakePageSession():
+
+    """Answers every request with the same page of records."""
+
+    def __init__(self, records: list) -> None:
+
+        self.records = records
+
+    def make_request(self, method: str, endpoint: str, params: dict = None, **kwargs) -> dict:
+
+        return {'data': self.records, 'meta': {'total-pages': 1}, 'links': {'next': None}}
+
+
+class RecordTypeTest(TestCase):
+
+    """Will perform a unit test for the generated record types."""
+
+    def test_record_type_is_cached_per_endpoint_and_fields(self):
+        """Make sure one class is generated per endpoint and field list."""
+
+        fields = ('record_date', 'tot_pub_debt_out_amt')
+        DebtToPennyRecord = record_type('/v2/accounting/od/debt_to_penny', fields)
+
+        self.assertIs(DebtToPennyRecord, record_type('/v2/accounting/od/debt_to_penny', fields))
+        self.assertIsNot(DebtToPennyRecord, record_type('/v2/accounting/od/debt_to_penny', fields[:1]))
+        self.assertEqual(DebtToPennyRecord.__name__, 'DebtToPennyRecord')
+        self.assertEqual(record_type_name('/v1/accounting/dts/dts_table_1'), 'DtsTable1Record')
+
+        record = DebtToPennyRecord('2020-01-31', '1.5')
+
+        self.assertEqual(record.record_date, '2020-01-31')
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertLess(sys.getsizeof(record), sys.getsizeof(record._asdict()))
+
+    def test_invalid_field_names_are_renamed(self):
+        """Make sure fields that are not identifiers don't break the type."""
+
+        OddRecord = record_type('/v1/odd', ('record_date', 'class', '1st', 'record_date'))
+
+        self.assertEqual(OddRecord._fields, ('record_date', '_1', '_2', '_3'))
+
+    def test_fetch_all_as_tuples(self):
+        """Make sure `as_tuples` returns instances of the endpoint's record type."""
+
+        session = FakePageSession(records=[
+            {'record_date': '2020-01-31', 'amount': '1.5'},
+            {'amount': '2.5', 'record_date': '2020-02-29'},
+            {'record_date': '2020-03-31'}
+        ])
+
+        records = Paginator().fetch_all(OtherData(session=session).debt_to_penny, as_tuples=True)
+
+        self.assertEqual(type(records[0]).__name__, 'DebtToPennyRecord')
+        self.assertEqual([record.amount for record in records], ['1.5', '2.5', None])
+        self.assertEqual(records[1].record_date, '2020-02-29')
+
+        with self.assertRaises(ValueError):
+            Paginator().fetch_all(OtherData(session=session).debt_to_penny, as_tuples=True, as_columns=True)
+
+    def test_fields_come_from_labels_without_records(self):
+        """Make sure an empty first page still sets the fields from the `labels`."""
+
+        collector = RecordTupleCollector(endpoint='/v2/accounting/od/gold_reserve')
+        collector.append({'data': [], 'meta': {'labels': {'record_date': 'Record Date', 'book_value_amt': 'Book Value'}}})
+        collector.append({'data': [{'record_date': '2020-01-31', 'book_value_amt': '11041059957.50'}]})
+
+        self.assertEqual(collector.fields, ('record_date', 'book_value_amt'))
+        self.assertEqual(collector.build()[0].book_value_amt, '11041059957.50')
+
+
+if __name__ == '__main__':
+    unittest.main()
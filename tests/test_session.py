@@ -0,0 +1,727 @@
+import json
+import math
+import time
+import tempfile
+import threading
+import importlib.util
+import unittest
+import requests
+
+from array import array
+from unittest import TestCase
+from decimal import Decimal
+from datetime import date
+from unittest import mock
+from urllib.parse import urlparse
+from urllib.parse import parse_qs
+from requests.adapters import BaseAdapter
+from treasury.cache import MemoryResponseCache
+from treasury.cache import SQLiteResponseCache
+from treasury.session import JSONDecoder
+from treasury.session import RetryPolicy
+from treasury.typed import TypeDecoder
+from treasury.typed import parse_cents
+from treasury.typed import record_converters
+from treasury.interning import StringInterner
+from treasury.rate_limit import RateLimiter
+from treasury.concurrency import AdaptiveConcurrencyLimiter
+from treasury.hedging import HedgingPolicy
+from treasury.circuit import CircuitBreaker
+from treasury.circuit import CircuitOpenError
+from treasury.pagination import PageSizePolicy
+from treasury.pagination import RecordCollector
+from treasury.pagination import PageReorderBuffer
+from treasury.client import FederalTreasuryClient
+
+
+class FakeAdapter(BaseAdapter):
+
+    """Replays a queue of canned responses instead of hitting the API."""
+
+    def __init__(self, responses) -> None:
+
+        super().__init__()
+        self.responses = responses if callable(responses) else list(responses)
+        self.requests = []
+
+    def send(self, request, **kwargs) -> requests.Response:
+
+        self.requests.append(request)
+
+        if callable(self.responses):
+            status_code, body, headers = self.responses(request)
+        else:
+            status_code, body, headers = self.responses.pop(0)
+
+        if isinstance(status_code, Exception):
+            raise status_code
+
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = json.dumps(body).encode('utf-8')
+        response._content_consumed = True
+        response.headers.update(headers or {})
+        response.request = request
+        response.url = request.url
+
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def page(records: list, page_number: int = 1, total_pages: int = 1) -> dict:
+    """Builds a response body shaped like the Fiscal Data API."""
+
+    return {
+        'data': records,
+        'meta': {
+            'count': len(records),
+            'total-count': len(records) * total_pages,
+            'total-pages': total_pages
+        },
+        'links': {
+            'self': '&page%5Bnumber%5D={n}&page%5Bsize%5D=100'.format(n=page_number),
+            'next': None if page_number >= total_pages else '&page%5Bnumber%5D={n}&page%5Bsize%5D=100'.format(
+                n=page_number + 1
+            )
+        }
+    }
+
+
+class FederalTreasurySessionTest(TestCase):
+
+    """Will perform a unit test for the `FederalTreasurySession`."""
+
+    def setUp(self) -> None:
+        """Set up a `FederalTreasuryClient` with a fast retry policy."""
+
+        self.client = FederalTreasuryClient(
+            retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False)
+        )
+
+    def mount(self, responses: list) -> FakeAdapter:
+        """Mounts a `FakeAdapter` on the client's pooled session."""
+
+        adapter = FakeAdapter(responses=responses)
+        self.client.treasury_session.http_session.mount('https://', adapter)
+
+        return adapter
+
+    def test_retries_transient_status_codes(self):
+        """Make sure a 503 followed by a 200 returns the 200 body."""
+
+        adapter = self.mount([
+            (503, {'error': 'unavailable'}, None),
+            (200, page([{'record_date': '2020-01-01'}]), None)
+        ])
+
+        content = self.client.other_data().debt_to_penny()
+
+        self.assertEqual(content['data'], [{'record_date': '2020-01-01'}])
+        self.assertEqual(len(adapter.requests), 2)
+
+    def test_does_not_retry_client_errors(self):
+        """Make sure a 400 is raised immediately as an `HTTPError`."""
+
+        adapter = self.mount([
+            (400, {'error': 'bad filter'}, None),
+            (200, page([]), None)
+        ])
+
+        with self.assertRaises(requests.HTTPError) as context:
+            self.client.other_data().debt_to_penny(filters=['bad'])
+
+        self.assertEqual(context.exception.response.status_code, 400)
+        self.assertEqual(len(adapter.requests), 1)
+
+    def test_retries_connection_errors_until_exhausted(self):
+        """Make sure connection errors are retried up to `max_attempts`."""
+
+        adapter = self.mount([
+            (requests.ConnectionError('reset'), None, None),
+            (requests.ConnectionError('reset'), None, None),
+            (requests.ConnectionError('reset'), None, None)
+        ])
+
+        with self.assertRaises(requests.ConnectionError):
+            self.client.other_data().debt_to_penny()
+
+        self.assertEqual(len(adapter.requests), 3)
+
+    def test_honors_retry_after(self):
+        """Make sure the `Retry-After` header overrides the backoff."""
+
+        self.mount([
+            (429, {'error': 'slow down'}, {'Retry-After': '2'}),
+            (200, page([]), None)
+        ])
+
+        with mock.patch('treasury.session.time.sleep') as sleep:
+            self.client.other_data().debt_to_penny()
+
+        sleep.assert_called_once_with(2.0)
+
+    def test_iter_records_follows_next_links(self):
+        """Make sure `iter_records` walks `links.next` lazily."""
+
+        adapter = self.mount([
+            (200, page([{'n': 1}, {'n': 2}], page_number=1, total_pages=3), None),
+            (200, page([{'n': 3}, {'n': 4}], page_number=2, total_pages=3), None),
+            (200, page([{'n': 5}], page_number=3, total_pages=3), None)
+        ])
+
+        records = self.client.iter_records(
+            self.client.other_data().debt_to_penny,
+            filters=['record_date:gte:2020-01-01']
+        )
+
+        self.assertEqual(next(records), {'n': 1})
+        self.assertEqual(len(adapter.requests), 1)
+
+        self.assertEqual([record['n'] for record in records], [2, 3, 4, 5])
+        self.assertEqual(len(adapter.requests), 3)
+        self.assertIn('page%5Bnumber%5D=3', adapter.requests[-1].url)
+        self.assertIn('filters=record_date%3Agte%3A2020-01-01', adapter.requests[-1].url)
+
+    def test_fetch_all_falls_back_to_total_pages(self):
+        """Make sure `meta['total-pages']` is used when `links` is missing."""
+
+        first_page = page([{'n': 1}], page_number=1, total_pages=2)
+        second_page = page([{'n': 2}], page_number=2, total_pages=2)
+        del first_page['links'], second_page['links']
+
+        self.mount([(200, first_page, None), (200, second_page, None)])
+
+        self.assertEqual(
+            self.client.fetch_all(self.client.other_data().gold_reserve),
+            [{'n': 1}, {'n': 2}]
+        )
+
+    def test_fetch_all_in_parallel_keeps_page_order(self):
+        """Make sure `fetch_all(parallel=N)` reassembles pages in order."""
+
+        def respond(request):
+            page_number = int(parse_qs(urlparse(request.url).query)['page[number]'][0])
+            return 200, page([{'n': page_number}], page_number=page_number, total_pages=25), None
+
+        adapter = self.mount(respond)
+        progress = []
+
+        records = self.client.fetch_all(
+            self.client.revenue_and_payments().revenue_collection,
+            parallel=8,
+            progress=lambda done, total: progress.append((done, total))
+        )
+
+        self.assertEqual([record['n'] for record in records], list(range(1, 26)))
+        self.assertEqual(len(adapter.requests), 25)
+        self.assertEqual(progress[-1], (25, 25))
+
+    def test_reorder_buffer_releases_contiguous_pages(self):
+        """Make sure pages reach the collector as soon as their prefix is complete."""
+
+        collector = RecordCollector()
+        buffer = PageReorderBuffer(collector=collector, page_number=1)
+
+        buffer.add(page_number=3, content=page([{'n': 3}]))
+        buffer.add(page_number=2, content=page([{'n': 2}]))
+        self.assertEqual(collector.build(), [])
+        self.assertEqual(len(buffer.pending), 2)
+
+        buffer.add(page_number=1, content=page([{'n': 1}]))
+        self.assertEqual([record['n'] for record in collector.build()], [1, 2, 3])
+        self.assertEqual(buffer.pending, {})
+
+        buffer.add(page_number=5, content=page([{'n': 5}]))
+        self.assertEqual(len(collector.build()), 3)
+        self.assertEqual(buffer.pages_done, 4)
+
+    def test_fetch_all_in_parallel_cancels_queued_pages_on_error(self):
+        """Make sure a failing page stops the pages still queued from being requested."""
+
+        def respond(request):
+            page_number = int(parse_qs(urlparse(request.url).query)['page[number]'][0])
+            if page_number == 2:
+                return 400, {'error': 'bad page'}, None
+            time.sleep(0.01)
+            return 200, page([{'n': page_number}], page_number=page_number, total_pages=50), None
+
+        adapter = self.mount(respond)
+
+        with self.assertRaises(requests.HTTPError):
+            self.client.fetch_all(self.client.revenue_and_payments().revenue_collection, parallel=2)
+
+        self.assertLess(len(adapter.requests), 50)
+
+    def test_auto_page_size_minimizes_round_trips(self):
+        """Make sure `page_size='auto'` probes once, then pulls in one page."""
+
+        dataset = [{'n': n} for n in range(2500)]
+
+        def respond(request):
+            query = parse_qs(urlparse(request.url).query)
+            page_number = int(query['page[number]'][0])
+            page_size = int(query['page[size]'][0])
+            records = dataset[(page_number - 1) * page_size:page_number * page_size]
+            body = page(records)
+            body['meta']['total-count'] = len(dataset)
+            return 200, body, None
+
+        adapter = self.mount(respond)
+
+        records = self.client.fetch_all(
+            self.client.other_data().saving_bonds_value,
+            page_size='auto'
+        )
+
+        self.assertEqual(records, dataset)
+        self.assertEqual(len(adapter.requests), 2)
+        self.assertIn('page%5Bsize%5D=2500', adapter.requests[-1].url)
+
+    def test_page_size_policy_adjusts_on_page_boundaries(self):
+        """Make sure slow pages shrink, fast pages grow, without gaps."""
+
+        policy = PageSizePolicy(max_latency=4.0)
+
+        self.assertEqual(policy.adjust(page_size=1000, offset=3000, latency=5.0, record_bytes=100), 500)
+        self.assertEqual(policy.adjust(page_size=500, offset=3000, latency=0.1, record_bytes=100), 1000)
+        self.assertEqual(policy.adjust(page_size=500, offset=3500, latency=0.1, record_bytes=100), 875)
+        self.assertEqual(policy.adjust(page_size=500, offset=3500, latency=2.0, record_bytes=100), 500)
+
+    def test_persistent_cache_serves_repeated_requests(self):
+        """Make sure a cached GET is not sent twice, across clients."""
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+
+            cache = SQLiteResponseCache(path=cache_dir + '/cache.sqlite')
+            self.client.treasury_session.cache = cache
+
+            adapter = self.mount([(200, page([{'n': 1}]), None)])
+            service = self.client.monthly_treasury_statements()
+
+            first = service.receipts(filters=['record_fiscal_year:eq:2020'])
+            second = service.receipts(filters=['record_fiscal_year:eq:2020'])
+
+            self.assertEqual(first, second)
+            self.assertEqual(len(adapter.requests), 1)
+
+            # A second client, like another process, shares the same file.
+            other_cache = SQLiteResponseCache(path=cache_dir + '/cache.sqlite')
+
+            with FederalTreasuryClient(cache=other_cache) as other_client:
+                self.assertEqual(
+                    other_client.monthly_treasury_statements().receipts(filters=['record_fiscal_year:eq:2020']),
+                    first
+                )
+
+            cache.close()
+            other_cache.close()
+
+    def test_cache_ttls_follow_publication_cadence(self):
+        """Make sure TTLs follow the dataset and expired entries are stale."""
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+
+            cache = SQLiteResponseCache(path=cache_dir + '/cache.sqlite')
+
+            self.assertEqual(cache.ttl_for('/v1/accounting/dts/dts_table_1'), 4 * 60 * 60)
+            self.assertEqual(cache.ttl_for('/v1/accounting/mts/mts_table_1'), 24 * 60 * 60)
+            self.assertEqual(cache.ttl_for('/v1/debt/mspd/mspd_table_1'), 24 * 60 * 60)
+            self.assertEqual(cache.ttl_for('/v2/accounting/od/debt_to_penny'), 4 * 60 * 60)
+            self.assertEqual(cache.ttl_for('/v2/accounting/od/gold_reserve'), 30 * 24 * 60 * 60)
+            self.assertEqual(cache.ttl_for('/v2/unknown/endpoint'), 60 * 60)
+
+            cache.set('/v2/accounting/od/debt_to_penny', {'b': 1, 'a': None}, b'{}', ttl=-1)
+
+            self.assertIsNone(cache.get('/v2/accounting/od/debt_to_penny', {'b': 1}))
+            self.assertEqual(cache.get('/v2/accounting/od/debt_to_penny', {'b': 1}, allow_stale=True), b'{}')
+
+            cache.close()
+
+    def test_memory_cache_serves_dashboard_calls(self):
+        """Make sure repeated calls are served from memory and counted."""
+
+        self.client.treasury_session.memory_cache = MemoryResponseCache()
+        adapter = self.mount([(200, page([{'n': 1}]), None)])
+
+        for _ in range(5):
+            content = self.client.other_data().debt_to_penny(sort=['-record_date'], page_size=1)
+
+        self.assertEqual(content['data'], [{'n': 1}])
+        self.assertEqual(len(adapter.requests), 1)
+
+        cache_info = self.client.cache_info()
+
+        self.assertEqual((cache_info.hits, cache_info.misses, cache_info.entries), (4, 1, 1))
+        self.assertGreater(cache_info.bytes, 0)
+
+    def test_memory_cache_evicts_least_recently_used(self):
+        """Make sure the byte bound evicts the least recently used entry."""
+
+        memory_cache = MemoryResponseCache(max_bytes=250, ttl=60)
+
+        memory_cache.set('/a', {}, 'a', size=100)
+        memory_cache.set('/b', {}, 'b', size=100)
+        memory_cache.get('/a', {})
+        memory_cache.set('/c', {}, 'c', size=100)
+
+        self.assertEqual(memory_cache.get('/a', {}), 'a')
+        self.assertIsNone(memory_cache.get('/b', {}))
+        self.assertEqual(memory_cache.cache_info().evictions, 1)
+        self.assertEqual(memory_cache.cache_info().bytes, 200)
+
+        expired_cache = MemoryResponseCache(ttl=-1)
+        expired_cache.set('/a', {}, 'a', size=1)
+
+        self.assertIsNone(expired_cache.get('/a', {}))
+        self.assertEqual(len(expired_cache), 0)
+
+    def test_json_decoders_agree(self):
+        """Make sure every installed JSON backend decodes the same content."""
+
+        body = json.dumps(page([{'record_date': '2020-01-01', 'amount': '1.5'}])).encode('utf-8')
+        backends = [
+            backend for backend in JSONDecoder.BACKENDS
+            if backend == 'json' or importlib.util.find_spec(backend)
+        ]
+
+        for backend in backends:
+            self.assertEqual(JSONDecoder(backend=backend).decode(body), json.loads(body))
+
+        with self.assertRaises(ValueError):
+            JSONDecoder(backend='simplejson')
+
+        self.client.treasury_session.decoder = JSONDecoder(backend='json')
+        self.mount([(200, page([{'a': '1'}]), {})])
+
+        self.assertEqual(self.client.other_data().debt_to_penny()['data'], [{'a': '1'}])
+
+    def test_stream_records_parses_the_page_incrementally(self):
+        """Make sure `stream_records` yields the records, then the `meta`."""
+
+        self.mount([(200, page([{'a': '1'}, {'a': '2'}], total_pages=3), {})])
+
+        with self.client.stream_records(self.client.other_data().debt_to_penny, page_size=2) as stream:
+            records = list(stream)
+
+        self.assertEqual(records, [{'a': '1'}, {'a': '2'}])
+        self.assertEqual(stream.meta['total-pages'], 3)
+
+        self.mount([(404, {'error': 'missing'}, {})])
+
+        with self.assertRaises(requests.HTTPError):
+            self.client.stream_records(self.client.other_data().debt_to_penny)
+
+    def test_type_decoder_follows_data_types(self):
+        """Make sure the records are typed with the `dataTypes` of the page."""
+
+        content = page([
+            {'record_date': '2020-01-31', 'amount': '1,234.50', 'line': '7', 'desc': 'null'},
+            {'record_date': '2020-02-29', 'amount': 'null', 'line': '', 'desc': 'Gold'}
+        ])
+        content['meta']['dataTypes'] = {
+            'record_date': 'DATE', 'amount': 'CURRENCY0', 'line': 'INTEGER', 'desc': 'STRING'
+        }
+
+        self.client.close()
+        self.client = FederalTreasuryClient(
+            memory_cache=MemoryResponseCache(ttl=60),
+            type_decoder=TypeDecoder()
+        )
+        adapter = self.mount([(200, content, {})])
+        record_converters.cache_clear()
+
+        for _ in range(2):
+            records = self.client.other_data().debt_to_penny()['data']
+
+        self.assertEqual(len(adapter.requests), 1)
+        self.assertEqual(records, [
+            {'record_date': date(2020, 1, 31), 'amount': Decimal('1234.50'), 'line': 7, 'desc': None},
+            {'record_date': date(2020, 2, 29), 'amount': None, 'line': None, 'desc': 'Gold'}
+        ])
+
+        TypeDecoder(decimal=False).decode_records(
+            records=[{'amount': '2.5'}],
+            data_types=content['meta']['dataTypes']
+        )
+
+        self.assertEqual(record_converters.cache_info().misses, 2)
+
+    def test_parse_cents_checks_its_range(self):
+        """Make sure amounts are read as exact cents, rounded half to even, within an `int64`."""
+
+        self.assertEqual(parse_cents('31458430741793.28'), 3145843074179328)
+        self.assertEqual(parse_cents('-1.5'), -150)
+        self.assertEqual(parse_cents('7'), 700)
+        self.assertEqual(parse_cents('$1,234.5'), 123450)
+        self.assertEqual(parse_cents('0.125'), 12)
+        self.assertEqual(parse_cents('0.135'), 14)
+        self.assertEqual(parse_cents('12.5', unit=1000000), 1250000000)
+        self.assertEqual(parse_cents('92233720368547758.07'), 2 ** 63 - 1)
+
+        with self.assertRaises(OverflowError):
+            parse_cents('92233720368547758.08')
+
+        with self.assertRaises(OverflowError):
+            parse_cents('92233720368547.76', unit=1000)
+
+    def test_type_decoder_reads_cents_in_the_unit_of_the_endpoint(self):
+        """Make sure the amounts of the Daily Treasury Statement, in millions, are scaled."""
+
+        content = page([{'record_date': '2020-01-31', 'open_today_bal': '412.5'}])
+        content['meta']['dataTypes'] = {'record_date': 'DATE', 'open_today_bal': 'CURRENCY'}
+
+        self.client.close()
+        self.client = FederalTreasuryClient(type_decoder=TypeDecoder(cents=True))
+        self.mount([(200, content, {}), (200, content, {})])
+
+        statements = self.client.daily_treasury_statements().operating_cash_balance()['data']
+        penny = self.client.other_data().debt_to_penny()['data']
+
+        self.assertEqual(statements[0]['open_today_bal'], 41250000000)
+        self.assertEqual(penny[0]['open_today_bal'], 41250)
+
+    def test_auto_page_size_with_type_decoder(self):
+        """Make sure `page_size='auto'` can measure typed records."""
+
+        dataset = [{'record_date': '2020-01-31', 'amount': '{n}.50'.format(n=n)} for n in range(250)]
+
+        def respond(request):
+            query = parse_qs(urlparse(request.url).query)
+            page_number = int(query['page[number]'][0])
+            page_size = int(query['page[size]'][0])
+            body = page(dataset[(page_number - 1) * page_size:page_number * page_size])
+            body['meta']['total-count'] = len(dataset)
+            body['meta']['dataTypes'] = {'record_date': 'DATE', 'amount': 'CURRENCY'}
+            return 200, body, None
+
+        self.client.close()
+        self.client = FederalTreasuryClient(type_decoder=TypeDecoder())
+        adapter = self.mount(respond)
+
+        records = self.client.fetch_all(self.client.other_data().debt_to_penny, page_size='auto')
+
+        self.assertEqual(len(records), 250)
+        self.assertEqual(records[-1], {'record_date': date(2020, 1, 31), 'amount': Decimal('249.50')})
+        self.assertEqual(len(adapter.requests), 2)
+
+    def test_string_interner_shares_values_across_pages(self):
+        """Make sure a client with a `StringInterner` hands back shared strings."""
+
+        self.client.close()
+        self.client = FederalTreasuryClient(string_interner=StringInterner(sample_size=2))
+        self.mount([
+            (200, page([{'country_currency_desc': 'Canada-Dollar'}, {'country_currency_desc': 'Canada-Dollar'}]), None),
+            (200, page([{'country_currency_desc': 'Canada-Dollar'}]), None)
+        ])
+
+        first = self.client.outstanding_debt_instruments().rates_of_exchange()['data']
+        second = self.client.outstanding_debt_instruments().rates_of_exchange(page_number=2)['data']
+
+        self.assertIs(first[0]['country_currency_desc'], first[1]['country_currency_desc'])
+        self.assertIs(first[0]['country_currency_desc'], second[0]['country_currency_desc'])
+
+    def test_rate_limiter_paces_every_attempt(self):
+        """Make sure the services of a client, and their retries, share one token bucket."""
+
+        rate_limiter = RateLimiter(rate=1000, burst=1)
+        rate_limiter.reserve = mock.Mock(wraps=rate_limiter.reserve)
+
+        self.client.close()
+        self.client = FederalTreasuryClient(
+            retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False),
+            rate_limiter=rate_limiter
+        )
+        self.mount([(503, {}, None), (200, page([{'a': 1}]), None), (200, page([{'b': 2}]), None)])
+
+        self.client.other_data().debt_to_penny()
+        self.client.outstanding_debt_instruments().rates_of_exchange()
+
+        self.assertEqual(rate_limiter.reserve.call_count, 3)
+
+    def test_concurrency_limiter_backs_off_on_throttling(self):
+        """Make sure a `429` cuts the cap of the endpoint family and frees every slot."""
+
+        # The fake responses are too fast for their latencies to be compared.
+        concurrency_limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8, latency_tolerance=1e6)
+
+        self.client.close()
+        self.client = FederalTreasuryClient(
+            retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False),
+            concurrency_limiter=concurrency_limiter
+        )
+        self.mount([(429, {}, None), (200, page([{'a': 1}]), None)])
+
+        self.client.other_data().debt_to_penny()
+
+        self.assertEqual(concurrency_limiter.limit(endpoint='/v2/accounting/od/debt_to_penny'), 4)
+        self.assertEqual(concurrency_limiter.in_flight(endpoint='/v2/accounting/od/debt_to_penny'), 0)
+
+    def test_identical_requests_in_flight_share_one_call(self):
+        """Make sure threads asking for the same page at once send one request."""
+
+        release = threading.Event()
+
+        def respond(request):
+            release.wait(timeout=5)
+            return 200, page([{'record_date': '2023-03-31'}]), None
+
+        adapter = self.mount(respond)
+        other_data_service = self.client.other_data()
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(other_data_service.debt_to_penny(sort=['-record_date'], page_size=1))
+            )
+            for _ in range(8)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        deadline = time.monotonic() + 5
+
+        while self.client.treasury_session.request_coalescer.coalesced < 7 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        release.set()
+
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(len(adapter.requests), 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(content is results[0] for content in results))
+
+        other_data_service.debt_to_penny(sort=['-record_date'], page_size=1)
+
+        self.assertEqual(len(adapter.requests), 2)
+
+    def test_hedged_request_takes_the_first_response(self):
+        """Make sure a slow GET is sent again and the faster response is used."""
+
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def respond(request):
+            if len(adapter.requests) == 1:
+                release.wait(timeout=5)
+                return 200, page([{'response': 'slow'}]), None
+            return 200, page([{'response': 'hedge'}]), None
+
+        self.client.close()
+        self.client = FederalTreasuryClient(hedging_policy=HedgingPolicy(max_delay=0.02, budget=1.0))
+        adapter = self.mount(respond)
+
+        content = self.client.other_data().debt_to_penny()
+
+        self.assertEqual(content['data'], [{'response': 'hedge'}])
+        self.assertEqual(len(adapter.requests), 2)
+        self.assertEqual(self.client.treasury_session.hedging_policy.hedges, 1)
+
+    def test_hedge_delay_starts_with_the_attempt(self):
+        """Make sure an attempt queued behind busy hedging threads neither spends a hedge nor inflates the latencies."""
+
+        policy = HedgingPolicy(min_delay=0.001, max_delay=0.05, budget=1.0, min_samples=1)
+
+        self.client.close()
+        self.client = FederalTreasuryClient(pool_maxsize=1, hedging_policy=policy)
+        adapter = self.mount([(200, page([{'n': 1}]), None)])
+
+        self.client.treasury_session.hedging_executor.submit(time.sleep, 0.2)
+        self.client.other_data().debt_to_penny()
+
+        self.assertEqual(len(adapter.requests), 1)
+        self.assertEqual(policy.hedges, 0)
+        self.assertLess(policy.delay_for(endpoint='/v2/accounting/od/debt_to_penny'), 0.1)
+
+    def test_circuit_breaker_fails_fast_while_open(self):
+        """Make sure a failing endpoint family stops being called, and the others are not."""
+
+        self.client.close()
+        self.client = FederalTreasuryClient(
+            retry_policy=RetryPolicy(max_attempts=2, backoff_factor=0, jitter=False),
+            circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        )
+        adapter = self.mount([(503, {}, None)] * 4 + [(200, page([{'n': 1}]), None)])
+        receivables_service = self.client.treasury_reports_on_receivables()
+
+        for _ in range(2):
+            with self.assertRaises(requests.HTTPError):
+                receivables_service.collected_and_outstanding_receivables()
+
+        with self.assertRaises(CircuitOpenError):
+            receivables_service.delinquent_debt()
+
+        self.assertEqual(len(adapter.requests), 4)
+        self.assertEqual(self.client.other_data().debt_to_penny()['data'], [{'n': 1}])
+
+    def test_circuit_breaker_serves_stale_cache_while_open(self):
+        """Make sure an open circuit serves the expired responses of the persistent cache."""
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+
+            cache = SQLiteResponseCache(path=cache_dir + '/cache.sqlite', ttls=[('/v2/debt/tror/', -1)])
+
+            self.client.close()
+            self.client = FederalTreasuryClient(
+                retry_policy=RetryPolicy(max_attempts=1),
+                cache=cache,
+                circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60)
+            )
+            adapter = self.mount([(200, page([{'n': 1}]), None), (500, {}, None)])
+            receivables_service = self.client.treasury_reports_on_receivables()
+
+            fresh = receivables_service.delinquent_debt()
+
+            with self.assertRaises(requests.HTTPError):
+                receivables_service.delinquent_debt()
+
+            self.assertEqual(receivables_service.delinquent_debt(), fresh)
+            self.assertEqual(len(adapter.requests), 2)
+
+            with self.assertRaises(CircuitOpenError):
+                receivables_service.delinquent_debt(page_number=2)
+
+            cache.close()
+
+    def test_fetch_all_as_columns(self):
+        """Make sure `as_columns` builds typed columns across pages."""
+
+        def respond(request):
+
+            page_number = int(parse_qs(urlparse(request.url).query)['page[number]'][0])
+            content = page(
+                [
+                    {'record_date': '2020-01-0{n}'.format(n=page_number), 'amt': '1.5', 'line': '2', 'kind': 'Gold'},
+                    {'record_date': 'null', 'amt': 'null', 'line': str(page_number), 'kind': 'null'}
+                ],
+                page_number=page_number,
+                total_pages=2
+            )
+            content['meta']['dataTypes'] = {'record_date': 'DATE', 'amt': 'CURRENCY', 'line': 'INTEGER', 'kind': 'STRING'}
+
+            return 200, content, {}
+
+        self.mount(respond)
+
+        columns = self.client.fetch_all(self.client.other_data().debt_to_penny, parallel=2, as_columns=True)
+
+        self.assertEqual(list(columns), ['record_date', 'amt', 'line', 'kind'])
+        self.assertEqual(columns['record_date'], array('i', [date(2020, 1, 1).toordinal(), 0, date(2020, 1, 2).toordinal(), 0]))
+        self.assertEqual(columns['amt'][::2], array('d', [1.5, 1.5]))
+        self.assertTrue(math.isnan(columns['amt'][1]))
+        self.assertEqual(columns['line'], array('q', [2, 1, 2, 2]))
+        self.assertEqual(columns['kind'], ['Gold', None, 'Gold', None])
+
+    def tearDown(self) -> None:
+        """Teardown the `FederalTreasuryClient` Client."""
+
+        self.client.close()
+        del self.client
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import json
+import unittest
+
+from unittest import TestCase
+from treasury.session import JSONDecoder
+from treasury.streaming import RecordParser
+from treasury.streaming import RecordStream
+
+
+class RecordParserTest(TestCase):
+
+    """Will perform a unit test for the `RecordParser`."""
+
+    def setUp(self) -> None:
+        """Set up a response body with awkward strings."""
+
+        self.content = {
+            'data': [
+                {'record_date': '2020-01-01', 'note': 'braces { } [ ] and, commas'},
+                {'record_date': '2020-01-02', 'note': 'escaped \\" quote \\\\ and é'},
+                {'record_date': '2020-01-03', 'nested': {'values': [1, 2.5, None, True]}}
+            ],
+            'meta': {'count': 3, 'total-pages': 1},
+            'links': {'next': None}
+        }
+        self.body = json.dumps(self.content, indent=2).encode('utf-8')
+
+    def test_yields_records_across_any_chunk_boundary(self):
+        """Make sure the records survive being split anywhere."""
+
+        for chunk_size in (1, 2, 3, 7, 64, len(self.body)):
+
+            stream = RecordStream(
+                chunks=(self.body[i:i + chunk_size] for i in range(0, len(self.body), chunk_size)),
+                decode=JSONDecoder().decode
+            )
+
+            self.assertEqual(list(stream), self.content['data'])
+            self.assertEqual(stream.meta, self.content['meta'])
+            self.assertEqual(stream.links, self.content['links'])
+
+    def test_records_are_handed_back_as_they_complete(self):
+        """Make sure a record is returned before the rest of the body arrives."""
+
+        parser = RecordParser(decode=json.loads)
+        first_record_end = self.body.index(b'\n    }') + 6
+
+        self.assertEqual(parser.feed(self.body[:first_record_end]), [self.content['data'][0]])
+        self.assertIsNone(parser.content.get('meta'))
+
+    def test_truncated_body_raises(self):
+        """Make sure a body cut off mid-way raises a `ValueError`."""
+
+        stream = RecordStream(chunks=[self.body[:-10]], decode=json.loads)
+
+        with self.assertRaises(ValueError):
+            list(stream)
+
+
+if __name__ == '__main__':
+    unittest.main()
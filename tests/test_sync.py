@@ -0,0 +1,220 @@
+import tempfile
+import unittest
+
+from unittest import TestCase
+from treasury.sync import SyncEngine
+from treasury.typed import TypeDecoder
+from treasury.sync import dataset_name
+from treasury.query import LocalQueryEngine
+from treasury.query import split_parameter
+from treasury.other_data import OtherData
+
+
+class FakeDatasetSession():
+
+    """Answers endpoint requests from an in-memory dataset."""
+
+    def __init__(self, records: list) -> None:
+
+        self.records = records
+        self.requests = []
+
+    def make_request(self, method: str, endpoint: str, params: dict = None, **kwargs) -> dict:
+
+        self.requests.append(params)
+        records = self.records
+
+        for condition in (params.get('filters') or '').split(','):
+
+            if condition.startswith('record_date:gte:'):
+                since = condition.split(':')[2]
+                records = [record for record in records if record['record_date'] >= since]
+
+        page_number = int(params['page[number]'])
+        page_size = int(params['page[size]'])
+
+        return {
+            'data': records[(page_number - 1) * page_size:page_number * page_size],
+            'meta': {
+                'total-count': len(records),
+                'dataTypes': {'record_date': 'DATE', 'amount': 'CURRENCY'}
+            }
+        }
+
+
+class SyncEngineTest(TestCase):
+
+    """Will perform a unit test for the `SyncEngine`."""
+
+    def setUp(self) -> None:
+        """Set up a `SyncEngine` on a temporary database."""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.sync_engine = SyncEngine(path=self.directory.name + '/mirror.sqlite', lookback_days=20)
+
+        self.session = FakeDatasetSession(records=[
+            {'record_date': '2020-01-01', 'amount': '1.00'},
+            {'record_date': '2020-01-15', 'amount': '2.00'},
+            {'record_date': '2020-02-01', 'amount': '3.00'}
+        ])
+        self.service = OtherData(session=self.session)
+
+    def test_first_sync_downloads_full_history(self):
+        """Make sure the first sync stores every record."""
+
+        result = self.sync_engine.sync(self.service.debt_to_penny)
+
+        self.assertEqual(result.dataset, 'other_data__debt_to_penny')
+        self.assertEqual(result.endpoint, '/v2/accounting/od/debt_to_penny')
+        self.assertIsNone(result.since)
+        self.assertEqual((result.rows_fetched, result.rows_added), (3, 3))
+        self.assertEqual(
+            self.sync_engine.dataset_info('other_data__debt_to_penny')['max_record_date'],
+            '2020-02-01'
+        )
+
+    def test_later_syncs_only_fetch_the_window(self):
+        """Make sure later syncs request the look-back window and upsert it."""
+
+        self.sync_engine.sync(self.service.debt_to_penny)
+
+        self.session.records[2] = {'record_date': '2020-02-01', 'amount': '3.50'}
+        self.session.records.append({'record_date': '2020-02-15', 'amount': '4.00'})
+
+        result = self.sync_engine.sync(self.service.debt_to_penny)
+
+        self.assertEqual(result.since, '2020-01-12')
+        self.assertIn('record_date:gte:2020-01-12', self.session.requests[-1]['filters'])
+        self.assertEqual(
+            (result.rows_fetched, result.rows_added, result.rows_updated, result.rows_removed),
+            (3, 1, 1, 0)
+        )
+
+        rows = self.sync_engine.connection.execute(
+            'SELECT record_date, amount FROM other_data__debt_to_penny ORDER BY record_date'
+        ).fetchall()
+
+        self.assertEqual(rows, [
+            ('2020-01-01', '1.00'),
+            ('2020-01-15', '2.00'),
+            ('2020-02-01', '3.50'),
+            ('2020-02-15', '4.00')
+        ])
+
+    def test_refuses_typed_sessions(self):
+        """Make sure records typed by a `TypeDecoder` are not mirrored."""
+
+        self.session.type_decoder = TypeDecoder()
+
+        with self.assertRaises(ValueError):
+            self.sync_engine.sync(self.service.debt_to_penny)
+
+        self.assertEqual(self.session.requests, [])
+
+    def test_dataset_names_are_unique_per_service(self):
+        """Make sure the table name includes the service."""
+
+        self.assertEqual(dataset_name(self.service.gold_reserve), 'other_data__gold_reserve')
+
+    def tearDown(self) -> None:
+        """Teardown the `SyncEngine`."""
+
+        self.sync_engine.close()
+        self.directory.cleanup()
+
+
+class LocalQueryEngineTest(TestCase):
+
+    """Will perform a unit test for the `LocalQueryEngine`."""
+
+    def setUp(self) -> None:
+        """Set up a `LocalQueryEngine` on a synced temporary database."""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.sync_engine = SyncEngine(path=self.directory.name + '/mirror.sqlite')
+
+        session = FakeDatasetSession(records=[
+            {'record_date': '2020-01-0{day}'.format(day=day), 'amount': str(amount), 'kind': kind}
+            for day, amount, kind in [(1, 9.5, 'a'), (2, 10.25, 'b'), (3, 100, 'a'), (4, 2, 'c')]
+        ])
+
+        self.service = OtherData(session=session)
+        self.sync_engine.sync(self.service.debt_to_penny)
+
+        self.local_service = LocalQueryEngine(sync_engine=self.sync_engine).service(self.service)
+
+    def test_filters_compare_numbers_as_numbers(self):
+        """Make sure numeric filters and sorts use the `dataTypes`."""
+
+        content = self.local_service.debt_to_penny(
+            fields=['record_date', 'amount'],
+            filters=['amount:gte:9.5', 'kind:in:(a,b)'],
+            sort=['-amount']
+        )
+
+        self.assertEqual(
+            content['data'],
+            [
+                {'record_date': '2020-01-03', 'amount': '100'},
+                {'record_date': '2020-01-02', 'amount': '10.25'},
+                {'record_date': '2020-01-01', 'amount': '9.5'}
+            ]
+        )
+        self.assertEqual(content['meta']['total-count'], 3)
+
+    def test_null_numbers_are_not_zero(self):
+        """Make sure `'null'` amounts neither match numeric filters nor sort as 0."""
+
+        session = FakeDatasetSession(records=[
+            {'record_date': '2020-02-0{day}'.format(day=day), 'amount': amount, 'kind': 'a'}
+            for day, amount in [(1, '3'), (2, 'null'), (3, ''), (4, '-1')]
+        ])
+        service = OtherData(session=session)
+        self.sync_engine.sync(service.debt_to_penny)
+
+        content = self.local_service.debt_to_penny(
+            fields=['record_date', 'amount'],
+            filters=['amount:lte:0'],
+            sort=['amount']
+        )
+
+        self.assertEqual(content['data'], [{'record_date': '2020-02-04', 'amount': '-1'}])
+
+    def test_pages_like_the_api(self):
+        """Make sure `page_number` and `page_size` page the records."""
+
+        content = self.local_service.debt_to_penny(page_number=2, page_size=3)
+
+        self.assertEqual([record['record_date'] for record in content['data']], ['2020-01-04'])
+        self.assertEqual(content['meta']['total-pages'], 2)
+        self.assertIsNone(content['links']['next'])
+
+    def test_rejects_unknown_fields(self):
+        """Make sure unknown fields and operators raise a `ValueError`."""
+
+        with self.assertRaises(ValueError):
+            self.local_service.debt_to_penny(filters=['missing:eq:1'])
+
+        with self.assertRaises(ValueError):
+            self.local_service.debt_to_penny(filters=['amount:like:1'])
+
+        with self.assertRaises(LookupError):
+            self.local_service.gold_reserve()
+
+    def test_split_parameter_keeps_in_lists(self):
+        """Make sure commas inside parentheses are not split."""
+
+        self.assertEqual(
+            split_parameter('a:in:(1,2),b:eq:3'),
+            ['a:in:(1,2)', 'b:eq:3']
+        )
+
+    def tearDown(self) -> None:
+        """Teardown the `SyncEngine`."""
+
+        self.sync_engine.close()
+        self.directory.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
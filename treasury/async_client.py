@@ -0,0 +1,401 @@
+from typing import Dict
+from typing import List
+from typing import Union
+from typing import Callable
+from typing import AsyncIterator
+from typing import TYPE_CHECKING
+
+from treasury.client import FederalTreasuryClient
+from treasury.cache import MemoryResponseCache
+from treasury.cache import SQLiteResponseCache
+from treasury.session import JSONDecoder
+from treasury.session import RetryPolicy
+from treasury.typed import TypeDecoder
+from treasury.circuit import CircuitBreaker
+from treasury.hedging import HedgingPolicy
+from treasury.coalescing import RequestCoalescer
+from treasury.concurrency import AdaptiveConcurrencyLimiter
+from treasury.rate_limit import RateLimiter
+from treasury.interning import StringInterner
+from treasury.columns import Column
+from treasury.columns import ColumnBuilder
+from treasury.frames import to_arrow
+from treasury.frames import to_dataframe
+from treasury.pagination import Paginator
+from treasury.pagination import resolve_request
+from treasury.streaming import AsyncRecordStream
+from treasury.async_session import AsyncFederalTreasurySession
+
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
+
+class AsyncFederalTreasuryClient(FederalTreasuryClient):
+
+    """
+    Overview:
+    ----
+    The asyncio version of the `FederalTreasuryClient`. It exposes the
+    same services, with the same endpoint methods and signatures, but
+    every endpoint method returns an awaitable instead of the content.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keep_alive: bool = True,
+        retry_policy: RetryPolicy = None,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        cache: SQLiteResponseCache = None,
+        memory_cache: MemoryResponseCache = None,
+        decoder: JSONDecoder = None,
+        type_decoder: TypeDecoder = None,
+        string_interner: StringInterner = None,
+        rate_limiter: RateLimiter = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter = None,
+        request_coalescer: RequestCoalescer = None,
+        hedging_policy: HedgingPolicy = None,
+        circuit_breaker: CircuitBreaker = None
+    ) -> None:
+        """Initializes the `AsyncFederalTreasuryClient`.
+
+        ### Parameters
+        ----
+        max_connections : int (optional, Default=100)
+            The maximum number of concurrent connections.
+
+        max_keepalive_connections : int (optional, Default=20)
+            The number of idle connections kept alive in the pool.
+
+        keep_alive : bool (optional, Default=True)
+            If `True`, connections are reused between requests.
+
+        retry_policy : RetryPolicy (optional, Default=None)
+            How transient failures (timeouts, 429 and 5xx) are retried,
+            defaults to `RetryPolicy()`.
+
+        connect_timeout : float (optional, Default=5.0)
+            The number of seconds to wait while connecting.
+
+        read_timeout : float (optional, Default=30.0)
+            The number of seconds to wait for the server to respond.
+
+        cache : SQLiteResponseCache (optional, Default=None)
+            A persistent response cache shared by every service, GET
+            requests are answered from it while fresh.
+
+        memory_cache : MemoryResponseCache (optional, Default=None)
+            An in-process LRU cache of decoded responses, checked before
+            `cache`. The responses it returns are shared, treat them as
+            read-only.
+
+        decoder : JSONDecoder (optional, Default=None)
+            The decoder of the response bodies, defaults to `orjson` or
+            `msgspec` when installed, and the standard library otherwise.
+
+        type_decoder : TypeDecoder (optional, Default=None)
+            If set, the records are returned with `date`, `int`, `Decimal`
+            and `None` values instead of strings, converted using the
+            `meta['dataTypes']` of each page.
+
+        string_interner : StringInterner (optional, Default=None)
+            If set, the values of the low cardinality string fields of
+            each endpoint, detected on its first records, share one object
+            instead of a copy per record.
+
+        rate_limiter : RateLimiter (optional, Default=None)
+            A token bucket pacing the requests of every service, which
+            may be shared with other clients, see `FileRateLimiter`.
+
+        concurrency_limiter : AdaptiveConcurrencyLimiter (optional, Default=None)
+            Caps the requests in flight to each endpoint family, raising the
+            cap while latency holds and cutting it on `429`, `5xx` or spikes.
+
+        request_coalescer : RequestCoalescer (optional, Default=None)
+            Lets identical GET requests in flight, across threads or tasks,
+            share one call to the API, defaults to one per client.
+
+        hedging_policy : HedgingPolicy (optional, Default=None)
+            Sends a GET request a second time when it is slower than most,
+            using the first response, to cut the tail latency.
+
+        circuit_breaker : CircuitBreaker (optional, Default=None)
+            Makes the requests to an endpoint family that keeps failing fail
+            fast, or served stale from `cache`, until a probe succeeds.
+
+        ### Usage
+        ----
+            >>> async with AsyncFederalTreasuryClient() as treasury_client:
+                    other_data_service = treasury_client.other_data()
+                    debt = await other_data_service.debt_to_penny()
+        """
+
+        self.treasury_session = AsyncFederalTreasurySession(
+            client=self,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keep_alive=keep_alive,
+            retry_policy=retry_policy,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            cache=cache,
+            memory_cache=memory_cache,
+            decoder=decoder,
+            type_decoder=type_decoder,
+            string_interner=string_interner,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            request_coalescer=request_coalescer,
+            hedging_policy=hedging_policy,
+            circuit_breaker=circuit_breaker
+        )
+
+    def __repr__(self) -> str:
+        """String representation of the `AsyncFederalTreasuryClient` object."""
+
+        return '<AsyncFederalTreasuryClient (active=True, connected=True)>'
+
+    def __enter__(self) -> None:
+        """The async client must be used with `async with`."""
+
+        raise TypeError(
+            'Use `async with AsyncFederalTreasuryClient()` instead of `with`.'
+        )
+
+    async def __aenter__(self) -> 'AsyncFederalTreasuryClient':
+        """Enters the client context, returning the client itself."""
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Exits the client context, closing the connection pool."""
+
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the client and releases all pooled connections.
+
+        ### Usage
+        ----
+            >>> treasury_client = AsyncFederalTreasuryClient()
+            >>> await treasury_client.close()
+        """
+
+        await self.treasury_session.close()
+
+    def iter_records(self, method: Callable, **kwargs) -> AsyncIterator[dict]:
+        """Lazily yields every record of an endpoint, across all pages.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of one of the services.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        AsyncIterator[dict]:
+            The records, requested one page at a time as they are consumed.
+
+        ### Usage
+        ----
+            >>> other_data_service = treasury_client.other_data()
+            >>> async for record in treasury_client.iter_records(other_data_service.debt_to_penny):
+                    print(record['record_date'])
+        """
+
+        return Paginator(session=self.treasury_session).aiter_records(method, **kwargs)
+
+    async def stream_records(self, method: Callable, wire_format: str = 'json', **kwargs) -> AsyncRecordStream:
+        """Streams the records of one page as the body arrives.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of one of the services.
+
+        wire_format : str (optional, Default='json')
+            Either `'json'` or `'csv'`, a CSV page is smaller on the wire,
+            but its values are the strings of the API and it has no `meta`.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        AsyncRecordStream:
+            The records of the page, read as they are consumed.
+
+        ### Usage
+        ----
+            >>> other_data_service = treasury_client.other_data()
+            >>> async with await treasury_client.stream_records(other_data_service.debt_to_penny) as stream:
+                    async for record in stream:
+                        print(record['record_date'])
+        """
+
+        request = resolve_request(method, **kwargs)
+        request.params['format'] = wire_format
+
+        return await self.treasury_session.make_request(
+            method=request.method,
+            endpoint=request.endpoint,
+            params=request.params,
+            stream=True
+        )
+
+    async def fetch_all(
+        self,
+        method: Callable,
+        parallel: int = 1,
+        progress: Callable[[int, int], None] = None,
+        as_columns: bool = False,
+        as_tuples: bool = False,
+        wire_format: str = 'json',
+        **kwargs
+    ) -> Union[List[dict], List[tuple], Dict[str, Column]]:
+        """Grabs every record of an endpoint, across all pages.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of one of the services.
+
+        parallel : int (optional, Default=1)
+            The maximum number of pages requested at the same time, once
+            the first page has told how many pages there are.
+
+        progress : Callable[[int, int], None] (optional, Default=None)
+            Called with `(pages_done, total_pages)` each time a page arrives.
+
+        as_columns : bool (optional, Default=False)
+            If `True`, returns one compact column per field instead of
+            the records: `array('d')` for numbers, `array('q')` for whole
+            numbers, `array('i')` of ordinals for dates and lists of
+            interned strings, see `ColumnBuilder`.
+
+        as_tuples : bool (optional, Default=False)
+            If `True`, returns the records as instances of a `namedtuple`
+            type generated once per endpoint, read as `record.record_date`,
+            which takes a fraction of the memory of a `dict`, see `record_type`.
+
+        wire_format : str (optional, Default='json')
+            Either `'json'` or `'csv'`, whose pages are smaller on the
+            wire but are requested one at a time, see `Paginator.iter_csv_pages`.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        Union[List[dict], List[tuple], Dict[str, Column]]:
+            The records of every page, or their columns.
+
+        ### Usage
+        ----
+            >>> other_data_service = treasury_client.other_data()
+            >>> records = await treasury_client.fetch_all(other_data_service.gold_reserve)
+        """
+
+        return await Paginator(session=self.treasury_session).afetch_all(
+            method,
+            parallel=parallel,
+            progress=progress,
+            as_columns=as_columns,
+            as_tuples=as_tuples,
+            wire_format=wire_format,
+            **kwargs
+        )
+
+    async def fetch_dataframe(
+        self,
+        method: Callable,
+        parallel: int = 1,
+        progress: Callable[[int, int], None] = None,
+        **kwargs
+    ) -> 'pandas.DataFrame':
+        """Grabs every record of an endpoint into a `pandas.DataFrame`.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of one of the services.
+
+        parallel : int (optional, Default=1)
+            The maximum number of pages requested at the same time.
+
+        progress : Callable[[int, int], None] (optional, Default=None)
+            Called with `(pages_done, total_pages)` each time a page arrives.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        pandas.DataFrame:
+            One row per record.
+
+        ### Usage
+        ----
+            >>> other_data_service = treasury_client.other_data()
+            >>> debt_frame = await treasury_client.fetch_dataframe(other_data_service.debt_to_penny)
+        """
+
+        return to_dataframe(
+            source=await Paginator(session=self.treasury_session).acollect(
+                method,
+                collector=ColumnBuilder(),
+                parallel=parallel,
+                progress=progress,
+                **kwargs
+            )
+        )
+
+    async def fetch_arrow(
+        self,
+        method: Callable,
+        parallel: int = 1,
+        progress: Callable[[int, int], None] = None,
+        **kwargs
+    ) -> 'pyarrow.Table':
+        """Grabs every record of an endpoint into a `pyarrow.Table`.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of one of the services.
+
+        parallel : int (optional, Default=1)
+            The maximum number of pages requested at the same time.
+
+        progress : Callable[[int, int], None] (optional, Default=None)
+            Called with `(pages_done, total_pages)` each time a page arrives.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        pyarrow.Table:
+            One row per record.
+
+        ### Usage
+        ----
+            >>> other_data_service = treasury_client.other_data()
+            >>> debt_table = await treasury_client.fetch_arrow(other_data_service.debt_to_penny)
+        """
+
+        return to_arrow(
+            source=await Paginator(session=self.treasury_session).acollect(
+                method,
+                collector=ColumnBuilder(),
+                parallel=parallel,
+                progress=progress,
+                **kwargs
+            )
+        )
@@ -0,0 +1,580 @@
+import time
+import asyncio
+import logging
+
+from typing import Dict
+from typing import Union
+from typing import Tuple
+from typing import Awaitable
+from treasury.session import JSONDecoder
+from treasury.session import RetryPolicy
+from treasury.session import FederalTreasurySession
+from treasury.cache import canonical_key
+from treasury.typed import TypeDecoder
+from treasury.circuit import CircuitBreaker
+from treasury.circuit import CircuitOpenError
+from treasury.hedging import HedgingPolicy
+from treasury.coalescing import RequestCoalescer
+from treasury.concurrency import AdaptiveConcurrencyLimiter
+from treasury.rate_limit import RateLimiter
+from treasury.interning import StringInterner
+from treasury.streaming import AsyncRecordStream
+from treasury.streaming import STREAM_CHUNK_SIZE
+from treasury.csv_stream import CSV_FORMAT
+from treasury.csv_stream import AsyncCSVRecordStream
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class AsyncFederalTreasurySession(FederalTreasurySession):
+
+    """
+    Overview:
+    ----
+    The asyncio counterpart of the `TreasurySession`. It shares the URL
+    building, parameter cleaning, retry policy and response handling
+    of the `TreasurySession`, but sends requests through a pooled
+    `httpx.AsyncClient`, so `make_request` returns an awaitable.
+    """
+
+    def __init__(
+        self,
+        client: object,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keep_alive: bool = True,
+        retry_policy: RetryPolicy = None,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        cache: object = None,
+        memory_cache: object = None,
+        decoder: JSONDecoder = None,
+        type_decoder: TypeDecoder = None,
+        string_interner: StringInterner = None,
+        rate_limiter: RateLimiter = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter = None,
+        request_coalescer: RequestCoalescer = None,
+        hedging_policy: HedgingPolicy = None,
+        circuit_breaker: CircuitBreaker = None
+    ) -> None:
+        """Initializes the `AsyncTreasurySession` client.
+
+        ### Parameters:
+        ----
+        client (object): The `treasury.AsyncFederalTreasuryClient` Python Client.
+
+        max_connections (int, optional, Default=100): The maximum number of
+            concurrent connections, requests past this limit wait for a
+            free connection.
+
+        max_keepalive_connections (int, optional, Default=20): The number
+            of idle connections kept alive in the pool.
+
+        keep_alive (bool, optional, Default=True): If `True`, connections
+            are kept alive and returned to the pool after each request.
+
+        retry_policy (RetryPolicy, optional, Default=None): The policy used
+            to retry transient failures, defaults to `RetryPolicy()`.
+
+        connect_timeout (float, optional, Default=5.0): The number of seconds
+            to wait while establishing a connection.
+
+        read_timeout (float, optional, Default=30.0): The number of seconds
+            to wait for the server to send data.
+
+        cache (SQLiteResponseCache, optional, Default=None): A persistent
+            cache consulted before every GET request.
+
+        memory_cache (MemoryResponseCache, optional, Default=None): An
+            in-process cache of decoded responses, consulted before `cache`.
+
+        decoder (JSONDecoder, optional, Default=None): The decoder of the
+            response bodies, defaults to the fastest backend installed.
+
+        type_decoder (TypeDecoder, optional, Default=None): If set, the
+            string values of the records are converted to Python values
+            using the `meta['dataTypes']` of each page.
+
+        string_interner (StringInterner, optional, Default=None): If set,
+            the repeated strings of the records of each endpoint share one
+            object.
+
+        rate_limiter (RateLimiter, optional, Default=None): If set, every
+            request, retries included, waits for a token of this bucket.
+
+        concurrency_limiter (AdaptiveConcurrencyLimiter, optional, Default=None):
+            If set, caps the requests in flight to each endpoint family,
+            the cap tuned to the latency and errors of the family.
+
+        request_coalescer (RequestCoalescer, optional, Default=None): Lets
+            identical GET requests in flight share one call to the API,
+            defaults to a `RequestCoalescer()` of the session.
+
+        hedging_policy (HedgingPolicy, optional, Default=None): If set, a
+            GET request slower than the policy's percentile is sent again,
+            and the first response is used.
+
+        circuit_breaker (CircuitBreaker, optional, Default=None): If set,
+            the requests to an endpoint family that keeps failing fail fast,
+            or are served stale from `cache`, until it recovers.
+
+        ### Usage:
+        ----
+            >>> treasury_client = AsyncFederalTreasuryClient()
+            >>> treasury_session = treasury_client.treasury_session
+        """
+
+        if httpx is None:
+            raise ImportError(
+                'The async client requires `httpx`, install it with '
+                '`pip install us-federal-treasury-python-api[async]`.'
+            )
+
+        super().__init__(
+            client=client,
+            pool_maxsize=max_connections,
+            keep_alive=keep_alive,
+            retry_policy=retry_policy,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            cache=cache,
+            memory_cache=memory_cache,
+            decoder=decoder,
+            type_decoder=type_decoder,
+            string_interner=string_interner,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            request_coalescer=request_coalescer,
+            hedging_policy=hedging_policy,
+            circuit_breaker=circuit_breaker
+        )
+
+        self.max_keepalive_connections = max_keepalive_connections
+
+    def __repr__(self) -> str:
+        """String representation of the `AsyncTreasurySession` object."""
+
+        # define the string representation
+        str_representation = '<FederalTreasuryClient.AsyncTreasurySession (active=True, connected=True)>'
+
+        return str_representation
+
+    def _build_http_session(self) -> 'httpx.AsyncClient':
+        """Builds a new `httpx.AsyncClient` with a pooled transport.
+
+        ### Returns:
+        ----
+        httpx.AsyncClient:
+            A new client ready to send requests.
+        """
+
+        limits = httpx.Limits(
+            max_connections=self.pool_maxsize,
+            max_keepalive_connections=self.max_keepalive_connections if self.keep_alive else 0
+        )
+
+        http_session = httpx.AsyncClient(
+            limits=limits,
+            timeout=httpx.Timeout(self.timeout[1], connect=self.timeout[0]),
+            verify=True
+        )
+
+        return http_session
+
+    async def close(self) -> None:
+        """Closes the pooled client and releases all of its connections."""
+
+        with self._http_session_lock:
+            http_session, self._http_session = self._http_session, None
+
+        if http_session is not None:
+            await http_session.aclose()
+
+    async def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict = None,
+        data: dict = None,
+        json_payload: dict = None,
+        stream: bool = False
+    ) -> Union[Dict, AsyncRecordStream]:
+        """Handles all the requests in the library, asynchronously.
+
+        ### Parameters:
+        ----
+        method : str
+            The Request method, can be one of the
+            following: ['get','post','put','delete','patch']
+
+        endpoint : str
+            The API URL endpoint.
+
+        params : dict (optional, Default=None)
+            The URL params for the request.
+
+        data : dict (optional, Default=None)
+            A data payload for a request.
+
+        json_payload : dict (optional, Default=None)
+            A json data payload for a request
+
+        stream : bool (optional, Default=False)
+            If `True`, the body is parsed as it arrives and an
+            `AsyncRecordStream` over the records is returned instead
+            of the whole page, or an `AsyncCSVRecordStream` if the
+            `format` param is `'csv'`. Streamed requests skip the caches.
+
+        ### Returns:
+        ----
+            A Dictionary object containing the JSON values, or an
+            `AsyncRecordStream` if `stream` is `True`.
+        """
+
+        # Build the URL.
+        url = self.build_url(endpoint=endpoint)
+
+        logging.info(
+            "URL: {url}".format(url=url)
+        )
+
+        params = self.prepare_params(params=params)
+
+        if stream:
+
+            response = await self.send_with_retries(
+                method=method,
+                url=url,
+                params=params,
+                data=data,
+                json_payload=json_payload,
+                stream=True,
+                endpoint=endpoint
+            )
+
+            # Errors are read whole and raised as usual.
+            if response.status_code >= 400:
+                await response.aread()
+                await response.aclose()
+                self.process_response(response=response)
+
+            if params.get('format') == CSV_FORMAT:
+                return AsyncCSVRecordStream(
+                    chunks=response.aiter_bytes(chunk_size=STREAM_CHUNK_SIZE),
+                    response=response
+                )
+
+            return AsyncRecordStream(
+                chunks=response.aiter_bytes(chunk_size=STREAM_CHUNK_SIZE),
+                decode=self.decoder.decode,
+                response=response
+            )
+
+        # Serve the request from the caches, if we can.
+        cached_content = self.cache_lookup(method=method, endpoint=endpoint, params=params)
+
+        if cached_content is not None:
+            return cached_content
+
+        def fetch() -> Awaitable[Dict]:
+            return self.fetch_content(
+                method=method,
+                url=url,
+                endpoint=endpoint,
+                params=params,
+                data=data,
+                json_payload=json_payload
+            )
+
+        # Identical GET requests in flight share one call.
+        if method.upper() == 'GET':
+            return await self.request_coalescer.ado(key=canonical_key(endpoint=endpoint, params=params), function=fetch)
+
+        return await fetch()
+
+    async def fetch_content(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        params: dict = None,
+        data: dict = None,
+        json_payload: dict = None
+    ) -> Dict:
+        """Sends a request, then decodes and caches its content.
+
+        ### Parameters:
+        ----
+        method : str
+            The Request method.
+
+        url : str
+            The full URL of the request.
+
+        endpoint : str
+            The API URL endpoint.
+
+        params : dict (optional, Default=None)
+            The cleaned URL params for the request.
+
+        data : dict (optional, Default=None)
+            A data payload for a request.
+
+        json_payload : dict (optional, Default=None)
+            A json data payload for a request.
+
+        ### Returns:
+        ----
+        Dict:
+            A Dictionary object containing the JSON values.
+        """
+
+        try:
+
+            if self.hedging_policy is not None and method.upper() == 'GET':
+                response = await self.send_hedged(method=method, url=url, params=params, endpoint=endpoint)
+            else:
+                # Send the request, retrying any transient failures.
+                response = await self.send_with_retries(
+                    method=method,
+                    url=url,
+                    params=params,
+                    data=data,
+                    json_payload=json_payload,
+                    endpoint=endpoint
+                )
+
+        except CircuitOpenError:
+
+            content = self.stale_content(method=method, endpoint=endpoint, params=params)
+
+            if content is None:
+                raise
+
+            return content
+
+        content = self.process_response(response=response, endpoint=endpoint)
+
+        self.cache_store(method=method, endpoint=endpoint, params=params, response=response, content=content)
+
+        return content
+
+    async def send_hedged(self, method: str, url: str, endpoint: str, params: dict = None) -> 'httpx.Response':
+        """Sends a GET request, and sends it again if it is slower than the `HedgingPolicy` allows.
+
+        ### Overview:
+        ---
+        Both requests run as tasks, each with its retries, and the first
+        successful response is returned, the other task being cancelled.
+
+        ### Parameters:
+        ----
+        method : str
+            The Request method.
+
+        url : str
+            The full URL of the request.
+
+        endpoint : str
+            The API URL endpoint, whose latencies set the delay.
+
+        params : dict (optional, Default=None)
+            The URL params for the request.
+
+        ### Returns:
+        ----
+        httpx.Response:
+            The first response received from the API.
+        """
+
+        policy = self.hedging_policy
+
+        async def attempt() -> Tuple['httpx.Response', float]:
+            sent_at = time.monotonic()
+            response = await self.send_with_retries(method=method, url=url, params=params, endpoint=endpoint)
+            return response, time.monotonic() - sent_at
+
+        def send() -> asyncio.Task:
+            return asyncio.ensure_future(attempt())
+
+        pending = {send()}
+        error = None
+
+        try:
+
+            done, pending = await asyncio.wait(pending, timeout=policy.delay_for(endpoint=endpoint))
+
+            if not done and policy.try_hedge():
+                logging.info('HEDGE: {url}'.format(url=url))
+                pending.add(send())
+
+            while True:
+
+                for task in done:
+
+                    if task.exception() is None:
+                        response, latency = task.result()
+                        policy.record(endpoint=endpoint, latency=latency)
+                        return response
+
+                    error = error or task.exception()
+
+                if not pending:
+                    raise error
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+        finally:
+
+            # The loser, or both requests if the caller was cancelled.
+            for task in pending:
+                task.cancel()
+
+    async def send_with_retries(
+        self,
+        method: str,
+        url: str,
+        params: dict = None,
+        data: dict = None,
+        json_payload: dict = None,
+        stream: bool = False,
+        endpoint: str = None
+    ) -> 'httpx.Response':
+        """Sends a request, retrying it according to the `RetryPolicy`.
+
+        ### Parameters:
+        ----
+        method : str
+            The Request method.
+
+        url : str
+            The full URL of the request.
+
+        params : dict (optional, Default=None)
+            The URL params for the request.
+
+        data : dict (optional, Default=None)
+            A data payload for a request.
+
+        json_payload : dict (optional, Default=None)
+            A json data payload for a request.
+
+        stream : bool (optional, Default=False)
+            If `True`, the body is left on the socket to be read in chunks.
+
+        endpoint : str (optional, Default=None)
+            The API URL endpoint, whose family the `concurrency_limiter`
+            caps, if any.
+
+        ### Returns:
+        ----
+        httpx.Response:
+            The final response received from the API.
+        """
+
+        breaker = self.circuit_breaker if endpoint is not None else None
+        probe = breaker.check(endpoint=endpoint) if breaker is not None else False
+
+        try:
+
+            attempt = 0
+
+            while True:
+
+                attempt += 1
+
+                if self.rate_limiter is not None:
+                    delay = self.rate_limiter.reserve()
+
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                request = self.http_session.build_request(
+                    method=method.upper(),
+                    url=url,
+                    params=params,
+                    data=data,
+                    json=json_payload
+                )
+
+                limited = self.concurrency_limiter is not None and endpoint is not None
+
+                if limited:
+                    await self.concurrency_limiter.aacquire(endpoint=endpoint)
+
+                started = time.monotonic()
+
+                # Left `None` if the attempt is cancelled, or fails on our side.
+                overloaded = None
+
+                try:
+                    response: httpx.Response = await self.http_session.send(request, stream=stream)
+                    overloaded = response.status_code == 429 or response.status_code >= 500
+                except httpx.TransportError as error:
+
+                    overloaded = True
+
+                    if not self.retry_policy.is_retryable(method=method, attempt=attempt, error=error):
+
+                        if breaker is not None:
+                            breaker.record_failure(endpoint=endpoint)
+
+                        raise
+
+                    delay = self.retry_policy.compute_delay(attempt=attempt)
+                    reason = repr(error)
+
+                else:
+
+                    if not self.retry_policy.is_retryable(
+                        method=method,
+                        attempt=attempt,
+                        status_code=response.status_code
+                    ):
+
+                        if breaker is not None:
+                            breaker.record_response(endpoint=endpoint, status_code=response.status_code)
+
+                        return response
+
+                    delay = self.retry_policy.compute_delay(
+                        attempt=attempt,
+                        retry_after=response.headers.get('Retry-After')
+                    )
+                    reason = 'status code {code}'.format(code=response.status_code)
+
+                    # Release the connection back to the pool before waiting.
+                    await response.aclose()
+
+                finally:
+
+                    if limited and overloaded is None:
+                        self.concurrency_limiter.abandon(endpoint=endpoint)
+                    elif limited:
+                        self.concurrency_limiter.release(
+                            endpoint=endpoint,
+                            latency=time.monotonic() - started,
+                            overloaded=overloaded
+                        )
+
+                logging.warning(
+                    'RETRY: attempt {attempt} for {url} failed with {reason}, retrying in {delay:.2f}s'.format(
+                        attempt=attempt,
+                        url=url,
+                        reason=reason,
+                        delay=delay
+                    )
+                )
+
+                await asyncio.sleep(delay)
+
+        except BaseException:
+
+            # A probe cancelled, or failing on our side, did not test the API.
+            if probe:
+                breaker.abandon(endpoint=endpoint)
+
+            raise
@@ -0,0 +1,542 @@
+import json
+import time
+import sqlite3
+import pathlib
+import threading
+
+from typing import Any
+from typing import List
+from typing import Tuple
+from typing import Union
+from typing import NamedTuple
+from collections import OrderedDict
+
+# How long responses stay fresh, in seconds, by publication cadence.
+# The values are deliberately much shorter than the cadences: a dataset
+# is published on a business day we don't know in advance, so a daily
+# dataset is re-checked every 4 hours, a monthly one every day, and a
+# dataset that no longer changes every 30 days.
+ONE_HOUR = 60 * 60
+DAILY_DATASET_TTL = 4 * ONE_HOUR
+MONTHLY_DATASET_TTL = 24 * ONE_HOUR
+STATIC_DATASET_TTL = 30 * 24 * ONE_HOUR
+
+# How long a response stays fresh, by endpoint prefix. The longest
+# matching prefix wins.
+DATASET_TTLS: List[Tuple[str, int]] = [
+    ('/v1/accounting/dts/', DAILY_DATASET_TTL),
+    ('/v1/accounting/mts/', MONTHLY_DATASET_TTL),
+    ('/v1/debt/mspd/', MONTHLY_DATASET_TTL),
+    ('/v1/debt/top/', MONTHLY_DATASET_TTL),
+    ('/v1/accounting/od/', MONTHLY_DATASET_TTL),
+    ('/v2/accounting/od/', MONTHLY_DATASET_TTL),
+    ('/v2/accounting/od/debt_to_penny', DAILY_DATASET_TTL),
+    ('/v2/accounting/od/gold_reserve', STATIC_DATASET_TTL),
+    ('/v2/accounting/od/debt_outstanding', STATIC_DATASET_TTL),
+    ('/v2/debt/tror', MONTHLY_DATASET_TTL),
+    ('/v2/revenue/rcm', DAILY_DATASET_TTL),
+    ('/v2/payments/jfics/', MONTHLY_DATASET_TTL)
+]
+
+
+def canonical_key(endpoint: str, params: dict = None) -> str:
+    """Builds a canonical cache key for a request.
+
+    ### Overview
+    ----
+    Two requests for the same endpoint with the same params, in any
+    order, and with any `None` params, share the same key.
+
+    ### Parameters
+    ----
+    endpoint : str
+        The API URL endpoint.
+
+    params : dict (optional, Default=None)
+        The URL params for the request.
+
+    ### Returns
+    ----
+    str:
+        The canonical key.
+    """
+
+    params = sorted(
+        (str(key), str(value)) for key, value in (params or {}).items() if value is not None
+    )
+
+    return json.dumps([endpoint, params], separators=(',', ':'))
+
+
+class ResponseCache():
+
+    """
+    Overview:
+    ----
+    The base of the response caches, it maps every endpoint to the TTL
+    of its dataset.
+    """
+
+    def __init__(self, ttls: List[Tuple[str, int]] = None, default_ttl: int = ONE_HOUR) -> None:
+        """Initializes the `ResponseCache` object.
+
+        ### Parameters
+        ----
+        ttls : List[Tuple[str, int]] (optional, Default=None)
+            Extra `(endpoint_prefix, seconds)` pairs overriding `DATASET_TTLS`.
+
+        default_ttl : int (optional, Default=3600)
+            The TTL, in seconds, of endpoints matching no prefix.
+        """
+
+        self.default_ttl = default_ttl
+        self.ttls = sorted(
+            DATASET_TTLS + list(ttls or []),
+            key=lambda prefix_ttl: len(prefix_ttl[0]),
+            reverse=True
+        )
+
+    def ttl_for(self, endpoint: str) -> int:
+        """Returns the TTL, in seconds, of an endpoint.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        ### Returns
+        ----
+        int:
+            The number of seconds a response stays fresh.
+        """
+
+        for prefix, ttl in self.ttls:
+            if endpoint.startswith(prefix):
+                return ttl
+
+        return self.default_ttl
+
+
+class SQLiteResponseCache(ResponseCache):
+
+    """
+    Overview:
+    ----
+    A persistent response cache stored in a SQLite database. Responses
+    are stored as the raw JSON bytes returned by the API, keyed on the
+    canonical (endpoint, params) of the request, and expire after a TTL
+    that follows the publication cadence of each dataset. The database
+    runs in WAL mode so several processes can share one cache file.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, pathlib.Path] = 'cache/treasury_cache.sqlite',
+        ttls: List[Tuple[str, int]] = None,
+        default_ttl: int = ONE_HOUR,
+        busy_timeout: float = 30.0
+    ) -> None:
+        """Initializes the `SQLiteResponseCache` object.
+
+        ### Parameters
+        ----
+        path : Union[str, pathlib.Path] (optional, Default='cache/treasury_cache.sqlite')
+            The path of the SQLite database, created if needed.
+
+        ttls : List[Tuple[str, int]] (optional, Default=None)
+            Extra `(endpoint_prefix, seconds)` pairs overriding `DATASET_TTLS`.
+
+        default_ttl : int (optional, Default=3600)
+            The TTL, in seconds, of endpoints matching no prefix.
+
+        busy_timeout : float (optional, Default=30.0)
+            The number of seconds to wait on a database locked by
+            another process.
+
+        ### Usage
+        ----
+            >>> cache = SQLiteResponseCache(path='cache/treasury.sqlite')
+            >>> treasury_client = FederalTreasuryClient(cache=cache)
+        """
+
+        super().__init__(ttls=ttls, default_ttl=default_ttl)
+
+        self.path = pathlib.Path(path)
+        self.busy_timeout = busy_timeout
+
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                body BLOB NOT NULL,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self.connection.execute(
+            'CREATE INDEX IF NOT EXISTS responses_endpoint ON responses (endpoint)'
+        )
+        self.connection.commit()
+
+    def __repr__(self) -> str:
+        """String representation of the `SQLiteResponseCache` object."""
+
+        str_representation = '<FederalTreasuryClient.SQLiteResponseCache (path={path})>'.format(
+            path=self.path
+        )
+
+        return str_representation
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The SQLite connection of the current thread."""
+
+        connection = getattr(self._local, 'connection', None)
+
+        if connection is None:
+
+            connection = sqlite3.connect(
+                str(self.path),
+                timeout=self.busy_timeout,
+                check_same_thread=False
+            )
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+
+            self._local.connection = connection
+
+            with self._connections_lock:
+                self._connections.append(connection)
+
+        return connection
+
+    def get(self, endpoint: str, params: dict = None, allow_stale: bool = False) -> Union[bytes, None]:
+        """Looks up a cached response.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        params : dict (optional, Default=None)
+            The URL params for the request.
+
+        allow_stale : bool (optional, Default=False)
+            If `True`, expired responses are returned too.
+
+        ### Returns
+        ----
+        Union[bytes, None]:
+            The raw response body, or `None` on a miss.
+        """
+
+        row = self.connection.execute(
+            'SELECT body, expires_at FROM responses WHERE key = ?',
+            (canonical_key(endpoint=endpoint, params=params),)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        if not allow_stale and row[1] < time.time():
+            return None
+
+        return bytes(row[0])
+
+    def set(self, endpoint: str, params: dict, body: bytes, ttl: int = None) -> None:
+        """Stores a response.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        params : dict
+            The URL params for the request.
+
+        body : bytes
+            The raw response body.
+
+        ttl : int (optional, Default=None)
+            The number of seconds the response stays fresh, defaults
+            to the TTL of the endpoint.
+        """
+
+        now = time.time()
+
+        if ttl is None:
+            ttl = self.ttl_for(endpoint=endpoint)
+
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO responses (key, endpoint, body, stored_at, expires_at) VALUES (?, ?, ?, ?, ?)',
+                (canonical_key(endpoint=endpoint, params=params), endpoint, body, now, now + ttl)
+            )
+
+    def invalidate(self, endpoint: str = None) -> int:
+        """Removes the cached responses of an endpoint, or of every endpoint.
+
+        ### Parameters
+        ----
+        endpoint : str (optional, Default=None)
+            The endpoint to invalidate, defaults to every endpoint.
+
+        ### Returns
+        ----
+        int:
+            The number of responses removed.
+        """
+
+        with self.connection:
+
+            if endpoint is None:
+                cursor = self.connection.execute('DELETE FROM responses')
+            else:
+                cursor = self.connection.execute('DELETE FROM responses WHERE endpoint = ?', (endpoint,))
+
+        return cursor.rowcount
+
+    def purge_expired(self) -> int:
+        """Removes every expired response.
+
+        ### Returns
+        ----
+        int:
+            The number of responses removed.
+        """
+
+        with self.connection:
+            cursor = self.connection.execute(
+                'DELETE FROM responses WHERE expires_at < ?',
+                (time.time(),)
+            )
+
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Closes every connection opened by the cache."""
+
+        with self._connections_lock:
+
+            for connection in self._connections:
+                connection.close()
+
+            self._connections = []
+
+        self._local = threading.local()
+
+
+class CacheInfo(NamedTuple):
+
+    """The statistics of a `MemoryResponseCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+
+class MemoryResponseCache(ResponseCache):
+
+    """
+    Overview:
+    ----
+    An in-process, least recently used cache of decoded responses. Each
+    entry expires after the TTL of its dataset, or a fixed `ttl`, and the
+    least recently used entries are evicted once the cache holds more
+    than `max_entries` responses or `max_bytes` bytes of response bodies.
+
+    The decoded responses are shared between callers, so treat them
+    as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: int = None,
+        ttls: List[Tuple[str, int]] = None,
+        default_ttl: int = ONE_HOUR
+    ) -> None:
+        """Initializes the `MemoryResponseCache` object.
+
+        ### Parameters
+        ----
+        max_entries : int (optional, Default=1024)
+            The maximum number of responses held.
+
+        max_bytes : int (optional, Default=64MB)
+            The maximum size of the responses held, measured as the size
+            of their raw bodies.
+
+        ttl : int (optional, Default=None)
+            A fixed TTL, in seconds, for every endpoint. Defaults to the
+            TTL of the dataset of each endpoint.
+
+        ttls : List[Tuple[str, int]] (optional, Default=None)
+            Extra `(endpoint_prefix, seconds)` pairs overriding `DATASET_TTLS`.
+
+        default_ttl : int (optional, Default=3600)
+            The TTL, in seconds, of endpoints matching no prefix.
+
+        ### Usage
+        ----
+            >>> memory_cache = MemoryResponseCache(max_bytes=16 * 1024 * 1024, ttl=60)
+            >>> treasury_client = FederalTreasuryClient(memory_cache=memory_cache)
+            >>> treasury_client.cache_info()
+        """
+
+        super().__init__(ttls=ttls, default_ttl=default_ttl)
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __repr__(self) -> str:
+        """String representation of the `MemoryResponseCache` object."""
+
+        str_representation = '<FederalTreasuryClient.MemoryResponseCache (max_entries={entries}, max_bytes={size})>'.format(
+            entries=self.max_entries,
+            size=self.max_bytes
+        )
+
+        return str_representation
+
+    def __len__(self) -> int:
+        """The number of responses held."""
+
+        return len(self._entries)
+
+    def ttl_for(self, endpoint: str) -> int:
+        """Returns the TTL, in seconds, of an endpoint."""
+
+        if self.ttl is not None:
+            return self.ttl
+
+        return super().ttl_for(endpoint=endpoint)
+
+    def get(self, endpoint: str, params: dict = None) -> Any:
+        """Looks up a decoded response.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        params : dict (optional, Default=None)
+            The URL params for the request.
+
+        ### Returns
+        ----
+        Any:
+            The decoded response, or `None` on a miss.
+        """
+
+        key = canonical_key(endpoint=endpoint, params=params)
+
+        with self._lock:
+
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[2] < time.monotonic():
+                self._discard(key=key)
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return entry[0]
+
+    def set(self, endpoint: str, params: dict, content: Any, size: int) -> None:
+        """Stores a decoded response.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        params : dict
+            The URL params for the request.
+
+        content : Any
+            The decoded response.
+
+        size : int
+            The size of the raw response body, in bytes.
+        """
+
+        # A response larger than the whole cache would only evict everything.
+        if size > self.max_bytes:
+            return
+
+        key = canonical_key(endpoint=endpoint, params=params)
+        expires_at = time.monotonic() + self.ttl_for(endpoint=endpoint)
+
+        with self._lock:
+
+            if key in self._entries:
+                self._discard(key=key)
+
+            self._entries[key] = (content, size, expires_at)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._discard(key=next(iter(self._entries)))
+                self._evictions += 1
+
+    def _discard(self, key: str) -> None:
+        """Removes an entry, the lock must be held."""
+
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        """Removes every response and resets the statistics."""
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the statistics of the cache.
+
+        ### Returns
+        ----
+        CacheInfo:
+            The hits, misses, evictions, entries and bytes of the cache.
+        """
+
+        with self._lock:
+
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes
+            )
@@ -0,0 +1,266 @@
+import time
+import requests
+import threading
+
+from typing import Dict
+
+from treasury.concurrency import endpoint_family
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(requests.ConnectionError):
+
+    """Raised instead of sending a request to an endpoint family whose circuit is open."""
+
+
+class _Circuit():
+
+    """The state of the circuit of an endpoint family."""
+
+    __slots__ = ('state', 'failures', 'opened_at', 'probe_started_at')
+
+    def __init__(self) -> None:
+
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+        # When the request probing a half open circuit was let through.
+        self.probe_started_at: float = None
+
+
+class CircuitBreaker():
+
+    """
+    Overview:
+    ----
+    Stops sending requests to an endpoint family that keeps failing, so
+    the workers fail fast instead of waiting out the timeouts and the
+    retries of a partial outage, and the healthy families keep their
+    threads. After `failure_threshold` failures in a row the circuit of
+    the family opens, and its requests raise a `CircuitOpenError`, or
+    are served from the stale entries of the persistent cache if
+    `serve_stale` is set. Once `reset_timeout` seconds have passed the
+    circuit is half open, and a single request is let through to probe
+    the family: it closes the circuit if it succeeds, and opens it for
+    another `reset_timeout` otherwise.
+
+    A failure is a connection error, a timeout, or a `429` or `5xx`
+    response, once the retries of the `RetryPolicy` are used up.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, serve_stale: bool = True) -> None:
+        """Initializes the `CircuitBreaker` object.
+
+        ### Parameters
+        ----
+        failure_threshold : int (optional, Default=5)
+            The number of failures in a row which opens the circuit.
+
+        reset_timeout : float (optional, Default=30.0)
+            The number of seconds the circuit stays open before a probe.
+
+        serve_stale : bool (optional, Default=True)
+            If `True`, the requests of an open circuit are served from the
+            expired entries of the persistent cache, when there are some.
+
+        ### Usage
+        ----
+            >>> treasury_client = FederalTreasuryClient(
+                    cache=SQLiteResponseCache(),
+                    circuit_breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60)
+                )
+        """
+
+        if failure_threshold < 1:
+            raise ValueError('The failure threshold must be at least 1.')
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.serve_stale = serve_stale
+
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of the `CircuitBreaker` object."""
+
+        return '<FederalTreasuryClient.CircuitBreaker (open={open}, failure_threshold={failure_threshold})>'.format(
+            open=sum(circuit.state != CLOSED for circuit in self._circuits.values()),
+            failure_threshold=self.failure_threshold
+        )
+
+    def state(self, endpoint: str) -> str:
+        """The state of the circuit of the family of an endpoint.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        ### Returns
+        ----
+        str:
+            One of `'closed'`, `'open'` or `'half_open'`.
+        """
+
+        with self._lock:
+            return self._circuit(endpoint=endpoint).state
+
+    def allow(self, endpoint: str) -> bool:
+        """Decides whether a request to an endpoint can be sent.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        ### Returns
+        ----
+        bool:
+            `True` if the circuit is closed, or if the request is the probe
+            of a half open circuit, `False` if it should fail fast.
+        """
+
+        return self._admit(endpoint=endpoint) != OPEN
+
+    def record_success(self, endpoint: str) -> None:
+        """Closes the circuit of the family of an endpoint after a request succeeded.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+        """
+
+        with self._lock:
+
+            circuit = self._circuit(endpoint=endpoint)
+            circuit.state = CLOSED
+            circuit.failures = 0
+            circuit.probe_started_at = None
+
+    def record_response(self, endpoint: str, status_code: int) -> None:
+        """Counts the final response of a request, a `429` or `5xx` being a failure.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        status_code : int
+            The status code of the response.
+        """
+
+        if status_code == 429 or status_code >= 500:
+            self.record_failure(endpoint=endpoint)
+        else:
+            self.record_success(endpoint=endpoint)
+
+    def record_failure(self, endpoint: str) -> None:
+        """Counts a failed request, opening the circuit of its family if need be.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+        """
+
+        with self._lock:
+
+            circuit = self._circuit(endpoint=endpoint)
+            circuit.failures += 1
+
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.probe_started_at = None
+
+    def abandon(self, endpoint: str) -> None:
+        """Lets another request probe a half open circuit, the probe having been cancelled.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+        """
+
+        with self._lock:
+
+            circuit = self._circuit(endpoint=endpoint)
+
+            if circuit.state == HALF_OPEN:
+                circuit.probe_started_at = None
+
+    def check(self, endpoint: str) -> bool:
+        """Raises a `CircuitOpenError` if a request to an endpoint should fail fast.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        ### Raises
+        ----
+        CircuitOpenError:
+            If the circuit of the family of the endpoint is open.
+
+        ### Returns
+        ----
+        bool:
+            `True` if the request is the probe of a half open circuit,
+            which must report back or be `abandon`ed.
+        """
+
+        admitted = self._admit(endpoint=endpoint)
+
+        if admitted == OPEN:
+            raise CircuitOpenError(
+                'The circuit of `{family}` is open, its requests fail fast until a probe succeeds.'.format(
+                    family=endpoint_family(endpoint=endpoint)
+                )
+            )
+
+        return admitted == HALF_OPEN
+
+    def _admit(self, endpoint: str) -> str:
+        """Admits a request, returning `'closed'`, `'half_open'` for the probe, or `'open'` if refused."""
+
+        with self._lock:
+
+            circuit = self._circuit(endpoint=endpoint)
+
+            if circuit.state == CLOSED:
+                return CLOSED
+
+            now = time.monotonic()
+
+            if circuit.state == OPEN and now - circuit.opened_at < self.reset_timeout:
+                return OPEN
+
+            # A probe that never reported back is replaced after a while.
+            if (
+                circuit.state == HALF_OPEN
+                and circuit.probe_started_at is not None
+                and now - circuit.probe_started_at < self.reset_timeout
+            ):
+                return OPEN
+
+            circuit.state = HALF_OPEN
+            circuit.probe_started_at = now
+
+            return HALF_OPEN
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        """The circuit of the family of an endpoint, created on first use, to be called under the lock."""
+
+        family = endpoint_family(endpoint=endpoint)
+        circuit = self._circuits.get(family)
+
+        if circuit is None:
+            circuit = self._circuits[family] = _Circuit()
+
+        return circuit
@@ -0,0 +1,120 @@
+import sys
+import argparse
+
+from typing import List
+
+from treasury.client import FederalTreasuryClient
+from treasury.export import FORMATS
+from treasury.export import DatasetExporter
+from treasury.sync import endpoint_methods
+
+# The services of the `FederalTreasuryClient`, by the name of the method returning them.
+SERVICES = [
+    'public_debt_instruments',
+    'outstanding_debt_instruments',
+    'daily_treasury_statements',
+    'monthly_treasury_statements',
+    'treasury_reports_on_receivables',
+    'other_data',
+    'revenue_and_payments',
+    'offset_program'
+]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the parser of the `treasury` command."""
+
+    parser = argparse.ArgumentParser(
+        prog='treasury',
+        description='Pull datasets from the U.S. Treasury Fiscal Data API.'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = commands.add_parser(
+        'export',
+        help='Write whole datasets to Parquet or Arrow IPC files.',
+        description='Write whole datasets to Parquet or Arrow IPC files, one directory per dataset.'
+    )
+    export_parser.add_argument('service', choices=SERVICES, help='The service holding the datasets.')
+    export_parser.add_argument(
+        'endpoints',
+        nargs='*',
+        help='The endpoint methods to export, for example `receipts outlays`, all of them by default.'
+    )
+    export_parser.add_argument('--output', default='exports', help='The output directory.')
+    export_parser.add_argument('--format', dest='file_format', choices=list(FORMATS), default='parquet')
+    export_parser.add_argument(
+        '--partition-by',
+        help='The field the files are partitioned by, for example `record_fiscal_year` or `record_date`.'
+    )
+    export_parser.add_argument(
+        '--filter',
+        dest='filters',
+        action='append',
+        help='A filter of the API, for example `record_date:gte:2020-01-01`, can be repeated.'
+    )
+    export_parser.add_argument('--page-size', default='auto', help='A page size, or `auto`.')
+    export_parser.add_argument('--max-rows-per-file', type=int, default=0)
+
+    return parser
+
+
+def export(arguments: argparse.Namespace) -> int:
+    """Runs the `export` command."""
+
+    with FederalTreasuryClient() as treasury_client:
+
+        service = getattr(treasury_client, arguments.service)()
+        methods = endpoint_methods(service=service)
+
+        if arguments.endpoints:
+
+            unknown = set(arguments.endpoints) - {method.__name__ for method in methods}
+
+            if unknown:
+                print('Unknown endpoints: {unknown}'.format(unknown=', '.join(sorted(unknown))), file=sys.stderr)
+                return 2
+
+            methods = [method for method in methods if method.__name__ in arguments.endpoints]
+
+        dataset_exporter = DatasetExporter(
+            directory=arguments.output,
+            file_format=arguments.file_format,
+            partition_by=arguments.partition_by,
+            page_size=arguments.page_size if arguments.page_size == 'auto' else int(arguments.page_size),
+            max_rows_per_file=arguments.max_rows_per_file
+        )
+
+        for method in methods:
+
+            result = dataset_exporter.export(method, filters=arguments.filters)
+
+            print('{dataset}: {rows} rows in {files} files under {path}'.format(
+                dataset=result.dataset,
+                rows=result.rows,
+                files=len(result.files),
+                path=result.path
+            ))
+
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    """The entry point of the `treasury` command.
+
+    ### Usage
+    ----
+        $ treasury export monthly_treasury_statements --partition-by record_fiscal_year
+        $ treasury export other_data debt_to_penny --format arrow --filter record_date:gte:2020-01-01
+    """
+
+    arguments = build_parser().parse_args(argv)
+
+    if arguments.command == 'export':
+        return export(arguments=arguments)
+
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,30 @@
+from typing import Dict
+from typing import List
+from typing import Union
+from typing import Callable
+from typing import Iterator
+from typing import TYPE_CHECKING
+
+from treasury.cache import CacheInfo
+from treasury.cache import MemoryResponseCache
+from treasury.cache import SQLiteResponseCache
+from treasury.session import JSONDecoder
+from treasury.session import RetryPolicy
+from treasury.typed import TypeDecoder
+from treasury.circuit import CircuitBreaker
+from treasury.hedging import HedgingPolicy
+from treasury.coalescing import RequestCoalescer
+from treasury.concurrency import AdaptiveConcurrencyLimiter
+from treasury.rate_limit import RateLimiter
+from treasury.interning import StringInterner
 from treasury.session import FederalTreasurySession
+from treasury.columns import Column
+from treasury.columns import ColumnBuilder
+from treasury.frames import to_arrow
+from treasury.frames import to_dataframe
+from treasury.pagination import Paginator
+from treasury.pagination import resolve_request
+from treasury.streaming import RecordStream
 
 from treasury.other_data import OtherData
 from treasury.offest_program import OffsetProgram
@@ -9,24 +35,424 @@ from treasury.daily_treasury_statements import DailyTreasuryStatements
 from treasury.monthly_treasury_statement import MonthlyTreasuryStatements
 from treasury.treasury_reports_on_receivables import TreasuryReportsOnReceivables
 
+if TYPE_CHECKING:
+    import pandas
+    import pyarrow
+
 
 class FederalTreasuryClient():
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        retry_policy: RetryPolicy = None,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        cache: SQLiteResponseCache = None,
+        memory_cache: MemoryResponseCache = None,
+        decoder: JSONDecoder = None,
+        type_decoder: TypeDecoder = None,
+        string_interner: StringInterner = None,
+        rate_limiter: RateLimiter = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter = None,
+        request_coalescer: RequestCoalescer = None,
+        hedging_policy: HedgingPolicy = None,
+        circuit_breaker: CircuitBreaker = None
+    ) -> None:
         """Initializes the `FederalTreasuryClient`.
 
+        ### Parameters
+        ----
+        pool_connections : int (optional, Default=10)
+            The number of host connection pools to cache.
+
+        pool_maxsize : int (optional, Default=10)
+            The maximum number of connections kept open per host,
+            raise this when sharing the client across many threads.
+
+        pool_block : bool (optional, Default=False)
+            If `True`, requests wait for a free pooled connection
+            instead of opening a throwaway one.
+
+        keep_alive : bool (optional, Default=True)
+            If `True`, connections are reused between requests.
+
+        retry_policy : RetryPolicy (optional, Default=None)
+            How transient failures (timeouts, 429 and 5xx) are retried,
+            defaults to `RetryPolicy()`.
+
+        connect_timeout : float (optional, Default=5.0)
+            The number of seconds to wait while connecting.
+
+        read_timeout : float (optional, Default=30.0)
+            The number of seconds to wait for the server to respond.
+
+        cache : SQLiteResponseCache (optional, Default=None)
+            A persistent response cache shared by every service, GET
+            requests are answered from it while fresh.
+
+        memory_cache : MemoryResponseCache (optional, Default=None)
+            An in-process LRU cache of decoded responses, checked before
+            `cache`. The responses it returns are shared, treat them as
+            read-only.
+
+        decoder : JSONDecoder (optional, Default=None)
+            The decoder of the response bodies, defaults to `orjson` or
+            `msgspec` when installed, and the standard library otherwise.
+
+        type_decoder : TypeDecoder (optional, Default=None)
+            If set, the records are returned with `date`, `int`, `Decimal`
+            and `None` values instead of strings, converted using the
+            `meta['dataTypes']` of each page.
+
+        string_interner : StringInterner (optional, Default=None)
+            If set, the values of the low cardinality string fields of
+            each endpoint, detected on its first records, share one object
+            instead of a copy per record.
+
+        rate_limiter : RateLimiter (optional, Default=None)
+            A token bucket pacing the requests of every service, which
+            may be shared with other clients, see `FileRateLimiter`.
+
+        concurrency_limiter : AdaptiveConcurrencyLimiter (optional, Default=None)
+            Caps the requests in flight to each endpoint family, raising the
+            cap while latency holds and cutting it on `429`, `5xx` or spikes.
+
+        request_coalescer : RequestCoalescer (optional, Default=None)
+            Lets identical GET requests in flight, across threads or tasks,
+            share one call to the API, defaults to one per client.
+
+        hedging_policy : HedgingPolicy (optional, Default=None)
+            Sends a GET request a second time when it is slower than most,
+            using the first response, to cut the tail latency.
+
+        circuit_breaker : CircuitBreaker (optional, Default=None)
+            Makes the requests to an endpoint family that keeps failing fail
+            fast, or served stale from `cache`, until a probe succeeds.
+
         ### Usage
         ----
             >>> treasury_client = FederalTreasuryClient()
+            >>> with FederalTreasuryClient(pool_maxsize=16) as treasury_client:
+                    treasury_client.other_data().debt_to_penny()
         """
 
-        self.treasury_session = FederalTreasurySession(client=self)
+        self.treasury_session = FederalTreasurySession(
+            client=self,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            retry_policy=retry_policy,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            cache=cache,
+            memory_cache=memory_cache,
+            decoder=decoder,
+            type_decoder=type_decoder,
+            string_interner=string_interner,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            request_coalescer=request_coalescer,
+            hedging_policy=hedging_policy,
+            circuit_breaker=circuit_breaker
+        )
 
     def __repr__(self) -> str:
         """String representation of the `FederalTreasuryClient` object."""
 
         return '<FederalTreasuryClient (active=True, connected=True)>'
 
+    def __enter__(self) -> 'FederalTreasuryClient':
+        """Enters the client context, returning the client itself."""
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Exits the client context, closing the connection pool."""
+
+        self.close()
+
+    def close(self) -> None:
+        """Closes the client and releases all pooled connections.
+
+        ### Usage
+        ----
+            >>> treasury_client = FederalTreasuryClient()
+            >>> treasury_client.close()
+        """
+
+        self.treasury_session.close()
+
+    def cache_info(self) -> Union[CacheInfo, None]:
+        """Returns the statistics of the in-memory cache.
+
+        ### Returns
+        ----
+        Union[CacheInfo, None]:
+            The hits, misses, evictions, entries and bytes of the
+            in-memory cache, or `None` if the client has none.
+
+        ### Usage
+        ----
+            >>> treasury_client = FederalTreasuryClient(memory_cache=MemoryResponseCache())
+            >>> treasury_client.cache_info()
+            CacheInfo(hits=0, misses=0, evictions=0, entries=0, bytes=0, max_bytes=67108864)
+        """
+
+        if self.treasury_session.memory_cache is None:
+            return None
+
+        return self.treasury_session.memory_cache.cache_info()
+
+    def iter_records(self, method: Callable, **kwargs) -> Iterator[dict]:
+        """Lazily yields every record of an endpoint, across all pages.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of one of the services, for
+            example `treasury_client.other_data().debt_to_penny`.
+
+        **kwargs :
+            The arguments of the endpoint method, `fields`, `sort`,
+            `filters`, `page_number` and `page_size`.
+
+        ### Returns
+        ----
+        Iterator[dict]:
+            The records, requested one page at a time as they are consumed.
+
+        ### Usage
+        ----
+            >>> treasury_client = FederalTreasuryClient()
+            >>> other_data_service = treasury_client.other_data()
+            >>> for record in treasury_client.iter_records(other_data_service.debt_to_penny):
+                    print(record['record_date'])
+        """
+
+        return Paginator(session=self.treasury_session).iter_records(method, **kwargs)
+
+    def stream_records(self, method: Callable, wire_format: str = 'json', **kwargs) -> RecordStream:
+        """Streams the records of one page as the body arrives.
+
+        ### Overview:
+        ----
+        The page is parsed straight from the socket, so memory stays flat
+        however large `page_size` is. The `meta` and `links` of the page
+        are available on the stream once its records are consumed. The
+        records are not typed, as the `dataTypes` come after them, use
+        `TypeDecoder.decode_records` with the `dataTypes` of the dataset.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of one of the services.
+
+        wire_format : str (optional, Default='json')
+            Either `'json'` or `'csv'`, a CSV page is smaller on the wire,
+            but its values are the strings of the API and it has no `meta`.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        RecordStream:
+            The records of the page, read as they are consumed.
+
+        ### Usage
+        ----
+            >>> treasury_client = FederalTreasuryClient()
+            >>> other_data_service = treasury_client.other_data()
+            >>> with treasury_client.stream_records(other_data_service.debt_to_penny, page_size=10000) as stream:
+                    for record in stream:
+                        print(record['record_date'])
+            >>> stream.meta['total-pages']
+        """
+
+        request = resolve_request(method, **kwargs)
+        request.params['format'] = wire_format
+
+        return self.treasury_session.make_request(
+            method=request.method,
+            endpoint=request.endpoint,
+            params=request.params,
+            stream=True
+        )
+
+    def fetch_all(
+        self,
+        method: Callable,
+        parallel: int = 1,
+        progress: Callable[[int, int], None] = None,
+        as_columns: bool = False,
+        as_tuples: bool = False,
+        wire_format: str = 'json',
+        **kwargs
+    ) -> Union[List[dict], List[tuple], Dict[str, Column]]:
+        """Grabs every record of an endpoint, across all pages.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of one of the services.
+
+        parallel : int (optional, Default=1)
+            The maximum number of pages requested at the same time, once
+            the first page has told how many pages there are. Keep it at
+            or below the client's `pool_maxsize`.
+
+        progress : Callable[[int, int], None] (optional, Default=None)
+            Called with `(pages_done, total_pages)` each time a page arrives.
+
+        as_columns : bool (optional, Default=False)
+            If `True`, returns one compact column per field instead of
+            the records: `array('d')` for numbers, `array('q')` for whole
+            numbers, `array('i')` of ordinals for dates and lists of
+            interned strings, see `ColumnBuilder`.
+
+        as_tuples : bool (optional, Default=False)
+            If `True`, returns the records as instances of a `namedtuple`
+            type generated once per endpoint, read as `record.record_date`,
+            which takes a fraction of the memory of a `dict`, see `record_type`.
+
+        wire_format : str (optional, Default='json')
+            Either `'json'` or `'csv'`, whose pages are smaller on the
+            wire but are requested one at a time, see `Paginator.iter_csv_pages`.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        Union[List[dict], List[tuple], Dict[str, Column]]:
+            The records of every page, or their columns.
+
+        ### Usage
+        ----
+            >>> treasury_client = FederalTreasuryClient()
+            >>> other_data_service = treasury_client.other_data()
+            >>> records = treasury_client.fetch_all(other_data_service.gold_reserve)
+            >>> records = treasury_client.fetch_all(other_data_service.saving_bonds_value, parallel=16)
+            >>> columns = treasury_client.fetch_all(other_data_service.saving_bonds_value, as_columns=True)
+        """
+
+        return Paginator(session=self.treasury_session).fetch_all(
+            method,
+            parallel=parallel,
+            progress=progress,
+            as_columns=as_columns,
+            as_tuples=as_tuples,
+            wire_format=wire_format,
+            **kwargs
+        )
+
+    def fetch_dataframe(
+        self,
+        method: Callable,
+        parallel: int = 1,
+        progress: Callable[[int, int], None] = None,
+        **kwargs
+    ) -> 'pandas.DataFrame':
+        """Grabs every record of an endpoint into a `pandas.DataFrame`.
+
+        ### Overview
+        ----
+        The pages are folded into typed columns as they arrive, and the
+        frame is built from those columns with the dtypes of the
+        `meta['dataTypes']`, see `to_dataframe`. Requires `pandas`.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of one of the services.
+
+        parallel : int (optional, Default=1)
+            The maximum number of pages requested at the same time.
+
+        progress : Callable[[int, int], None] (optional, Default=None)
+            Called with `(pages_done, total_pages)` each time a page arrives.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        pandas.DataFrame:
+            One row per record.
+
+        ### Usage
+        ----
+            >>> treasury_client = FederalTreasuryClient()
+            >>> other_data_service = treasury_client.other_data()
+            >>> debt_frame = treasury_client.fetch_dataframe(other_data_service.debt_to_penny, parallel=8)
+        """
+
+        return to_dataframe(
+            source=Paginator(session=self.treasury_session).collect(
+                method,
+                collector=ColumnBuilder(),
+                parallel=parallel,
+                progress=progress,
+                **kwargs
+            )
+        )
+
+    def fetch_arrow(
+        self,
+        method: Callable,
+        parallel: int = 1,
+        progress: Callable[[int, int], None] = None,
+        **kwargs
+    ) -> 'pyarrow.Table':
+        """Grabs every record of an endpoint into a `pyarrow.Table`.
+
+        ### Overview
+        ----
+        The pages are folded into typed columns as they arrive, and the
+        table is built from those columns with the types of the
+        `meta['dataTypes']`, see `to_arrow`. Requires `pyarrow`.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of one of the services.
+
+        parallel : int (optional, Default=1)
+            The maximum number of pages requested at the same time.
+
+        progress : Callable[[int, int], None] (optional, Default=None)
+            Called with `(pages_done, total_pages)` each time a page arrives.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        pyarrow.Table:
+            One row per record.
+
+        ### Usage
+        ----
+            >>> treasury_client = FederalTreasuryClient()
+            >>> other_data_service = treasury_client.other_data()
+            >>> debt_table = treasury_client.fetch_arrow(other_data_service.debt_to_penny, parallel=8)
+        """
+
+        return to_arrow(
+            source=Paginator(session=self.treasury_session).collect(
+                method,
+                collector=ColumnBuilder(),
+                parallel=parallel,
+                progress=progress,
+                **kwargs
+            )
+        )
+
     def public_debt_instruments(self) -> PublicDebtInstruments:
         """Used to access the `PublicDebtInstruments` services.
 
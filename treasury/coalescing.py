@@ -0,0 +1,158 @@
+import asyncio
+import threading
+
+from typing import Any
+from typing import Dict
+from typing import Tuple
+from typing import Callable
+from typing import Awaitable
+
+
+class _Call():
+
+    """A call in flight, with the event its followers wait on."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self) -> None:
+
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class RequestCoalescer():
+
+    """
+    Overview:
+    ----
+    Lets identical requests in flight share one call to the API. The
+    first caller of a key, the leader, runs the call, and the callers
+    arriving with the same key while it runs, the followers, wait for
+    it and get its result, or its error, instead of sending their own.
+    Once the call returns the key is free again, so later callers are
+    served by the caches or send a fresh request.
+
+    Like the hits of the `MemoryResponseCache`, the leader and its
+    followers share the same decoded content.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the `RequestCoalescer` object.
+
+        ### Usage
+        ----
+            >>> request_coalescer = RequestCoalescer()
+            >>> request_coalescer.do(key=canonical_key(endpoint, params), function=send)
+        """
+
+        self.coalesced = 0
+
+        self._calls: Dict[str, _Call] = {}
+        self._tasks: Dict[Tuple[int, str], asyncio.Task] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of the `RequestCoalescer` object."""
+
+        return '<FederalTreasuryClient.RequestCoalescer (in_flight={in_flight}, coalesced={coalesced})>'.format(
+            in_flight=len(self._calls) + len(self._tasks),
+            coalesced=self.coalesced
+        )
+
+    def do(self, key: str, function: Callable[[], Any]) -> Any:
+        """Runs a call once for all the threads asking for the same key at the same time.
+
+        ### Parameters
+        ----
+        key : str
+            The key of the call, see `canonical_key`.
+
+        function : Callable[[], Any]
+            The call, only run by the leader.
+
+        ### Returns
+        ----
+        Any:
+            The result of the call, the error of the call being raised in
+            every caller.
+        """
+
+        with self._lock:
+
+            call = self._calls.get(key)
+
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+
+            call.done.wait()
+
+            if call.error is not None:
+                raise call.error
+
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+
+            with self._lock:
+                del self._calls[key]
+
+            call.done.set()
+
+        return call.result
+
+    async def ado(self, key: str, function: Callable[[], Awaitable[Any]]) -> Any:
+        """Awaits a call once for all the tasks of an event loop asking for the same key at the same time.
+
+        ### Overview
+        ----
+        The call runs in a task of its own, so a caller that is cancelled
+        does not cancel it for the others.
+
+        ### Parameters
+        ----
+        key : str
+            The key of the call, see `canonical_key`.
+
+        function : Callable[[], Awaitable[Any]]
+            The coroutine function of the call, only awaited by the leader.
+
+        ### Returns
+        ----
+        Any:
+            The result of the call, the error of the call being raised in
+            every caller.
+        """
+
+        # Tasks are bound to their event loop, so the loops do not share calls.
+        task_key = (id(asyncio.get_running_loop()), key)
+        task = self._tasks.get(task_key)
+
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = self._tasks[task_key] = asyncio.ensure_future(function())
+            task.add_done_callback(lambda done: self._forget(task_key=task_key, task=done))
+
+        return await asyncio.shield(task)
+
+    def _forget(self, task_key: Tuple[int, str], task: asyncio.Task) -> None:
+        """Frees the key of a finished call."""
+
+        if self._tasks.get(task_key) is task:
+            del self._tasks[task_key]
+
+        # Retrieves the error, which every caller left has been handed.
+        if not task.cancelled():
+            task.exception()
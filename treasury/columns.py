@@ -0,0 +1,255 @@
+import sys
+import math
+
+from array import array
+from typing import Dict
+from typing import List
+from typing import Union
+from functools import lru_cache
+from datetime import date
+
+from treasury.typed import INTEGER_TYPES
+from treasury.typed import NUMBER_TYPES
+from treasury.typed import parse_float
+from treasury.typed import parse_integer
+
+# The ordinal standing in for a missing date, real ordinals start at 1.
+NULL_ORDINAL = 0
+
+# The typecodes of the columns, floats, whole numbers and date ordinals.
+FLOAT_TYPECODE = 'd'
+INTEGER_TYPECODE = 'q'
+DATE_TYPECODE = 'i'
+
+Column = Union[array, List[Union[str, None]]]
+
+
+def column_kind(data_type: str) -> str:
+    """Maps one of the `meta['dataTypes']` to the kind of column storing it.
+
+    ### Parameters
+    ----
+    data_type : str
+        The type descriptor, for example `'DATE'` or `'CURRENCY0'`.
+
+    ### Returns
+    ----
+    str:
+        One of `'date'`, `'integer'`, `'float'` or `'string'`.
+    """
+
+    data_type = (data_type or '').upper()
+
+    if data_type == 'DATE':
+        return 'date'
+
+    if data_type in INTEGER_TYPES:
+        return 'integer'
+
+    if data_type in NUMBER_TYPES or data_type.startswith('CURRENCY'):
+        return 'float'
+
+    return 'string'
+
+
+@lru_cache(maxsize=8192)
+def date_ordinal(value: Union[str, date, None]) -> int:
+    """Turns a `DATE` value into its proleptic Gregorian ordinal, `NULL_ORDINAL` if missing."""
+
+    if value is None or value == 'null' or value == '':
+        return NULL_ORDINAL
+
+    if isinstance(value, date):
+        return value.toordinal()
+
+    return date.fromisoformat(value).toordinal()
+
+
+def _is_null(value: object) -> bool:
+    """Whether a value stands for a missing one."""
+
+    return value is None or value == 'null' or value == ''
+
+
+class ColumnBuilder():
+
+    """
+    Overview:
+    ----
+    Builds one compact column per field out of pages of records. Numbers
+    are stored in `array('d')`, whole numbers in `array('q')`, dates as
+    ordinals in `array('i')` and strings in lists of interned strings,
+    so a value costs 4 to 8 bytes instead of a string object and its key
+    in a dictionary. The arrays support the buffer protocol, so
+    `numpy.frombuffer(column, dtype='float64')` wraps them without a copy.
+
+    Missing numbers are stored as `nan`, missing dates as `NULL_ORDINAL`
+    and missing strings as `None`. A whole number column holding a
+    missing value is turned into a float column.
+    """
+
+    def __init__(self, data_types: Dict[str, str] = None) -> None:
+        """Initializes the `ColumnBuilder` object.
+
+        ### Parameters
+        ----
+        data_types : Dict[str, str] (optional, Default=None)
+            The `meta['dataTypes']` of the dataset, read from the first
+            page appended if not given.
+
+        ### Usage
+        ----
+            >>> column_builder = ColumnBuilder()
+            >>> for content in paginator.iter_pages(other_data_service.debt_to_penny):
+                    column_builder.append(content)
+            >>> columns = column_builder.build()
+            >>> columns['tot_pub_debt_out_amt']
+            array('d', [31458430741793.28, ...])
+        """
+
+        self.data_types = dict(data_types or {})
+        self.columns: Dict[str, Column] = {}
+        self.kinds: Dict[str, str] = {}
+        self.length = 0
+
+    def __repr__(self) -> str:
+        """String representation of the `ColumnBuilder` object."""
+
+        return '<FederalTreasuryClient.ColumnBuilder (columns={columns}, length={length})>'.format(
+            columns=len(self.columns),
+            length=self.length
+        )
+
+    def __len__(self) -> int:
+        """The number of records appended."""
+
+        return self.length
+
+    def append(self, content: Dict) -> 'ColumnBuilder':
+        """Appends the records of a page.
+
+        ### Parameters
+        ----
+        content : Dict
+            A decoded page of the API, with its `data` and `meta`.
+
+        ### Returns
+        ----
+        ColumnBuilder:
+            The builder, so calls can be chained.
+        """
+
+        if not self.data_types:
+            self.data_types = dict((content.get('meta') or {}).get('dataTypes') or {})
+
+        return self.extend(records=content.get('data') or [])
+
+    def extend(self, records: List[dict]) -> 'ColumnBuilder':
+        """Appends records, one column at a time.
+
+        ### Parameters
+        ----
+        records : List[dict]
+            The records to append.
+
+        ### Returns
+        ----
+        ColumnBuilder:
+            The builder, so calls can be chained.
+        """
+
+        if not records:
+            return self
+
+        for field in records[0]:
+            if field not in self.columns:
+                self._add_column(field=field)
+
+        for field, column in self.columns.items():
+
+            values = [record.get(field) for record in records]
+            kind = self.kinds[field]
+
+            if kind == 'float':
+                self._extend_floats(column=column, values=values)
+            elif kind == 'integer':
+                self._extend_integers(field=field, values=values)
+            elif kind == 'date':
+                column.extend(map(date_ordinal, values))
+            else:
+                column.extend([
+                    sys.intern(value) if type(value) is str and value != 'null' and value else
+                    None if _is_null(value) else value
+                    for value in values
+                ])
+
+        self.length += len(records)
+
+        return self
+
+    def build(self) -> Dict[str, Column]:
+        """Returns the columns built so far.
+
+        ### Returns
+        ----
+        Dict[str, Column]:
+            The column of each field, in the order of the records' fields.
+        """
+
+        return self.columns
+
+    def _add_column(self, field: str) -> None:
+        """Adds the column of a field, filled with missing values for the records already appended."""
+
+        kind = column_kind(data_type=self.data_types.get(field))
+
+        if kind == 'float':
+            column = array(FLOAT_TYPECODE, [math.nan]) * self.length
+        elif kind == 'integer' and self.length:
+            kind = 'float'
+            column = array(FLOAT_TYPECODE, [math.nan]) * self.length
+        elif kind == 'integer':
+            column = array(INTEGER_TYPECODE)
+        elif kind == 'date':
+            column = array(DATE_TYPECODE, [NULL_ORDINAL]) * self.length
+        else:
+            column = [None] * self.length
+
+        self.columns[field] = column
+        self.kinds[field] = kind
+
+    @staticmethod
+    def _extend_floats(column: array, values: list) -> None:
+        """Appends values to a float column."""
+
+        length = len(column)
+
+        try:
+            column.extend(map(float, values))
+        except (TypeError, ValueError):
+
+            # Drop what was appended before the failing value.
+            del column[length:]
+            column.extend(math.nan if _is_null(value) else parse_float(value) for value in values)
+
+    def _extend_integers(self, field: str, values: list) -> None:
+        """Appends values to a whole number column, turning it into a float column on missing values."""
+
+        column = self.columns[field]
+        length = len(column)
+
+        try:
+            column.extend(map(int, values))
+            return
+        except (TypeError, ValueError):
+            del column[length:]
+
+        if any(_is_null(value) for value in values):
+
+            column = self.columns[field] = array(FLOAT_TYPECODE, column)
+            self.kinds[field] = 'float'
+
+            column.extend(math.nan if _is_null(value) else parse_integer(value) for value in values)
+
+        else:
+            column.extend(parse_integer(value) for value in values)
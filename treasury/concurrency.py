@@ -0,0 +1,287 @@
+import time
+import asyncio
+import threading
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+def endpoint_family(endpoint: str) -> str:
+    """Names the family of an endpoint, `/v2/accounting/od/debt_to_penny` gives `/v2/accounting/od/*`.
+
+    ### Parameters
+    ----
+    endpoint : str
+        The API URL endpoint.
+
+    ### Returns
+    ----
+    str:
+        The folder of the endpoint, the datasets in a folder being
+        served by the same backend.
+    """
+
+    return endpoint.rstrip('/').rsplit('/', 1)[0] + '/*'
+
+
+class _FamilyState():
+
+    """The limit and the requests in flight of an endpoint family."""
+
+    __slots__ = ('limit', 'in_flight', 'latency', 'backed_off', 'waiters')
+
+    def __init__(self, limit: float) -> None:
+
+        self.limit = limit
+        self.in_flight = 0
+
+        # The smoothed latency of the family, `None` until a request returns.
+        self.latency: float = None
+        self.backed_off = 0.0
+
+        # The futures of the asyncio tasks waiting for a slot, with their loop.
+        self.waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+
+class AdaptiveConcurrencyLimiter():
+
+    """
+    Overview:
+    ----
+    Caps the requests in flight to each endpoint family, and tunes the
+    cap with additive increase, multiplicative decrease (AIMD). Every
+    request that returns within `latency_tolerance` times the smoothed
+    latency of its family raises the cap by `1 / limit`, so by about one
+    for a full round of requests. A `429`, a `5xx`, a connection error
+    or a latency spike multiplies the cap by `backoff`, at most once per
+    smoothed latency so a burst of failures counts as one.
+
+    The families are the folders of the endpoints, see `endpoint_family`,
+    so a throttled `/v1/accounting/dts/*` does not slow down the pulls
+    of `/v2/accounting/od/*`.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.1
+    ) -> None:
+        """Initializes the `AdaptiveConcurrencyLimiter` object.
+
+        ### Parameters
+        ----
+        initial_limit : int (optional, Default=4)
+            The requests in flight allowed to a family before any returns.
+
+        min_limit : int (optional, Default=1)
+            The floor of the cap.
+
+        max_limit : int (optional, Default=32)
+            The ceiling of the cap, keep it at most the `pool_maxsize`
+            of the session.
+
+        backoff : float (optional, Default=0.5)
+            The factor applied to the cap when the family is overloaded.
+
+        latency_tolerance : float (optional, Default=2.0)
+            The multiple of the smoothed latency past which a request is
+            a latency spike.
+
+        smoothing : float (optional, Default=0.1)
+            The weight of each new latency in the smoothed latency.
+
+        ### Usage
+        ----
+            >>> concurrency_limiter = AdaptiveConcurrencyLimiter(max_limit=16)
+            >>> treasury_client = FederalTreasuryClient(concurrency_limiter=concurrency_limiter, pool_maxsize=16)
+            >>> treasury_client.fetch_all(other_data_service.debt_to_penny, parallel=16)
+        """
+
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError('The limits must satisfy 1 <= min_limit <= initial_limit <= max_limit.')
+
+        if not 0 < backoff < 1:
+            raise ValueError('The backoff must be between 0 and 1.')
+
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+
+        self._families: Dict[str, _FamilyState] = {}
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+
+    def __repr__(self) -> str:
+        """String representation of the `AdaptiveConcurrencyLimiter` object."""
+
+        return '<FederalTreasuryClient.AdaptiveConcurrencyLimiter (families={families}, max_limit={max_limit})>'.format(
+            families=len(self._families),
+            max_limit=self.max_limit
+        )
+
+    def limit(self, endpoint: str) -> int:
+        """The number of requests currently allowed in flight to the family of an endpoint.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        ### Returns
+        ----
+        int:
+            The current cap.
+        """
+
+        with self._lock:
+            return int(self._state(endpoint=endpoint).limit)
+
+    def in_flight(self, endpoint: str) -> int:
+        """The number of requests in flight to the family of an endpoint."""
+
+        with self._lock:
+            return self._state(endpoint=endpoint).in_flight
+
+    def acquire(self, endpoint: str) -> None:
+        """Waits for a slot in the family of an endpoint, blocking the calling thread.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+        """
+
+        with self._available:
+
+            state = self._state(endpoint=endpoint)
+
+            while state.in_flight >= int(state.limit):
+                self._available.wait()
+
+            state.in_flight += 1
+
+    async def aacquire(self, endpoint: str) -> None:
+        """Waits for a slot in the family of an endpoint, without blocking the event loop.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+
+            with self._lock:
+
+                state = self._state(endpoint=endpoint)
+
+                if state.in_flight < int(state.limit):
+                    state.in_flight += 1
+                    return
+
+                waiter = loop.create_future()
+                state.waiters.append((loop, waiter))
+
+            await waiter
+
+    def release(self, endpoint: str, latency: float, overloaded: bool = False) -> None:
+        """Frees the slot of a request, and adjusts the cap of its family.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        latency : float
+            The number of seconds the request took.
+
+        overloaded : bool (optional, Default=False)
+            If `True`, the API answered `429` or `5xx`, or the request
+            failed to connect, and the cap is cut.
+        """
+
+        with self._available:
+
+            state = self._state(endpoint=endpoint)
+            state.in_flight = max(state.in_flight - 1, 0)
+
+            if state.latency is None:
+                spike = False
+                state.latency = latency
+            else:
+                spike = latency > self.latency_tolerance * state.latency
+                state.latency += self.smoothing * (latency - state.latency)
+
+            if overloaded or spike:
+
+                now = time.monotonic()
+
+                # The requests already in flight saw the same overload.
+                if now - state.backed_off >= state.latency:
+                    state.limit = max(state.limit * self.backoff, float(self.min_limit))
+                    state.backed_off = now
+
+            else:
+                state.limit = min(state.limit + 1 / state.limit, float(self.max_limit))
+
+            waiters, state.waiters = state.waiters, []
+            self._available.notify_all()
+
+        # Every waiter checks the new cap again, the ones left over wait anew.
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                # The loop of the waiter is closed.
+                pass
+
+    def abandon(self, endpoint: str) -> None:
+        """Frees the slot of a request that was cancelled, or failed on our side, without adjusting the cap.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+        """
+
+        with self._available:
+
+            state = self._state(endpoint=endpoint)
+            state.in_flight = max(state.in_flight - 1, 0)
+
+            waiters, state.waiters = state.waiters, []
+            self._available.notify_all()
+
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                pass
+
+    def _state(self, endpoint: str) -> _FamilyState:
+        """The state of the family of an endpoint, created on first use, to be called under the lock."""
+
+        family = endpoint_family(endpoint=endpoint)
+        state = self._families.get(family)
+
+        if state is None:
+            state = self._families[family] = _FamilyState(limit=float(self.initial_limit))
+
+        return state
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    """Wakes an asyncio waiter, unless it was cancelled."""
+
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,256 @@
+import io
+import csv
+import codecs
+
+from typing import Dict
+from typing import List
+from typing import Iterable
+from typing import Iterator
+from typing import AsyncIterable
+from typing import AsyncIterator
+
+from treasury.streaming import RecordStream
+from treasury.streaming import AsyncRecordStream
+
+# The value of the `format` URL param asking the API for CSV.
+CSV_FORMAT = 'csv'
+
+# The wire formats the pages can be requested in.
+WIRE_FORMATS = ('json', CSV_FORMAT)
+
+
+class CSVRecordParser():
+
+    """
+    Overview:
+    ----
+    An incremental parser of the CSV responses of the API. It is fed
+    the body chunk by chunk, and hands back one record per complete
+    row, keyed by the fields of the header row. A row is only parsed
+    once the line ending it has arrived outside of a quoted value, so
+    values holding line breaks are kept whole.
+    """
+
+    def __init__(self, encoding: str = 'utf-8-sig') -> None:
+        """Initializes the `CSVRecordParser` object.
+
+        ### Parameters
+        ----
+        encoding : str (optional, Default='utf-8-sig')
+            The encoding of the body, a leading byte order mark is dropped.
+        """
+
+        self.fields: List[str] = None
+        self.content: Dict = {}
+        self.rows = 0
+
+        self._renames: Dict[str, str] = {}
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._buffer = ''
+        self._done = False
+
+    def __repr__(self) -> str:
+        """String representation of the `CSVRecordParser` object."""
+
+        return '<FederalTreasuryClient.CSVRecordParser (rows={rows}, buffered={buffered})>'.format(
+            rows=self.rows,
+            buffered=len(self._buffer)
+        )
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole body has been parsed."""
+
+        return self._done
+
+    def rename(self, renames: Dict[str, str]) -> None:
+        """Renames header columns, for a header holding the labels of the fields.
+
+        ### Parameters
+        ----
+        renames : Dict[str, str]
+            The field of each header column to rename.
+        """
+
+        self._renames.update(renames)
+
+        if self.fields is not None:
+            self.fields = [self._renames.get(field, field) for field in self.fields]
+
+    def feed(self, chunk: bytes) -> List[dict]:
+        """Parses the next chunk of the body.
+
+        ### Parameters
+        ----
+        chunk : bytes
+            The next bytes of the body.
+
+        ### Returns
+        ----
+        List[dict]:
+            The records completed by this chunk.
+        """
+
+        self._buffer += self._decoder.decode(chunk)
+
+        end = self._complete_rows_end()
+
+        if end == 0:
+            return []
+
+        text, self._buffer = self._buffer[:end], self._buffer[end:]
+
+        return self._parse(text=text)
+
+    def close(self) -> List[dict]:
+        """Parses the last row, which may lack a line ending.
+
+        ### Raises
+        ----
+        ValueError:
+            If the body ended inside a quoted value.
+
+        ### Returns
+        ----
+        List[dict]:
+            The last records of the body.
+        """
+
+        self._buffer += self._decoder.decode(b'', final=True)
+        text, self._buffer = self._buffer, ''
+        self._done = True
+
+        if text.count('"') % 2:
+            raise ValueError('The response body ended inside a quoted CSV value.')
+
+        return self._parse(text=text)
+
+    def _complete_rows_end(self) -> int:
+        """Finds where the last complete row of the buffer ends, 0 if there is none."""
+
+        buffer = self._buffer
+        end = buffer.rfind('\n') + 1
+
+        # An odd number of quotes means the line break is inside a value.
+        while end and buffer.count('"', 0, end) % 2:
+            end = buffer.rfind('\n', 0, end - 1) + 1
+
+        return end
+
+    def _parse(self, text: str) -> List[dict]:
+        """Parses complete rows into records."""
+
+        rows = csv.reader(io.StringIO(text, newline=''))
+
+        if self.fields is None:
+
+            header = next(rows, None)
+
+            if header is None:
+                return []
+
+            self.fields = [self._renames.get(field, field) for field in header]
+
+        fields = self.fields
+        records = [dict(zip(fields, row)) for row in rows if row]
+        self.rows += len(records)
+
+        return records
+
+
+class CSVRecordStream(RecordStream):
+
+    """
+    Overview:
+    ----
+    Iterates over the records of a page streamed as CSV, the body being
+    smaller than its JSON counterpart which repeats every key in every
+    record. The response carries no `meta` nor `links`, and the values
+    are the strings of the API.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], response: object = None) -> None:
+        """Initializes the `CSVRecordStream` object.
+
+        ### Parameters
+        ----
+        chunks : Iterable[bytes]
+            The chunks of the body, for example `response.iter_content()`.
+
+        response : object (optional, Default=None)
+            The streamed response, closed once the stream is done.
+
+        ### Usage
+        ----
+            >>> with treasury_client.stream_records(other_data_service.debt_to_penny, wire_format='csv') as stream:
+                    for record in stream:
+                        print(record['record_date'])
+        """
+
+        self.chunks = chunks
+        self.response = response
+        self.parser = CSVRecordParser()
+
+    def __repr__(self) -> str:
+        """String representation of the `CSVRecordStream` object."""
+
+        return '<FederalTreasuryClient.CSVRecordStream (done={done})>'.format(done=self.parser.done)
+
+    def __iter__(self) -> Iterator[dict]:
+        """Yields the records as they are parsed."""
+
+        try:
+
+            for chunk in self.chunks:
+                yield from self.parser.feed(chunk=chunk)
+
+            yield from self.parser.close()
+
+        finally:
+            self.close()
+
+
+class AsyncCSVRecordStream(AsyncRecordStream):
+
+    """
+    Overview:
+    ----
+    The asyncio counterpart of the `CSVRecordStream`, iterated with
+    `async for` over the chunks of an `httpx` streamed response.
+    """
+
+    def __init__(self, chunks: AsyncIterable[bytes], response: object = None) -> None:
+        """Initializes the `AsyncCSVRecordStream` object.
+
+        ### Parameters
+        ----
+        chunks : AsyncIterable[bytes]
+            The chunks of the body, for example `response.aiter_bytes()`.
+
+        response : object (optional, Default=None)
+            The streamed `httpx.Response`, closed once the stream is done.
+        """
+
+        self.chunks = chunks
+        self.response = response
+        self.parser = CSVRecordParser()
+
+    def __repr__(self) -> str:
+        """String representation of the `AsyncCSVRecordStream` object."""
+
+        return '<FederalTreasuryClient.AsyncCSVRecordStream (done={done})>'.format(done=self.parser.done)
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """Yields the records as they are parsed."""
+
+        try:
+
+            async for chunk in self.chunks:
+                for record in self.parser.feed(chunk=chunk):
+                    yield record
+
+            for record in self.parser.close():
+                yield record
+
+        finally:
+            await self.aclose()
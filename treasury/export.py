@@ -0,0 +1,273 @@
+import logging
+import pathlib
+
+from typing import List
+from typing import Union
+from typing import Callable
+from typing import Iterator
+from typing import NamedTuple
+from itertools import chain
+
+from treasury.columns import ColumnBuilder
+from treasury.frames import to_arrow
+from treasury.pagination import Paginator
+from treasury.pagination import resolve_request
+from treasury.sync import dataset_name
+from treasury.sync import endpoint_methods
+
+try:
+    import pyarrow
+    import pyarrow.compute
+    import pyarrow.dataset
+except ImportError:
+    pyarrow = None
+
+# The file formats the exporter writes, and the `pyarrow.dataset` format of each.
+FORMATS = {'parquet': 'parquet', 'arrow': 'ipc'}
+
+
+class ExportResult(NamedTuple):
+
+    """The outcome of exporting one dataset."""
+
+    dataset: str
+    endpoint: str
+    path: str
+    rows: int
+    files: List[str]
+
+
+class DatasetExporter():
+
+    """
+    Overview:
+    ----
+    Writes whole datasets to Parquet or Arrow IPC files. The pages are
+    requested one after the other and each one is turned into a record
+    batch and handed to the writer as it arrives, so memory holds one
+    page whatever the size of the dataset. The files can be partitioned
+    Hive style, `record_fiscal_year=2020/`, by any field, date fields
+    being partitioned by their year.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, pathlib.Path] = 'exports',
+        file_format: str = 'parquet',
+        partition_by: str = None,
+        page_size: Union[int, str] = 'auto',
+        max_rows_per_file: int = 0
+    ) -> None:
+        """Initializes the `DatasetExporter` object.
+
+        ### Parameters
+        ----
+        directory : Union[str, pathlib.Path] (optional, Default='exports')
+            The directory receiving one sub-directory per dataset.
+
+        file_format : str (optional, Default='parquet')
+            Either `'parquet'` or `'arrow'`, for Arrow IPC files.
+
+        partition_by : str (optional, Default=None)
+            The field the files are partitioned by, for example
+            `'record_fiscal_year'` or `'record_date'`.
+
+        page_size : Union[int, str] (optional, Default='auto')
+            The page size of the requests, see `Paginator.iter_pages`.
+
+        max_rows_per_file : int (optional, Default=0)
+            Starts a new file past this many rows, 0 for no limit.
+
+        ### Usage
+        ----
+            >>> dataset_exporter = DatasetExporter(directory='exports', partition_by='record_fiscal_year')
+            >>> dataset_exporter.export_service(treasury_client.monthly_treasury_statements())
+        """
+
+        if file_format not in FORMATS:
+            raise ValueError(
+                'Unknown file format `{file_format}`, use one of {formats}.'.format(
+                    file_format=file_format,
+                    formats=list(FORMATS)
+                )
+            )
+
+        if pyarrow is None:
+            raise ImportError(
+                'Exporting datasets requires `pyarrow`, install it with '
+                '`pip install us-federal-treasury-python-api[arrow]`.'
+            )
+
+        self.directory = pathlib.Path(directory)
+        self.file_format = file_format
+        self.partition_by = partition_by
+        self.page_size = page_size
+        self.max_rows_per_file = max_rows_per_file
+
+    def __repr__(self) -> str:
+        """String representation of the `DatasetExporter` object."""
+
+        return '<FederalTreasuryClient.DatasetExporter (directory={directory}, file_format={file_format})>'.format(
+            directory=self.directory,
+            file_format=self.file_format
+        )
+
+    def export(self, method: Callable, **kwargs) -> ExportResult:
+        """Writes every record of one endpoint to files.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method, for example `other_data_service.debt_to_penny`.
+
+        **kwargs :
+            The arguments of the endpoint method, `fields`, `sort` and `filters`.
+
+        ### Returns
+        ----
+        ExportResult:
+            Where the dataset was written, and how many rows.
+
+        ### Usage
+        ----
+            >>> dataset_exporter.export(treasury_client.other_data().debt_to_penny)
+            ExportResult(dataset='other_data__debt_to_penny', ..., rows=7145, files=[...])
+        """
+
+        dataset = dataset_name(method=method)
+        endpoint = resolve_request(method, **kwargs).endpoint
+
+        if self.partition_by and kwargs.get('fields') and self.partition_by not in kwargs['fields']:
+            raise ValueError(
+                'The partition field `{field}` is not one of the requested fields.'.format(field=self.partition_by)
+            )
+
+        path = self.directory.joinpath(dataset)
+
+        kwargs.setdefault('page_size', self.page_size)
+
+        batches = self._iter_batches(pages=Paginator().iter_pages(method, **kwargs))
+        first_batch = next(batches, None)
+
+        if first_batch is None:
+            logging.info('EXPORT: {dataset} has no records'.format(dataset=dataset))
+            return ExportResult(dataset=dataset, endpoint=endpoint, path=str(path), rows=0, files=[])
+
+        schema = first_batch.schema
+        files = []
+        rows = 0
+
+        def count_rows(batch: 'pyarrow.RecordBatch') -> 'pyarrow.RecordBatch':
+            nonlocal rows
+            rows += batch.num_rows
+            return batch
+
+        pyarrow.dataset.write_dataset(
+            data=(count_rows(batch) for batch in chain([first_batch], self._conform(batches, schema))),
+            base_dir=str(path),
+            schema=schema,
+            format=FORMATS[self.file_format],
+            partitioning=[self._partition_field(schema=schema)] if self.partition_by else None,
+            partitioning_flavor='hive' if self.partition_by else None,
+            basename_template='part-{i}.' + self.file_format,
+            existing_data_behavior='delete_matching',
+            max_rows_per_file=self.max_rows_per_file,
+            max_rows_per_group=min(self.max_rows_per_file or 1024 * 1024, 1024 * 1024),
+            file_visitor=lambda written_file: files.append(written_file.path)
+        )
+
+        result = ExportResult(dataset=dataset, endpoint=endpoint, path=str(path), rows=rows, files=sorted(files))
+
+        logging.info('EXPORT: {result}'.format(result=result))
+
+        return result
+
+    def export_service(self, service: object, **kwargs) -> List[ExportResult]:
+        """Writes every dataset of a service to files.
+
+        ### Parameters
+        ----
+        service : object
+            A service object, for example `treasury_client.monthly_treasury_statements()`.
+
+        **kwargs :
+            The arguments passed to every endpoint method.
+
+        ### Returns
+        ----
+        List[ExportResult]:
+            The result of each dataset.
+        """
+
+        return [
+            self.export(method, **kwargs)
+            for method in endpoint_methods(service=service)
+        ]
+
+    def _iter_batches(self, pages: Iterator[dict]) -> Iterator['pyarrow.RecordBatch']:
+        """Turns each page into a record batch, adding the partition column of date fields."""
+
+        data_types = None
+        first_page = True
+
+        for content in pages:
+
+            data_types = data_types or (content.get('meta') or {}).get('dataTypes')
+
+            if not content.get('data'):
+                continue
+
+            table = to_arrow(source=ColumnBuilder(data_types=data_types).append(content=content))
+
+            if first_page and self.partition_by and self.partition_by not in table.schema.names:
+                raise ValueError(
+                    'The partition field `{field}` is not a field of the dataset, its fields are {fields}.'.format(
+                        field=self.partition_by,
+                        fields=table.schema.names
+                    )
+                )
+
+            first_page = False
+
+            if self.partition_by in table.schema.names and pyarrow.types.is_date(table.schema.field(self.partition_by).type):
+                table = table.append_column(
+                    self._year_field(),
+                    pyarrow.compute.year(table.column(self.partition_by)).cast(pyarrow.int32())
+                )
+
+            yield from table.to_batches()
+
+    @staticmethod
+    def _conform(
+        batches: Iterator['pyarrow.RecordBatch'],
+        schema: 'pyarrow.Schema'
+    ) -> Iterator['pyarrow.RecordBatch']:
+        """Casts the batches to the schema of the first one, a page may lack values that set a type."""
+
+        for batch in batches:
+
+            if not batch.schema.equals(schema):
+
+                table = pyarrow.Table.from_batches([batch])
+
+                # Fields missing from this page are filled with nulls.
+                for field in schema:
+                    if field.name not in table.schema.names:
+                        table = table.append_column(field.name, pyarrow.nulls(table.num_rows, type=field.type))
+
+                batch = table.select(schema.names).cast(schema).to_batches()[0]
+
+            yield batch
+
+    def _partition_field(self, schema: 'pyarrow.Schema') -> str:
+        """The column the files are partitioned by."""
+
+        if self._year_field() in schema.names:
+            return self._year_field()
+
+        return self.partition_by
+
+    def _year_field(self) -> str:
+        """The column holding the year of a date partition field."""
+
+        return '{field}_year'.format(field=self.partition_by)
@@ -0,0 +1,169 @@
+from typing import Dict
+from typing import Union
+from datetime import date
+
+from treasury.columns import NULL_ORDINAL
+from treasury.columns import ColumnBuilder
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# The ordinal of 1970-01-01, where `datetime64` and `date32` days start.
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def column_builder(source: Union[Dict, ColumnBuilder]) -> ColumnBuilder:
+    """Turns the result of an endpoint method into a `ColumnBuilder`.
+
+    ### Parameters
+    ----
+    source : Union[Dict, ColumnBuilder]
+        A page returned by an endpoint method, or a `ColumnBuilder`
+        holding several pages.
+
+    ### Returns
+    ----
+    ColumnBuilder:
+        The columns of the records.
+    """
+
+    if isinstance(source, ColumnBuilder):
+        return source
+
+    if isinstance(source, dict) and 'data' in source:
+        return ColumnBuilder().append(content=source)
+
+    raise TypeError(
+        'Expected a page returned by an endpoint method or a `ColumnBuilder`, got `{kind}`.'.format(
+            kind=type(source).__name__
+        )
+    )
+
+
+def to_dataframe(source: Union[Dict, ColumnBuilder]) -> 'pandas.DataFrame':
+    """Builds a `pandas.DataFrame` with the dtypes of the `meta['dataTypes']`.
+
+    ### Overview
+    ----
+    Each column is copied out of the typed arrays of a `ColumnBuilder`,
+    so numbers arrive as `float64` and `int64`, dates as `datetime64[s]`
+    with `NaT` for missing ones, and strings as the `string` dtype,
+    without going through `object` columns and `astype` calls. Dates
+    use seconds since `datetime64[ns]` only reaches from 1677 to 2262.
+
+    ### Parameters
+    ----
+    source : Union[Dict, ColumnBuilder]
+        A page returned by an endpoint method, or a `ColumnBuilder`
+        holding several pages, see `FederalTreasuryClient.fetch_dataframe`.
+
+    ### Returns
+    ----
+    pandas.DataFrame:
+        One column per field.
+
+    ### Usage
+    ----
+        >>> other_data_service = treasury_client.other_data()
+        >>> debt_frame = to_dataframe(other_data_service.debt_to_penny(page_size=1000))
+    """
+
+    if pandas is None or numpy is None:
+        raise ImportError(
+            '`to_dataframe` requires `pandas` and `numpy`, install them with '
+            '`pip install us-federal-treasury-python-api[pandas]`.'
+        )
+
+    builder = column_builder(source=source)
+    series = {}
+
+    for field, column in builder.columns.items():
+
+        kind = builder.kinds[field]
+
+        if kind == 'float':
+            series[field] = numpy.frombuffer(column, dtype='float64').copy()
+        elif kind == 'integer':
+            series[field] = numpy.frombuffer(column, dtype='int64').copy()
+        elif kind == 'date':
+            series[field] = _datetimes(column=column)
+        else:
+            series[field] = pandas.array(column, dtype='string')
+
+    return pandas.DataFrame(series, copy=False)
+
+
+def to_arrow(source: Union[Dict, ColumnBuilder]) -> 'pyarrow.Table':
+    """Builds a `pyarrow.Table` with the types of the `meta['dataTypes']`.
+
+    ### Overview
+    ----
+    Numbers become `float64` and `int64` arrays, dates `date32` arrays
+    and strings `string` arrays, missing values are nulls. The number
+    columns share the memory of the `ColumnBuilder`, which can no
+    longer be appended to while the table is alive.
+
+    ### Parameters
+    ----
+    source : Union[Dict, ColumnBuilder]
+        A page returned by an endpoint method, or a `ColumnBuilder`
+        holding several pages, see `FederalTreasuryClient.fetch_arrow`.
+
+    ### Returns
+    ----
+    pyarrow.Table:
+        One column per field.
+
+    ### Usage
+    ----
+        >>> other_data_service = treasury_client.other_data()
+        >>> debt_table = to_arrow(other_data_service.debt_to_penny(page_size=1000))
+    """
+
+    if pyarrow is None or numpy is None:
+        raise ImportError(
+            '`to_arrow` requires `pyarrow` and `numpy`, install them with '
+            '`pip install us-federal-treasury-python-api[arrow]`.'
+        )
+
+    builder = column_builder(source=source)
+    arrays = []
+
+    for field, column in builder.columns.items():
+
+        kind = builder.kinds[field]
+
+        if kind == 'float':
+            arrays.append(pyarrow.array(numpy.frombuffer(column, dtype='float64'), from_pandas=True))
+        elif kind == 'integer':
+            arrays.append(pyarrow.array(numpy.frombuffer(column, dtype='int64')))
+        elif kind == 'date':
+            ordinals = numpy.frombuffer(column, dtype='int32')
+            days = pyarrow.array(ordinals - EPOCH_ORDINAL, mask=ordinals == NULL_ORDINAL)
+            arrays.append(days.cast(pyarrow.date32()))
+        else:
+            arrays.append(pyarrow.array(column, type=pyarrow.string()))
+
+    return pyarrow.Table.from_arrays(arrays, names=list(builder.columns))
+
+
+def _datetimes(column: object) -> 'numpy.ndarray':
+    """Turns a column of date ordinals into `datetime64[s]` values, `NaT` for missing dates."""
+
+    ordinals = numpy.frombuffer(column, dtype='int32')
+    values = (ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+    values[ordinals == NULL_ORDINAL] = numpy.datetime64('NaT')
+
+    return values.astype('datetime64[s]')
@@ -0,0 +1,156 @@
+import threading
+
+from typing import Dict
+from typing import Deque
+from collections import deque
+
+from treasury.concurrency import endpoint_family
+
+
+class HedgingPolicy():
+
+    """
+    Overview:
+    ----
+    Decides when a GET request that is slow to answer is sent a second
+    time, a hedge, the first of the two responses being used and the
+    other dropped. The delay before a hedge is the `percentile` of the
+    recent latencies of the endpoint family, so only the slowest
+    requests, the tail, are hedged. The hedges are capped to `budget`
+    of the requests, which bounds the extra load put on the API.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_delay: float = 0.05,
+        max_delay: float = 2.0,
+        budget: float = 0.05,
+        min_samples: int = 20,
+        window: int = 500
+    ) -> None:
+        """Initializes the `HedgingPolicy` object.
+
+        ### Parameters
+        ----
+        percentile : float (optional, Default=0.95)
+            The percentile of the latencies after which a request is hedged.
+
+        min_delay : float (optional, Default=0.05)
+            The shortest number of seconds to wait before hedging.
+
+        max_delay : float (optional, Default=2.0)
+            The longest number of seconds to wait before hedging, also
+            used until `min_samples` latencies of the family are known.
+
+        budget : float (optional, Default=0.05)
+            The largest share of the requests that can be hedged.
+
+        min_samples : int (optional, Default=20)
+            The number of latencies needed to compute the percentile.
+
+        window : int (optional, Default=500)
+            The number of recent latencies kept for each family.
+
+        ### Usage
+        ----
+            >>> treasury_client = FederalTreasuryClient(hedging_policy=HedgingPolicy(percentile=0.9))
+            >>> treasury_client.other_data().debt_to_penny(sort=['-record_date'], page_size=1)
+        """
+
+        if not 0 < percentile < 1:
+            raise ValueError('The percentile must be between 0 and 1.')
+
+        if not 0 <= budget <= 1:
+            raise ValueError('The budget must be between 0 and 1.')
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.min_samples = min_samples
+        self.window = window
+
+        self.requests = 0
+        self.hedges = 0
+
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of the `HedgingPolicy` object."""
+
+        return '<FederalTreasuryClient.HedgingPolicy (percentile={percentile}, requests={requests}, hedges={hedges})>'.format(
+            percentile=self.percentile,
+            requests=self.requests,
+            hedges=self.hedges
+        )
+
+    def delay_for(self, endpoint: str) -> float:
+        """Counts a new request, and returns how long to wait for it before hedging.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        ### Returns
+        ----
+        float:
+            The number of seconds to wait before sending the hedge.
+        """
+
+        with self._lock:
+
+            self.requests += 1
+            latencies = self._latencies.get(endpoint_family(endpoint=endpoint))
+
+            if latencies is None or len(latencies) < self.min_samples:
+                return self.max_delay
+
+            latencies = sorted(latencies)
+
+        delay = latencies[int(self.percentile * (len(latencies) - 1))]
+
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def try_hedge(self) -> bool:
+        """Takes a hedge from the budget.
+
+        ### Returns
+        ----
+        bool:
+            `True` if the hedge can be sent, `False` if the budget is spent.
+        """
+
+        with self._lock:
+
+            if self.hedges + 1 > self.budget * self.requests:
+                return False
+
+            self.hedges += 1
+
+            return True
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Records the latency of the response used for a request.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        latency : float
+            The number of seconds the request took, from its first send.
+        """
+
+        family = endpoint_family(endpoint=endpoint)
+
+        with self._lock:
+
+            latencies = self._latencies.get(family)
+
+            if latencies is None:
+                latencies = self._latencies[family] = deque(maxlen=self.window)
+
+            latencies.append(latency)
@@ -0,0 +1,197 @@
+import threading
+
+from typing import Dict
+from typing import List
+from typing import FrozenSet
+
+
+class StringInterner():
+
+    """
+    Overview:
+    ----
+    Makes the repeated strings of the records share one object. Fields
+    like `security_type_desc`, `country_currency_desc` or `record_date`
+    take a handful of values across thousands of records, yet every
+    record decoded from JSON holds its own copy of them.
+
+    The first `sample_size` records of an endpoint are profiled, with
+    every string field encoded, and the fields holding at most
+    `max_distinct` values, and no more than `max_ratio` of the records
+    sampled, are kept as categorical. Afterwards only the categorical
+    fields of the endpoint are encoded, each through a dictionary of
+    its values, which hands back the object already stored for a
+    value. A field whose dictionary outgrows `max_distinct` anyway
+    stops being encoded and its dictionary is dropped.
+    """
+
+    def __init__(self, max_distinct: int = 1024, max_ratio: float = 0.5, sample_size: int = 1000) -> None:
+        """Initializes the `StringInterner` object.
+
+        ### Parameters
+        ----
+        max_distinct : int (optional, Default=1024)
+            The largest number of distinct values of a categorical field.
+
+        max_ratio : float (optional, Default=0.5)
+            The largest share of distinct values among the records
+            sampled for a field to be categorical.
+
+        sample_size : int (optional, Default=1000)
+            The number of records of an endpoint profiled before its
+            categorical fields are picked.
+
+        ### Usage
+        ----
+            >>> treasury_client = FederalTreasuryClient(string_interner=StringInterner())
+            >>> receivables_service = treasury_client.treasury_reports_on_receivables()
+            >>> records = treasury_client.fetch_all(receivables_service.full_data)
+            >>> records[0]['agency_nm'] is records[1]['agency_nm']
+            True
+        """
+
+        self.max_distinct = max_distinct
+        self.max_ratio = max_ratio
+        self.sample_size = sample_size
+
+        # The values of each field, by endpoint.
+        self.dictionaries: Dict[str, Dict[str, Dict[str, str]]] = {}
+
+        # The categorical fields of each endpoint once profiled.
+        self.categorical: Dict[str, FrozenSet[str]] = {}
+
+        self._sampled: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of the `StringInterner` object."""
+
+        return '<FederalTreasuryClient.StringInterner (endpoints={endpoints}, max_distinct={max_distinct})>'.format(
+            endpoints=len(self.dictionaries),
+            max_distinct=self.max_distinct
+        )
+
+    def categorical_fields(self, endpoint: str) -> FrozenSet[str]:
+        """The fields of an endpoint whose values are encoded, empty while it is profiled.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API URL endpoint.
+
+        ### Returns
+        ----
+        FrozenSet[str]:
+            The categorical fields.
+        """
+
+        return self.categorical.get(endpoint, frozenset())
+
+    def decode(self, content: Dict, endpoint: str) -> Dict:
+        """Encodes the strings of the records of a page, in place.
+
+        ### Parameters
+        ----
+        content : Dict
+            A decoded page of the API, with its `data`.
+
+        endpoint : str
+            The API URL endpoint of the page, each endpoint is profiled
+            on its own.
+
+        ### Returns
+        ----
+        Dict:
+            The same page, its repeated strings now shared.
+        """
+
+        records = content.get('data') if isinstance(content, dict) else None
+
+        if not records or not isinstance(records, list):
+            return content
+
+        self.decode_records(records=records, endpoint=endpoint)
+
+        return content
+
+    def decode_records(self, records: List[dict], endpoint: str) -> None:
+        """Encodes the strings of records, in place.
+
+        ### Parameters
+        ----
+        records : List[dict]
+            The records of one page.
+
+        endpoint : str
+            The API URL endpoint of the records.
+        """
+
+        dictionaries = self.dictionaries.get(endpoint)
+
+        if dictionaries is None:
+            with self._lock:
+                dictionaries = self.dictionaries.setdefault(endpoint, {})
+
+        if endpoint in self.categorical:
+            fields = self.categorical[endpoint]
+        else:
+            fields = [field for field, value in records[0].items() if type(value) is str]
+
+        for field in fields:
+
+            values = dictionaries.get(field)
+
+            if values is None:
+                values = dictionaries.setdefault(field, {})
+
+            shared = values.setdefault
+
+            for record in records:
+
+                value = record.get(field)
+
+                if type(value) is str:
+                    record[field] = shared(value, value)
+
+        if endpoint not in self.categorical:
+            self._profile(endpoint=endpoint, count=len(records))
+        else:
+            self._demote(endpoint=endpoint)
+
+    def _profile(self, endpoint: str, count: int) -> None:
+        """Counts the records sampled, and picks the categorical fields once there are enough."""
+
+        with self._lock:
+
+            sampled = self._sampled[endpoint] = self._sampled.get(endpoint, 0) + count
+
+            if sampled < self.sample_size or endpoint in self.categorical:
+                return
+
+            dictionaries = self.dictionaries[endpoint]
+            fields = frozenset(
+                field for field, values in dictionaries.items()
+                if len(values) <= self.max_distinct and len(values) <= self.max_ratio * sampled
+            )
+
+            for field in list(dictionaries):
+                if field not in fields:
+                    del dictionaries[field]
+
+            self.categorical[endpoint] = fields
+
+    def _demote(self, endpoint: str) -> None:
+        """Stops encoding the fields whose dictionary grew past `max_distinct`."""
+
+        dictionaries = self.dictionaries[endpoint]
+        overgrown = [field for field, values in dictionaries.items() if len(values) > self.max_distinct]
+
+        if not overgrown:
+            return
+
+        with self._lock:
+
+            for field in overgrown:
+                dictionaries.pop(field, None)
+
+            self.categorical[endpoint] = self.categorical[endpoint].difference(overgrown)
@@ -0,0 +1,1414 @@
+import json
+import math
+import time
+import asyncio
+import logging
+
+from typing import Dict
+from typing import List
+from typing import Union
+from typing import Callable
+from typing import Iterator
+from typing import AsyncIterator
+from urllib.parse import parse_qs
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
+
+from treasury.columns import Column
+from treasury.columns import ColumnBuilder
+from treasury.csv_stream import CSV_FORMAT
+from treasury.csv_stream import WIRE_FORMATS
+from treasury.records import RecordTupleCollector
+
+
+class EndpointRequest():
+
+    """
+    Overview:
+    ----
+    Describes the request an endpoint method makes, the HTTP method,
+    the endpoint and the URL params, without sending it.
+    """
+
+    def __init__(self, method: str, endpoint: str, params: dict = None) -> None:
+        """Initializes the `EndpointRequest` object.
+
+        ### Parameters
+        ----
+        method : str
+            The Request method.
+
+        endpoint : str
+            The API URL endpoint.
+
+        params : dict (optional, Default=None)
+            The URL params for the request.
+        """
+
+        self.method = method
+        self.endpoint = endpoint
+        self.params = dict(params or {})
+
+    def __repr__(self) -> str:
+        """String representation of the `EndpointRequest` object."""
+
+        str_representation = '<FederalTreasuryClient.EndpointRequest (method={method}, endpoint={endpoint})>'.format(
+            method=self.method,
+            endpoint=self.endpoint
+        )
+
+        return str_representation
+
+    @property
+    def page_number(self) -> int:
+        """The page number requested."""
+
+        return int(self.params.get('page[number]', 1))
+
+    @property
+    def page_size(self) -> int:
+        """The page size requested."""
+
+        return int(self.params.get('page[size]', 100))
+
+    def with_page(self, page_number: int, page_size: int = None) -> dict:
+        """Returns a copy of the URL params pointing at another page.
+
+        ### Parameters
+        ----
+        page_number : int
+            The page number to request.
+
+        page_size : int (optional, Default=None)
+            The page size to request, defaults to the current one.
+
+        ### Returns
+        ----
+        dict:
+            The new URL params.
+        """
+
+        params = self.params.copy()
+        params['page[number]'] = page_number
+        params['page[size]'] = page_size or self.page_size
+
+        return params
+
+
+class RequestRecorder():
+
+    """
+    Overview:
+    ----
+    Stands in for the `TreasurySession` so an endpoint method can be
+    called to find out which request it would make, without sending it.
+    """
+
+    def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict = None,
+        data: dict = None,
+        json_payload: dict = None
+    ) -> EndpointRequest:
+        """Records the request instead of sending it."""
+
+        return EndpointRequest(method=method, endpoint=endpoint, params=params)
+
+
+def resolve_request(method: Callable, **kwargs) -> EndpointRequest:
+    """Finds the request a bound endpoint method would make.
+
+    ### Parameters
+    ----
+    method : Callable
+        A bound endpoint method of a service, for example
+        `treasury_client.other_data().debt_to_penny`.
+
+    **kwargs :
+        The arguments of the endpoint method, `fields`, `sort`,
+        `filters`, `page_number` and `page_size`.
+
+    ### Returns
+    ----
+    EndpointRequest:
+        The request the endpoint method would make.
+
+    ### Usage
+    ----
+        >>> other_data_service = treasury_client.other_data()
+        >>> resolve_request(other_data_service.debt_to_penny, page_size=10)
+    """
+
+    service = method.__self__
+    recorder_service = type(service)(session=RequestRecorder())
+
+    return getattr(recorder_service, method.__name__)(**kwargs)
+
+
+def next_page_number(content: Dict, page_number: int) -> int:
+    """Reads the next page number from the `links` of a response.
+
+    ### Parameters
+    ----
+    content : Dict
+        A page returned by an endpoint.
+
+    page_number : int
+        The page number of `content`, used when the response has no
+        `links` block and `meta['total-pages']` has to be used instead.
+
+    ### Returns
+    ----
+    int:
+        The next page number, or `None` if this was the last page.
+    """
+
+    links = content.get('links') or {}
+
+    if links.get('next'):
+
+        query = parse_qs(links['next'].lstrip('&?'))
+
+        if 'page[number]' in query:
+            return int(query['page[number]'][0])
+
+    elif 'next' in links:
+        return None
+
+    # Fall back to the `meta` block when `links` can't be read.
+    total_pages = (content.get('meta') or {}).get('total-pages')
+
+    if total_pages is not None and page_number < int(total_pages):
+        return page_number + 1
+
+    return None
+
+
+AUTO_PAGE_SIZE = 'auto'
+
+
+class PageSizePolicy():
+
+    """
+    Overview:
+    ----
+    Picks the page size of a full pull. A probe request for a single
+    record tells how many records there are and roughly how large each
+    one is, and the page size is set as large as the API, the response
+    size ceiling and the latency ceiling allow, to minimize round trips.
+    """
+
+    def __init__(
+        self,
+        max_page_size: int = 10000,
+        min_page_size: int = 100,
+        max_latency: float = 10.0,
+        max_page_bytes: int = 32 * 1024 * 1024
+    ) -> None:
+        """Initializes the `PageSizePolicy` object.
+
+        ### Parameters
+        ----
+        max_page_size : int (optional, Default=10000)
+            The largest page size accepted by the API.
+
+        min_page_size : int (optional, Default=100)
+            The smallest page size the policy shrinks to.
+
+        max_latency : float (optional, Default=10.0)
+            The number of seconds a page may take. Slower pages halve the
+            page size, pages faster than a quarter of it double it again.
+
+        max_page_bytes : int (optional, Default=32MB)
+            The largest response body, in bytes, a page should have.
+
+        ### Usage
+        ----
+            >>> policy = PageSizePolicy(max_latency=2.0)
+            >>> treasury_client.fetch_all(other_data_service.saving_bonds_value, page_size=policy)
+        """
+
+        self.max_page_size = max_page_size
+        self.min_page_size = min(min_page_size, max_page_size)
+        self.max_latency = max_latency
+        self.max_page_bytes = max_page_bytes
+
+    def __repr__(self) -> str:
+        """String representation of the `PageSizePolicy` object."""
+
+        str_representation = '<FederalTreasuryClient.PageSizePolicy (max_page_size={size}, max_latency={latency})>'.format(
+            size=self.max_page_size,
+            latency=self.max_latency
+        )
+
+        return str_representation
+
+    def largest_page_size(self, record_bytes: int) -> int:
+        """The largest page size allowed for records of `record_bytes` bytes."""
+
+        return max(
+            self.min_page_size,
+            min(self.max_page_size, self.max_page_bytes // max(1, record_bytes))
+        )
+
+    def plan(self, probe: Dict) -> 'PagePlan':
+        """Plans a full pull from the response to a single record probe.
+
+        ### Parameters
+        ----
+        probe : Dict
+            The first page of the endpoint, requested with a page size of 1.
+
+        ### Returns
+        ----
+        PagePlan:
+            The plan used to walk every page.
+        """
+
+        records = probe.get('data') or []
+        total_count = int((probe.get('meta') or {}).get('total-count', len(records)))
+        # Typed records hold dates and decimals, measured as the strings they came from.
+        record_bytes = len(json.dumps(records[0], default=str)) if records else 1
+
+        page_size = min(self.largest_page_size(record_bytes=record_bytes), max(1, total_count))
+
+        return PagePlan(
+            policy=self,
+            page_size=page_size,
+            total_count=total_count,
+            record_bytes=record_bytes
+        )
+
+    def adjust(self, page_size: int, offset: int, latency: float, record_bytes: int) -> int:
+        """Adjusts the page size after a page took `latency` seconds.
+
+        ### Overview
+        ----
+        The API pages by number, so a new page size must divide the number
+        of records already read, `offset`, to continue without gaps.
+
+        ### Parameters
+        ----
+        page_size : int
+            The current page size.
+
+        offset : int
+            The number of records already read.
+
+        latency : float
+            The number of seconds the last page took.
+
+        record_bytes : int
+            The approximate size of one record, in bytes.
+
+        ### Returns
+        ----
+        int:
+            The page size of the next page.
+        """
+
+        if latency > self.max_latency and page_size > self.min_page_size:
+            candidates = range(max(self.min_page_size, page_size // 2), self.min_page_size - 1, -1)
+        elif latency < self.max_latency / 4:
+            largest = min(self.largest_page_size(record_bytes=record_bytes), page_size * 2)
+            candidates = range(largest, page_size, -1)
+        else:
+            return page_size
+
+        for candidate in candidates:
+            if offset % candidate == 0:
+                return candidate
+
+        return page_size
+
+
+class PagePlan():
+
+    """
+    Overview:
+    ----
+    Tracks the progress of a full pull planned by a `PageSizePolicy`,
+    by the number of records read rather than by page number, so the
+    page size can change between pages.
+    """
+
+    def __init__(self, policy: PageSizePolicy, page_size: int, total_count: int, record_bytes: int) -> None:
+        """Initializes the `PagePlan` object.
+
+        ### Parameters
+        ----
+        policy : PageSizePolicy
+            The policy that planned the pull.
+
+        page_size : int
+            The page size of the first page.
+
+        total_count : int
+            The number of records of the endpoint.
+
+        record_bytes : int
+            The approximate size of one record, in bytes.
+        """
+
+        self.policy = policy
+        self.page_size = page_size
+        self.total_count = total_count
+        self.record_bytes = record_bytes
+        self.offset = 0
+
+    def __repr__(self) -> str:
+        """String representation of the `PagePlan` object."""
+
+        str_representation = '<FederalTreasuryClient.PagePlan (page_size={size}, offset={offset}, total_count={total})>'.format(
+            size=self.page_size,
+            offset=self.offset,
+            total=self.total_count
+        )
+
+        return str_representation
+
+    @property
+    def page_number(self) -> int:
+        """The page number of the next page."""
+
+        return self.offset // self.page_size + 1
+
+    @property
+    def done(self) -> bool:
+        """`True` once every record has been read."""
+
+        return self.offset >= self.total_count
+
+    def advance(self, content: Dict, latency: float) -> None:
+        """Records a page that was read and picks the next page size.
+
+        ### Parameters
+        ----
+        content : Dict
+            The page that was read.
+
+        latency : float
+            The number of seconds the page took.
+        """
+
+        count = len(content.get('data') or [])
+        self.offset += count
+        self.total_count = int((content.get('meta') or {}).get('total-count', self.total_count))
+
+        # A short page is the last one.
+        if count < self.page_size:
+            self.total_count = self.offset
+            return
+
+        self.page_size = self.policy.adjust(
+            page_size=self.page_size,
+            offset=self.offset,
+            latency=latency,
+            record_bytes=self.record_bytes
+        )
+
+
+class RecordCollector():
+
+    """
+    Overview:
+    ----
+    Collects the records of pages into one list, the row counterpart
+    of the `ColumnBuilder`.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the `RecordCollector` object."""
+
+        self.records: List[dict] = []
+
+    def append(self, content: Dict) -> 'RecordCollector':
+        """Appends the records of a page."""
+
+        self.records.extend(content.get('data') or [])
+
+        return self
+
+    def build(self) -> List[dict]:
+        """Returns the records collected so far."""
+
+        return self.records
+
+
+class PageReorderBuffer():
+
+    """
+    Overview:
+    ----
+    Hands pages arriving in any order to a collector in page order. A
+    page is held only until every page before it has arrived, then the
+    whole contiguous run is appended and released, so memory holds the
+    pages past the first gap instead of the whole dataset.
+    """
+
+    def __init__(self, collector: Union[RecordCollector, ColumnBuilder], page_number: int = 1) -> None:
+        """Initializes the `PageReorderBuffer` object.
+
+        ### Parameters
+        ----
+        collector : Union[RecordCollector, ColumnBuilder]
+            Receives each page through its `append` method.
+
+        page_number : int (optional, Default=1)
+            The number of the first page expected.
+        """
+
+        self.collector = collector
+        self.next_page_number = page_number
+        self.pending: Dict[int, Dict] = {}
+        self.pages_done = 0
+
+    def __repr__(self) -> str:
+        """String representation of the `PageReorderBuffer` object."""
+
+        return '<FederalTreasuryClient.PageReorderBuffer (next_page_number={next_page_number}, pending={pending})>'.format(
+            next_page_number=self.next_page_number,
+            pending=len(self.pending)
+        )
+
+    def add(self, page_number: int, content: Dict) -> None:
+        """Adds a page, appending every page now contiguous to the collector.
+
+        ### Parameters
+        ----
+        page_number : int
+            The number of the page.
+
+        content : Dict
+            The content of the page.
+        """
+
+        self.pending[page_number] = content
+        self.pages_done += 1
+
+        while self.next_page_number in self.pending:
+            self.collector.append(self.pending.pop(self.next_page_number))
+            self.next_page_number += 1
+
+
+class Paginator():
+
+    """
+    Overview:
+    ----
+    Walks every page of an endpoint by following the `links.next`
+    field of each response, so records can be consumed lazily with
+    bounded memory instead of looping over `page_number` by hand.
+    """
+
+    def __init__(self, session: object = None) -> None:
+        """Initializes the `Paginator` object.
+
+        ### Parameters
+        ----
+        session : FederalTreasurySession (optional, Default=None)
+            The session used to send the requests, defaults to the
+            session of the service the endpoint method belongs to.
+
+        ### Usage
+        ----
+            >>> treasury_client = FederalTreasuryClient()
+            >>> paginator = Paginator(session=treasury_client.treasury_session)
+        """
+
+        self.treasury_session = session
+
+    def __repr__(self) -> str:
+        """String representation of the `FederalTreasuryClient.Paginator` object."""
+
+        # define the string representation
+        str_representation = '<FederalTreasuryClient.Paginator (active=True, connected=True)>'
+
+        return str_representation
+
+    def _session_for(self, method: Callable) -> object:
+        """Returns the session used to send the requests of `method`."""
+
+        return self.treasury_session or method.__self__.treasury_session
+
+    def iter_pages(self, method: Callable, **kwargs) -> Iterator[Dict]:
+        """Yields every page of an endpoint, one request at a time.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method, for example `other_data_service.debt_to_penny`.
+
+        **kwargs :
+            The arguments of the endpoint method. `page_number` sets the
+            first page requested. `page_size` may also be `'auto'`, or a
+            `PageSizePolicy`, to let the page size adapt to the endpoint,
+            in which case the pull always starts at the first record.
+
+        ### Returns
+        ----
+        Iterator[Dict]:
+            The content of each page.
+
+        ### Usage
+        ----
+            >>> other_data_service = treasury_client.other_data()
+            >>> for page in paginator.iter_pages(other_data_service.debt_to_penny):
+                    print(page['meta']['count'])
+        """
+
+        session = self._session_for(method=method)
+        policy = self._pop_page_size_policy(kwargs=kwargs)
+        request = resolve_request(method, **kwargs)
+
+        if policy is not None:
+
+            plan = self._probe(session=session, request=request, policy=policy)
+
+            while not plan.done:
+
+                started = time.perf_counter()
+                content = session.make_request(
+                    method=request.method,
+                    endpoint=request.endpoint,
+                    params=request.with_page(page_number=plan.page_number, page_size=plan.page_size)
+                )
+                plan.advance(content=content, latency=time.perf_counter() - started)
+
+                yield content
+
+            return
+
+        page_number = request.page_number
+
+        while page_number is not None:
+
+            content = session.make_request(
+                method=request.method,
+                endpoint=request.endpoint,
+                params=request.with_page(page_number=page_number)
+            )
+
+            yield content
+
+            page_number = next_page_number(content=content, page_number=page_number)
+
+    @staticmethod
+    def _pop_page_size_policy(kwargs: dict) -> Union[PageSizePolicy, None]:
+        """Takes an adaptive `page_size` out of the endpoint arguments.
+
+        ### Parameters
+        ----
+        kwargs : dict
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        Union[PageSizePolicy, None]:
+            The policy to use, or `None` if the page size is fixed.
+        """
+
+        page_size = kwargs.get('page_size')
+
+        if page_size == AUTO_PAGE_SIZE:
+            kwargs.pop('page_size')
+            return PageSizePolicy()
+
+        if isinstance(page_size, PageSizePolicy):
+            return kwargs.pop('page_size')
+
+        return None
+
+    @staticmethod
+    def _probe(session: object, request: EndpointRequest, policy: PageSizePolicy) -> PagePlan:
+        """Requests a single record to plan an adaptive pull.
+
+        ### Parameters
+        ----
+        session : FederalTreasurySession
+            The session used to send the request.
+
+        request : EndpointRequest
+            The request of the endpoint method.
+
+        policy : PageSizePolicy
+            The policy planning the pull.
+
+        ### Returns
+        ----
+        PagePlan:
+            The plan used to walk every page.
+        """
+
+        probe = session.make_request(
+            method=request.method,
+            endpoint=request.endpoint,
+            params=request.with_page(page_number=1, page_size=1)
+        )
+
+        return Paginator._plan(probe=probe, request=request, policy=policy)
+
+    @staticmethod
+    async def _aprobe(session: object, request: EndpointRequest, policy: PageSizePolicy) -> PagePlan:
+        """Requests a single record to plan an adaptive pull, asynchronously."""
+
+        probe = await session.make_request(
+            method=request.method,
+            endpoint=request.endpoint,
+            params=request.with_page(page_number=1, page_size=1)
+        )
+
+        return Paginator._plan(probe=probe, request=request, policy=policy)
+
+    @staticmethod
+    def _plan(probe: Dict, request: EndpointRequest, policy: PageSizePolicy) -> PagePlan:
+        """Plans an adaptive pull from its probe and logs the page size."""
+
+        plan = policy.plan(probe=probe)
+
+        logging.info(
+            'PAGE SIZE: {size} for {count} records of {endpoint}'.format(
+                size=plan.page_size,
+                count=plan.total_count,
+                endpoint=request.endpoint
+            )
+        )
+
+        return plan
+
+    def iter_csv_pages(self, method: Callable, **kwargs) -> Iterator[Dict]:
+        """Yields every page of an endpoint, requested and streamed as CSV.
+
+        ### Overview
+        ----
+        A CSV body leaves out the keys JSON repeats in every record, so it
+        is much smaller, but it carries no `meta`. A probe for a single
+        record in JSON fetches the `meta` of the dataset, which is given
+        to every page, and tells how many pages to request. A header row
+        holding the `labels` of the fields is mapped back to the fields.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method, for example `other_data_service.debt_to_penny`.
+
+        **kwargs :
+            The arguments of the endpoint method, `page_size='auto'`
+            requests the largest pages the API allows.
+
+        ### Returns
+        ----
+        Iterator[Dict]:
+            The content of each page, with its `data` and `meta`.
+
+        ### Usage
+        ----
+            >>> revenue_service = treasury_client.revenue_and_payments()
+            >>> for content in paginator.iter_csv_pages(revenue_service.revenue_collection, page_size=10000):
+                    print(len(content['data']))
+        """
+
+        session = self._session_for(method=method)
+        request = self._csv_request(method=method, kwargs=kwargs)
+
+        probe = session.make_request(
+            method=request.method,
+            endpoint=request.endpoint,
+            params=dict(request.with_page(page_number=1, page_size=1), format='json')
+        )
+        meta = self._probe_meta(probe=probe)
+        page_number = request.page_number
+
+        while True:
+
+            stream = session.make_request(
+                method=request.method,
+                endpoint=request.endpoint,
+                params=request.with_page(page_number=page_number),
+                stream=True
+            )
+
+            with stream:
+                stream.parser.rename(renames=self._label_renames(meta=meta))
+                records = list(stream)
+
+            content = self._csv_content(session=session, records=records, meta=meta, request=request)
+
+            yield content
+
+            if len(records) < request.page_size or page_number >= content['meta'].get('total-pages', math.inf):
+                return
+
+            page_number += 1
+
+    @staticmethod
+    def _csv_request(method: Callable, kwargs: dict) -> EndpointRequest:
+        """Resolves the request of a CSV pull, `page_size='auto'` asking for the largest pages."""
+
+        policy = Paginator._pop_page_size_policy(kwargs=kwargs)
+        request = resolve_request(method, **kwargs)
+        request.params['format'] = CSV_FORMAT
+
+        if policy is not None:
+            request.params['page[size]'] = policy.max_page_size
+
+        return request
+
+    @staticmethod
+    def _probe_meta(probe: Dict) -> Dict:
+        """The `meta` of a one record probe, its number of pages being the number of records."""
+
+        meta = dict(probe.get('meta') or {})
+
+        if 'total-count' not in meta and 'total-pages' in meta:
+            meta['total-count'] = meta['total-pages']
+
+        return meta
+
+    @staticmethod
+    def _label_renames(meta: Dict) -> Dict[str, str]:
+        """Maps the labels of the fields back to the fields."""
+
+        return {label: field for field, label in (meta.get('labels') or {}).items() if label != field}
+
+    @staticmethod
+    def _csv_content(session: object, records: List[dict], meta: Dict, request: EndpointRequest) -> Dict:
+        """Shapes the records of a CSV page like a JSON page, typing and interning them if the session does."""
+
+        meta = dict(meta, count=len(records))
+        meta.pop('total-pages', None)
+
+        # Without a count from the probe, pages are requested until a short one.
+        if 'total-count' in meta:
+            meta['total-pages'] = max(1, -(-int(meta['total-count']) // request.page_size))
+
+        content = {'data': records, 'meta': meta}
+
+        if getattr(session, 'type_decoder', None) is not None:
+            content = session.type_decoder.decode(content=content, endpoint=request.endpoint)
+
+        if getattr(session, 'string_interner', None) is not None:
+            content = session.string_interner.decode(content=content, endpoint=request.endpoint)
+
+        return content
+
+    def iter_records(self, method: Callable, **kwargs) -> Iterator[dict]:
+        """Yields every record of an endpoint, one at a time.
+
+        ### Overview
+        ----
+        Pages are requested lazily, only once the records of the
+        previous page have been consumed.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method, for example `other_data_service.debt_to_penny`.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        Iterator[dict]:
+            The records of every page.
+
+        ### Usage
+        ----
+            >>> other_data_service = treasury_client.other_data()
+            >>> for record in paginator.iter_records(other_data_service.debt_to_penny):
+                    print(record['tot_pub_debt_out_amt'])
+        """
+
+        for content in self.iter_pages(method, **kwargs):
+            yield from content.get('data', [])
+
+    def fetch_all(
+        self,
+        method: Callable,
+        parallel: int = 1,
+        progress: Callable[[int, int], None] = None,
+        as_columns: bool = False,
+        as_tuples: bool = False,
+        wire_format: str = 'json',
+        **kwargs
+    ) -> Union[List[dict], List[tuple], Dict[str, Column]]:
+        """Collects every record of an endpoint into a list.
+
+        ### Overview
+        ----
+        With `parallel` greater than 1, the first page is requested on its
+        own to learn `meta['total-pages']`, then the remaining pages are
+        requested through a pool of `parallel` threads sharing the session's
+        connection pool, and reassembled in page order. Make sure the
+        session's `pool_maxsize` is at least `parallel`.
+
+        With `page_size='auto'` the page size is picked by a `PageSizePolicy`,
+        it keeps adapting to the latency of each page when fetching pages
+        one at a time, and is fixed after the probe when fetching in parallel.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method, for example `other_data_service.debt_to_penny`.
+
+        parallel : int (optional, Default=1)
+            The maximum number of pages requested at the same time.
+
+        progress : Callable[[int, int], None] (optional, Default=None)
+            Called with `(pages_done, total_pages)` each time a page arrives.
+
+        as_columns : bool (optional, Default=False)
+            If `True`, the records are returned as compact typed columns,
+            see `ColumnBuilder`, each page being folded in as it arrives.
+
+        as_tuples : bool (optional, Default=False)
+            If `True`, the records are returned as instances of a compact
+            `namedtuple` type generated for the endpoint, see `record_type`.
+
+        wire_format : str (optional, Default='json')
+            Either `'json'` or `'csv'`, whose pages are smaller on the
+            wire but are requested one at a time, see `iter_csv_pages`.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        Union[List[dict], List[tuple], Dict[str, Column]]:
+            The records of every page, in page order, or their columns.
+
+        ### Usage
+        ----
+            >>> revenue_service = treasury_client.revenue_and_payments()
+            >>> records = paginator.fetch_all(revenue_service.revenue_collection, parallel=16)
+        """
+
+        collector = self._collector_for(method, as_columns=as_columns, as_tuples=as_tuples, **kwargs)
+
+        return self.collect(
+            method,
+            collector=collector,
+            parallel=parallel,
+            progress=progress,
+            wire_format=wire_format,
+            **kwargs
+        ).build()
+
+    @staticmethod
+    def _collector_for(
+        method: Callable,
+        as_columns: bool,
+        as_tuples: bool,
+        **kwargs
+    ) -> Union[RecordCollector, RecordTupleCollector, ColumnBuilder]:
+        """Picks the collector of a `fetch_all` call."""
+
+        if as_columns and as_tuples:
+            raise ValueError('Pick one of `as_columns` and `as_tuples`.')
+
+        if as_columns:
+            return ColumnBuilder()
+
+        if as_tuples:
+            return RecordTupleCollector(endpoint=resolve_request(method, **kwargs).endpoint)
+
+        return RecordCollector()
+
+    def collect(
+        self,
+        method: Callable,
+        collector: Union[RecordCollector, ColumnBuilder],
+        parallel: int = 1,
+        progress: Callable[[int, int], None] = None,
+        wire_format: str = 'json',
+        **kwargs
+    ) -> Union[RecordCollector, ColumnBuilder]:
+        """Appends every page of an endpoint to a collector, in page order.
+
+        ### Overview
+        ----
+        With `parallel` greater than 1, pages are handed to the collector
+        through a `PageReorderBuffer` as soon as every page before them
+        has arrived, and the pages still queued are cancelled if one fails.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method, for example `other_data_service.debt_to_penny`.
+
+        collector : Union[RecordCollector, ColumnBuilder]
+            Receives each page through its `append` method.
+
+        parallel : int (optional, Default=1)
+            The maximum number of pages requested at the same time, see `fetch_all`.
+
+        progress : Callable[[int, int], None] (optional, Default=None)
+            Called with `(pages_done, total_pages)` each time a page arrives.
+
+        wire_format : str (optional, Default='json')
+            Either `'json'` or `'csv'`, whose pages are smaller on the
+            wire but are requested one at a time, see `iter_csv_pages`.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Raises
+        ----
+        ValueError:
+            If the wire format is unknown, or is `'csv'` with `parallel`.
+
+        ### Returns
+        ----
+        Union[RecordCollector, ColumnBuilder]:
+            The collector, holding every page.
+        """
+
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(
+                'Unknown wire format `{wire_format}`, use one of {formats}.'.format(
+                    wire_format=wire_format,
+                    formats=list(WIRE_FORMATS)
+                )
+            )
+
+        if wire_format == CSV_FORMAT and parallel > 1:
+            raise ValueError('CSV pages are requested one at a time, `parallel` must be 1.')
+
+        if parallel <= 1:
+
+            if wire_format == CSV_FORMAT:
+                pages = self.iter_csv_pages(method, **kwargs)
+            else:
+                pages = self.iter_pages(method, **kwargs)
+
+            for pages_done, content in enumerate(pages, start=1):
+                collector.append(content)
+                self._report_progress(
+                    progress=progress,
+                    pages_done=pages_done,
+                    total_pages=max(pages_done, int((content.get('meta') or {}).get('total-pages', 1)))
+                )
+
+            return collector
+
+        session = self._session_for(method=method)
+        policy = self._pop_page_size_policy(kwargs=kwargs)
+        request = resolve_request(method, **kwargs)
+
+        # Pages fetched in parallel share one page size, picked up front.
+        if policy is not None:
+            plan = self._probe(session=session, request=request, policy=policy)
+            request.params['page[size]'] = plan.page_size
+            request.params['page[number]'] = 1
+
+        def fetch_page(page_number: int) -> Dict:
+            return session.make_request(
+                method=request.method,
+                endpoint=request.endpoint,
+                params=request.with_page(page_number=page_number)
+            )
+
+        content = fetch_page(page_number=request.page_number)
+        total_pages = int((content.get('meta') or {}).get('total-pages', 1))
+
+        buffer = PageReorderBuffer(collector=collector, page_number=request.page_number)
+        buffer.add(page_number=request.page_number, content=content)
+        self._report_progress(progress=progress, pages_done=buffer.pages_done, total_pages=total_pages)
+
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+
+            futures = {
+                executor.submit(fetch_page, page_number): page_number
+                for page_number in self._remaining_pages(content=content, page_number=request.page_number)
+            }
+
+            try:
+                for future in as_completed(futures):
+                    buffer.add(page_number=futures[future], content=future.result())
+                    self._report_progress(progress=progress, pages_done=buffer.pages_done, total_pages=total_pages)
+            except BaseException:
+
+                # Don't request the pages still queued once one has failed.
+                for future in futures:
+                    future.cancel()
+
+                raise
+
+        return collector
+
+    @staticmethod
+    def _remaining_pages(content: Dict, page_number: int) -> List[int]:
+        """Lists the page numbers left after the first page.
+
+        ### Parameters
+        ----
+        content : Dict
+            The first page returned by an endpoint.
+
+        page_number : int
+            The page number of `content`.
+
+        ### Returns
+        ----
+        List[int]:
+            The page numbers still to be requested.
+        """
+
+        if next_page_number(content=content, page_number=page_number) is None:
+            return []
+
+        total_pages = int((content.get('meta') or {}).get('total-pages', page_number))
+
+        return list(range(page_number + 1, total_pages + 1))
+
+    @staticmethod
+    def _report_progress(
+        progress: Callable[[int, int], None],
+        pages_done: int,
+        total_pages: int
+    ) -> None:
+        """Reports the progress of a `fetch_all` call.
+
+        ### Parameters
+        ----
+        progress : Callable[[int, int], None]
+            The callback provided by the user, if any.
+
+        pages_done : int
+            The number of pages received so far.
+
+        total_pages : int
+            The total number of pages expected.
+        """
+
+        logging.info(
+            'PAGES: {done}/{total}'.format(done=pages_done, total=total_pages)
+        )
+
+        if progress is not None:
+            progress(pages_done, total_pages)
+
+    async def aiter_pages(self, method: Callable, **kwargs) -> AsyncIterator[Dict]:
+        """Yields every page of an endpoint of an async client.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of an `AsyncFederalTreasuryClient` service.
+
+        **kwargs :
+            The arguments of the endpoint method, `page_size` may be
+            `'auto'` or a `PageSizePolicy`.
+
+        ### Returns
+        ----
+        AsyncIterator[Dict]:
+            The content of each page.
+        """
+
+        session = self._session_for(method=method)
+        policy = self._pop_page_size_policy(kwargs=kwargs)
+        request = resolve_request(method, **kwargs)
+
+        if policy is not None:
+
+            plan = await self._aprobe(session=session, request=request, policy=policy)
+
+            while not plan.done:
+
+                started = time.perf_counter()
+                content = await session.make_request(
+                    method=request.method,
+                    endpoint=request.endpoint,
+                    params=request.with_page(page_number=plan.page_number, page_size=plan.page_size)
+                )
+                plan.advance(content=content, latency=time.perf_counter() - started)
+
+                yield content
+
+            return
+
+        page_number = request.page_number
+
+        while page_number is not None:
+
+            content = await session.make_request(
+                method=request.method,
+                endpoint=request.endpoint,
+                params=request.with_page(page_number=page_number)
+            )
+
+            yield content
+
+            page_number = next_page_number(content=content, page_number=page_number)
+
+    async def aiter_csv_pages(self, method: Callable, **kwargs) -> AsyncIterator[Dict]:
+        """Yields every page of an endpoint of an async client, requested and streamed as CSV.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of an `AsyncFederalTreasuryClient` service.
+
+        **kwargs :
+            The arguments of the endpoint method, see `iter_csv_pages`.
+
+        ### Returns
+        ----
+        AsyncIterator[Dict]:
+            The content of each page, with its `data` and `meta`.
+        """
+
+        session = self._session_for(method=method)
+        request = self._csv_request(method=method, kwargs=kwargs)
+
+        probe = await session.make_request(
+            method=request.method,
+            endpoint=request.endpoint,
+            params=dict(request.with_page(page_number=1, page_size=1), format='json')
+        )
+        meta = self._probe_meta(probe=probe)
+        page_number = request.page_number
+
+        while True:
+
+            stream = await session.make_request(
+                method=request.method,
+                endpoint=request.endpoint,
+                params=request.with_page(page_number=page_number),
+                stream=True
+            )
+
+            async with stream:
+                stream.parser.rename(renames=self._label_renames(meta=meta))
+                records = [record async for record in stream]
+
+            content = self._csv_content(session=session, records=records, meta=meta, request=request)
+
+            yield content
+
+            if len(records) < request.page_size or page_number >= content['meta'].get('total-pages', math.inf):
+                return
+
+            page_number += 1
+
+    async def aiter_records(self, method: Callable, **kwargs) -> AsyncIterator[dict]:
+        """Yields every record of an endpoint of an async client.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of an `AsyncFederalTreasuryClient` service.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        AsyncIterator[dict]:
+            The records of every page.
+
+        ### Usage
+        ----
+            >>> other_data_service = treasury_client.other_data()
+            >>> async for record in paginator.aiter_records(other_data_service.debt_to_penny):
+                    print(record['record_date'])
+        """
+
+        async for content in self.aiter_pages(method, **kwargs):
+            for record in content.get('data', []):
+                yield record
+
+    async def afetch_all(
+        self,
+        method: Callable,
+        parallel: int = 1,
+        progress: Callable[[int, int], None] = None,
+        as_columns: bool = False,
+        as_tuples: bool = False,
+        wire_format: str = 'json',
+        **kwargs
+    ) -> Union[List[dict], List[tuple], Dict[str, Column]]:
+        """Collects every record of an endpoint of an async client into a list.
+
+        ### Overview
+        ----
+        With `parallel` greater than 1, the pages after the first one are
+        requested concurrently on the event loop, at most `parallel` at a
+        time, and reassembled in page order.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of an `AsyncFederalTreasuryClient` service.
+
+        parallel : int (optional, Default=1)
+            The maximum number of pages requested at the same time.
+
+        progress : Callable[[int, int], None] (optional, Default=None)
+            Called with `(pages_done, total_pages)` each time a page arrives.
+
+        as_columns : bool (optional, Default=False)
+            If `True`, the records are returned as compact typed columns,
+            see `ColumnBuilder`, each page being folded in as it arrives.
+
+        as_tuples : bool (optional, Default=False)
+            If `True`, the records are returned as instances of a compact
+            `namedtuple` type generated for the endpoint, see `record_type`.
+
+        wire_format : str (optional, Default='json')
+            Either `'json'` or `'csv'`, whose pages are smaller on the
+            wire but are requested one at a time, see `iter_csv_pages`.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Returns
+        ----
+        Union[List[dict], List[tuple], Dict[str, Column]]:
+            The records of every page, in page order, or their columns.
+        """
+
+        collector = self._collector_for(method, as_columns=as_columns, as_tuples=as_tuples, **kwargs)
+        collector = await self.acollect(
+            method,
+            collector=collector,
+            parallel=parallel,
+            progress=progress,
+            wire_format=wire_format,
+            **kwargs
+        )
+
+        return collector.build()
+
+    async def acollect(
+        self,
+        method: Callable,
+        collector: Union[RecordCollector, ColumnBuilder],
+        parallel: int = 1,
+        progress: Callable[[int, int], None] = None,
+        wire_format: str = 'json',
+        **kwargs
+    ) -> Union[RecordCollector, ColumnBuilder]:
+        """Appends every page of an endpoint of an async client to a collector, in page order.
+
+        ### Overview
+        ----
+        With `parallel` greater than 1, pages are handed to the collector
+        through a `PageReorderBuffer` as soon as every page before them
+        has arrived, and the pages still waiting are cancelled if one fails.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method of an `AsyncFederalTreasuryClient` service.
+
+        collector : Union[RecordCollector, ColumnBuilder]
+            Receives each page through its `append` method.
+
+        parallel : int (optional, Default=1)
+            The maximum number of pages requested at the same time, see `afetch_all`.
+
+        progress : Callable[[int, int], None] (optional, Default=None)
+            Called with `(pages_done, total_pages)` each time a page arrives.
+
+        wire_format : str (optional, Default='json')
+            Either `'json'` or `'csv'`, whose pages are smaller on the
+            wire but are requested one at a time, see `iter_csv_pages`.
+
+        **kwargs :
+            The arguments of the endpoint method.
+
+        ### Raises
+        ----
+        ValueError:
+            If the wire format is unknown, or is `'csv'` with `parallel`.
+
+        ### Returns
+        ----
+        Union[RecordCollector, ColumnBuilder]:
+            The collector, holding every page.
+        """
+
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(
+                'Unknown wire format `{wire_format}`, use one of {formats}.'.format(
+                    wire_format=wire_format,
+                    formats=list(WIRE_FORMATS)
+                )
+            )
+
+        if wire_format == CSV_FORMAT and parallel > 1:
+            raise ValueError('CSV pages are requested one at a time, `parallel` must be 1.')
+
+        if parallel <= 1:
+
+            pages_done = 0
+            if wire_format == CSV_FORMAT:
+                pages = self.aiter_csv_pages(method, **kwargs)
+            else:
+                pages = self.aiter_pages(method, **kwargs)
+
+            async for content in pages:
+                collector.append(content)
+                pages_done += 1
+                self._report_progress(
+                    progress=progress,
+                    pages_done=pages_done,
+                    total_pages=max(pages_done, int((content.get('meta') or {}).get('total-pages', 1)))
+                )
+
+            return collector
+
+        session = self._session_for(method=method)
+        policy = self._pop_page_size_policy(kwargs=kwargs)
+        request = resolve_request(method, **kwargs)
+
+        # Pages fetched in parallel share one page size, picked up front.
+        if policy is not None:
+            plan = await self._aprobe(session=session, request=request, policy=policy)
+            request.params['page[size]'] = plan.page_size
+            request.params['page[number]'] = 1
+
+        semaphore = asyncio.Semaphore(parallel)
+
+        async def fetch_page(page_number: int) -> Dict:
+
+            async with semaphore:
+
+                content = await session.make_request(
+                    method=request.method,
+                    endpoint=request.endpoint,
+                    params=request.with_page(page_number=page_number)
+                )
+
+            buffer.add(page_number=page_number, content=content)
+            self._report_progress(progress=progress, pages_done=buffer.pages_done, total_pages=total_pages)
+
+            return content
+
+        buffer = PageReorderBuffer(collector=collector, page_number=request.page_number)
+        total_pages = 1
+
+        content = await fetch_page(page_number=request.page_number)
+        total_pages = int((content.get('meta') or {}).get('total-pages', 1))
+
+        tasks = [
+            asyncio.ensure_future(fetch_page(page_number=page_number))
+            for page_number in self._remaining_pages(content=content, page_number=request.page_number)
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+
+            # Don't request the pages still waiting once one has failed.
+            for task in tasks:
+                task.cancel()
+
+            raise
+
+        return collector
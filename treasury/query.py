@@ -0,0 +1,546 @@
+import math
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from typing import Callable
+
+from treasury.sync import SyncEngine
+from treasury.sync import dataset_name
+from treasury.sync import quote_identifier
+
+# The `meta['dataTypes']` compared and sorted as numbers.
+NUMERIC_TYPES = ('CURRENCY', 'NUMBER', 'PERCENTAGE', 'INTEGER', 'YEAR', 'MONTH', 'DAY', 'QUARTER')
+
+# The filter operators of the API, and their SQL counterpart.
+OPERATORS = {
+    'eq': '=',
+    'lt': '<',
+    'lte': '<=',
+    'gt': '>',
+    'gte': '>=',
+    'in': 'IN'
+}
+
+
+def split_parameter(parameter: Union[str, List[str]]) -> List[str]:
+    """Splits a comma separated `fields`, `sort` or `filters` parameter.
+
+    ### Overview
+    ----
+    Commas inside parentheses, as in `field:in:(a,b)`, are kept.
+
+    ### Parameters
+    ----
+    parameter : Union[str, List[str]]
+        The parameter, as a list or as the string sent to the API.
+
+    ### Returns
+    ----
+    List[str]:
+        The individual items.
+    """
+
+    if not parameter:
+        return []
+
+    if not isinstance(parameter, str):
+        return [item for value in parameter for item in split_parameter(value)]
+
+    items = []
+    depth = 0
+    current = ''
+
+    for character in parameter:
+
+        if character == '(':
+            depth += 1
+        elif character == ')':
+            depth -= 1
+
+        if character == ',' and depth == 0:
+            items.append(current)
+            current = ''
+        else:
+            current += character
+
+    items.append(current)
+
+    return [item.strip() for item in items if item.strip()]
+
+
+class QueryCompiler():
+
+    """
+    Overview:
+    ----
+    Translates the `fields`, `sort`, `filters`, `page_number` and
+    `page_size` parameters of the API into a SQLite query against a
+    dataset mirrored by the `SyncEngine`.
+    """
+
+    def __init__(self, dataset: str, columns: List[str], data_types: Dict[str, str] = None) -> None:
+        """Initializes the `QueryCompiler` object.
+
+        ### Parameters
+        ----
+        dataset : str
+            The name of the dataset table.
+
+        columns : List[str]
+            The fields stored for the dataset.
+
+        data_types : Dict[str, str] (optional, Default=None)
+            The `meta['dataTypes']` of the dataset.
+        """
+
+        self.dataset = dataset
+        self.columns = columns
+        self.data_types = data_types or {}
+
+    def __repr__(self) -> str:
+        """String representation of the `QueryCompiler` object."""
+
+        str_representation = '<FederalTreasuryClient.QueryCompiler (dataset={dataset})>'.format(
+            dataset=self.dataset
+        )
+
+        return str_representation
+
+    def is_numeric(self, field: str) -> bool:
+        """`True` if the field is compared and sorted as a number."""
+
+        return self.data_types.get(field, 'STRING').upper().startswith(NUMERIC_TYPES)
+
+    def column(self, field: str) -> str:
+        """Returns the SQL expression of a field.
+
+        ### Parameters
+        ----
+        field : str
+            The name of the field.
+
+        ### Raises
+        ----
+        ValueError:
+            If the dataset has no such field.
+
+        ### Returns
+        ----
+        str:
+            The quoted column, cast to a number for numeric fields, the
+            API's `'null'` and empty strings becoming `NULL` instead of 0.
+        """
+
+        if field not in self.columns:
+            raise ValueError(
+                'Unknown field `{field}` for {dataset}.'.format(field=field, dataset=self.dataset)
+            )
+
+        if self.is_numeric(field=field):
+            return "CAST(NULLIF(NULLIF({column}, 'null'), '') AS REAL)".format(column=quote_identifier(field))
+
+        return quote_identifier(field)
+
+    def value(self, field: str, value: str) -> Union[str, float]:
+        """Converts a filter value to the type of its field."""
+
+        if self.is_numeric(field=field):
+            return float(value)
+
+        return value
+
+    def compile_filters(self, filters: Union[str, List[str]]) -> Tuple[str, list]:
+        """Compiles the `filters` parameter into a `WHERE` clause.
+
+        ### Parameters
+        ----
+        filters : Union[str, List[str]]
+            Filters such as `record_date:gte:2020-01-01` or
+            `security_type_desc:in:(Marketable,Non-marketable)`.
+
+        ### Raises
+        ----
+        ValueError:
+            If a filter is malformed or uses an unknown operator.
+
+        ### Returns
+        ----
+        Tuple[str, list]:
+            The `WHERE` clause, empty without filters, and its parameters.
+        """
+
+        conditions = []
+        parameters = []
+
+        for condition in split_parameter(filters):
+
+            try:
+                field, operator, value = condition.split(':', 2)
+            except ValueError:
+                raise ValueError('Malformed filter `{condition}`.'.format(condition=condition))
+
+            if operator not in OPERATORS:
+                raise ValueError('Unknown filter operator `{operator}`.'.format(operator=operator))
+
+            if operator == 'in':
+
+                values = split_parameter(value.strip().lstrip('(').rstrip(')'))
+                conditions.append('{column} IN ({placeholders})'.format(
+                    column=self.column(field=field),
+                    placeholders=', '.join('?' * len(values))
+                ))
+                parameters.extend(self.value(field=field, value=item) for item in values)
+
+            else:
+
+                conditions.append('{column} {operator} ?'.format(
+                    column=self.column(field=field),
+                    operator=OPERATORS[operator]
+                ))
+                parameters.append(self.value(field=field, value=value))
+
+        if not conditions:
+            return '', parameters
+
+        return 'WHERE ' + ' AND '.join(conditions), parameters
+
+    def compile_sort(self, sort: Union[str, List[str]]) -> str:
+        """Compiles the `sort` parameter into an `ORDER BY` clause.
+
+        ### Parameters
+        ----
+        sort : Union[str, List[str]]
+            Fields to sort on, prefixed with `-` for descending order.
+            Defaults to the first field, like the API.
+
+        ### Returns
+        ----
+        str:
+            The `ORDER BY` clause.
+        """
+
+        orders = []
+
+        for field in split_parameter(sort) or self.columns[:1]:
+
+            descending = field.startswith('-')
+            field = field.lstrip('-+')
+
+            orders.append('{column} {direction}'.format(
+                column=self.column(field=field),
+                direction='DESC' if descending else 'ASC'
+            ))
+
+        return 'ORDER BY ' + ', '.join(orders)
+
+    def compile_fields(self, fields: Union[str, List[str]]) -> List[str]:
+        """Validates the `fields` parameter, defaulting to every field."""
+
+        fields = split_parameter(fields) or list(self.columns)
+
+        for field in fields:
+            self.column(field=field)
+
+        return fields
+
+    def compile(
+        self,
+        fields: Union[str, List[str]] = None,
+        sort: Union[str, List[str]] = None,
+        filters: Union[str, List[str]] = None,
+        page_number: int = 1,
+        page_size: int = 100
+    ) -> Tuple[List[str], str, str, list]:
+        """Compiles the parameters of an endpoint method into SQL.
+
+        ### Returns
+        ----
+        Tuple[List[str], str, str, list]:
+            The selected fields, the page query, the count query and
+            the parameters of the `WHERE` clause.
+        """
+
+        fields = self.compile_fields(fields=fields)
+        where, parameters = self.compile_filters(filters=filters)
+        table = quote_identifier(self.dataset)
+
+        page_query = 'SELECT {columns} FROM {table} {where} {order} LIMIT {limit} OFFSET {offset}'.format(
+            columns=', '.join(quote_identifier(field) for field in fields),
+            table=table,
+            where=where,
+            order=self.compile_sort(sort=sort),
+            limit=int(page_size),
+            offset=(int(page_number) - 1) * int(page_size)
+        )
+
+        count_query = 'SELECT COUNT(*) FROM {table} {where}'.format(table=table, where=where)
+
+        return fields, page_query, count_query, parameters
+
+    def index_statements(self, filters: Union[str, List[str]], sort: Union[str, List[str]]) -> List[str]:
+        """Lists the indexes that serve the filtered and sorted fields."""
+
+        fields = [condition.split(':', 1)[0] for condition in split_parameter(filters)]
+        fields += [field.lstrip('-+') for field in split_parameter(sort)]
+
+        statements = []
+
+        for field in dict.fromkeys(fields):
+
+            if field in self.columns:
+
+                statements.append('CREATE INDEX IF NOT EXISTS {index} ON {table} ({column})'.format(
+                    index=quote_identifier('{dataset}__{field}'.format(dataset=self.dataset, field=field)),
+                    table=quote_identifier(self.dataset),
+                    column=self.column(field=field)
+                ))
+
+        return statements
+
+
+class LocalQueryEngine():
+
+    """
+    Overview:
+    ----
+    Answers endpoint requests from the datasets mirrored by a `SyncEngine`,
+    accepting the same `fields`, `sort`, `filters`, `page_number` and
+    `page_size` parameters and returning the same `data`, `meta` and
+    `links` content as the API, without any network request.
+    """
+
+    def __init__(self, sync_engine: SyncEngine, create_indexes: bool = True) -> None:
+        """Initializes the `LocalQueryEngine` object.
+
+        ### Parameters
+        ----
+        sync_engine : SyncEngine
+            The engine that mirrors the datasets.
+
+        create_indexes : bool (optional, Default=True)
+            If `True`, an index is created the first time a field is
+            filtered or sorted on, so later queries on it are indexed.
+
+        ### Usage
+        ----
+            >>> sync_engine = SyncEngine(path='data/treasury_mirror.sqlite')
+            >>> local_engine = LocalQueryEngine(sync_engine=sync_engine)
+            >>> local_other_data = local_engine.service(treasury_client.other_data())
+            >>> local_other_data.debt_to_penny(filters=['record_date:gte:2020-01-01'], sort=['-record_date'])
+        """
+
+        self.sync_engine = sync_engine
+        self.create_indexes = create_indexes
+        self._indexed = set()
+
+    def __repr__(self) -> str:
+        """String representation of the `LocalQueryEngine` object."""
+
+        str_representation = '<FederalTreasuryClient.LocalQueryEngine (path={path})>'.format(
+            path=self.sync_engine.path
+        )
+
+        return str_representation
+
+    def compiler(self, dataset: str) -> QueryCompiler:
+        """Builds the `QueryCompiler` of a mirrored dataset.
+
+        ### Parameters
+        ----
+        dataset : str
+            The name of the dataset table.
+
+        ### Raises
+        ----
+        LookupError:
+            If the dataset was never synced.
+
+        ### Returns
+        ----
+        QueryCompiler:
+            The compiler of the dataset.
+        """
+
+        info = self.sync_engine.dataset_info(dataset=dataset)
+        columns = self.sync_engine.columns(dataset=dataset)
+
+        if info is None or not columns:
+            raise LookupError(
+                'The dataset `{dataset}` has not been synced yet.'.format(dataset=dataset)
+            )
+
+        return QueryCompiler(dataset=dataset, columns=columns, data_types=info['data_types'])
+
+    def query(
+        self,
+        method: Callable,
+        fields: List[str] = None,
+        sort: List[str] = None,
+        filters: List[str] = None,
+        page_number: int = 1,
+        page_size: int = 100
+    ) -> Dict:
+        """Answers a request for an endpoint from the local mirror.
+
+        ### Parameters
+        ----
+        method : Callable
+            The bound endpoint method being answered, for example
+            `other_data_service.debt_to_penny`.
+
+        fields : List[str] (optional, Default=None)
+            The fields to return, defaults to every field.
+
+        sort : List[str] (optional, Default=None)
+            The fields to sort on, prefixed with `-` for descending order.
+
+        filters : List[str] (optional, Default=None)
+            Filters using the `field:op:value` syntax of the API.
+
+        page_number : int (optional, Default=1)
+            The page to return, starting at 1.
+
+        page_size : int (optional, Default=100)
+            The number of records per page.
+
+        ### Returns
+        ----
+        Dict
+            A collection of `Records` resources, like the API returns.
+        """
+
+        dataset = dataset_name(method=method)
+        compiler = self.compiler(dataset=dataset)
+        connection = self.sync_engine.connection
+
+        if self.create_indexes:
+
+            for statement in compiler.index_statements(filters=filters, sort=sort):
+
+                if statement not in self._indexed:
+
+                    with connection:
+                        connection.execute(statement)
+
+                    self._indexed.add(statement)
+
+        fields, page_query, count_query, parameters = compiler.compile(
+            fields=fields,
+            sort=sort,
+            filters=filters,
+            page_number=page_number,
+            page_size=page_size
+        )
+
+        total_count = connection.execute(count_query, parameters).fetchone()[0]
+        records = [
+            dict(zip(fields, row)) for row in connection.execute(page_query, parameters)
+        ]
+
+        total_pages = max(1, math.ceil(total_count / page_size))
+
+        def link(number: int) -> Union[str, None]:
+
+            if number < 1 or number > total_pages:
+                return None
+
+            return '&page%5Bnumber%5D={number}&page%5Bsize%5D={size}'.format(number=number, size=page_size)
+
+        return {
+            'data': records,
+            'meta': {
+                'count': len(records),
+                'total-count': total_count,
+                'total-pages': total_pages,
+                'dataTypes': {field: compiler.data_types.get(field, 'STRING') for field in fields}
+            },
+            'links': {
+                'self': link(page_number),
+                'first': link(1),
+                'prev': link(page_number - 1),
+                'next': link(page_number + 1),
+                'last': link(total_pages)
+            }
+        }
+
+    def service(self, service: object) -> 'LocalService':
+        """Wraps a service so its endpoint methods are answered locally.
+
+        ### Parameters
+        ----
+        service : object
+            A service object, for example `treasury_client.other_data()`.
+
+        ### Returns
+        ----
+        LocalService:
+            An object with the same endpoint methods as `service`.
+        """
+
+        return LocalService(engine=self, service=service)
+
+
+class LocalService():
+
+    """
+    Overview:
+    ----
+    Mirrors the endpoint methods of a service, answering each of them
+    from a `LocalQueryEngine` instead of the API.
+    """
+
+    def __init__(self, engine: LocalQueryEngine, service: object) -> None:
+        """Initializes the `LocalService` object.
+
+        ### Parameters
+        ----
+        engine : LocalQueryEngine
+            The engine answering the requests.
+
+        service : object
+            The service whose endpoint methods are mirrored.
+        """
+
+        self.engine = engine
+        self.service = service
+
+    def __repr__(self) -> str:
+        """String representation of the `LocalService` object."""
+
+        str_representation = '<FederalTreasuryClient.LocalService (service={service})>'.format(
+            service=type(self.service).__name__
+        )
+
+        return str_representation
+
+    def __getattr__(self, name: str) -> Callable:
+        """Returns the local version of an endpoint method."""
+
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        method = getattr(self.service, name)
+
+        def local_method(
+            fields: List[str] = None,
+            sort: List[str] = None,
+            filters: List[str] = None,
+            page_number: int = 1,
+            page_size: int = 100
+        ) -> Dict:
+
+            return self.engine.query(
+                method=method,
+                fields=fields,
+                sort=sort,
+                filters=filters,
+                page_number=page_number,
+                page_size=page_size
+            )
+
+        local_method.__name__ = name
+        local_method.__doc__ = method.__doc__
+
+        return local_method
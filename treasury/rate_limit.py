@@ -0,0 +1,196 @@
+import time
+import threading
+
+from typing import Tuple
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class RateLimiter():
+
+    """
+    Overview:
+    ----
+    A token bucket pacing the requests sent to the API. The bucket
+    holds up to `burst` tokens and refills at `rate` tokens a second,
+    every request takes one. A request finding the bucket empty still
+    takes its token, driving the bucket below zero, and waits until
+    the refill catches up, so concurrent callers are spaced out evenly
+    in the order they arrived instead of bursting into a `429`.
+
+    A limiter is shared by every service object of a client, and may be
+    passed to several clients, or threads, to pace them together.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: int = 10) -> None:
+        """Initializes the `RateLimiter` object.
+
+        ### Parameters
+        ----
+        rate : float (optional, Default=10.0)
+            The sustained number of requests a second.
+
+        burst : int (optional, Default=10)
+            The number of requests that can be sent at once after a
+            quiet spell.
+
+        ### Usage
+        ----
+            >>> treasury_client = FederalTreasuryClient(rate_limiter=RateLimiter(rate=5, burst=10))
+        """
+
+        if rate <= 0 or burst < 1:
+            raise ValueError('The rate must be positive and the burst at least 1.')
+
+        self.rate = float(rate)
+        self.burst = burst
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of the `RateLimiter` object."""
+
+        return '<FederalTreasuryClient.RateLimiter (rate={rate}, burst={burst})>'.format(
+            rate=self.rate,
+            burst=self.burst
+        )
+
+    def reserve(self) -> float:
+        """Takes a token, and returns how long to wait before sending the request.
+
+        ### Overview
+        ----
+        The token is taken right away, so the wait must be honored, for
+        example with `asyncio.sleep` by an asyncio caller.
+
+        ### Returns
+        ----
+        float:
+            The number of seconds to wait, 0 if a token was available.
+        """
+
+        with self._lock:
+            self._tokens, self._updated, delay = self._take(
+                tokens=self._tokens,
+                updated=self._updated,
+                now=time.monotonic()
+            )
+
+        return delay
+
+    def acquire(self) -> float:
+        """Waits for a token, blocking the calling thread.
+
+        ### Returns
+        ----
+        float:
+            The number of seconds waited.
+        """
+
+        delay = self.reserve()
+
+        if delay > 0:
+            time.sleep(delay)
+
+        return delay
+
+    def _take(self, tokens: float, updated: float, now: float) -> Tuple[float, float, float]:
+        """Refills the bucket up to `now` and takes a token, returning the new state and the wait."""
+
+        # A clock that went back, across processes, refills nothing.
+        elapsed = max(now - updated, 0.0)
+        tokens = min(tokens + elapsed * self.rate, float(self.burst)) - 1
+
+        return tokens, max(now, updated), max(-tokens / self.rate, 0.0)
+
+
+class FileRateLimiter(RateLimiter):
+
+    """
+    Overview:
+    ----
+    A `RateLimiter` whose bucket lives in a file, so every process of a
+    host using the same `path`, cron jobs included, shares one budget.
+    The file is locked with `fcntl.flock` while a token is taken, which
+    is only available on POSIX systems.
+    """
+
+    def __init__(self, path: str, rate: float = 10.0, burst: int = 10) -> None:
+        """Initializes the `FileRateLimiter` object.
+
+        ### Parameters
+        ----
+        path : str
+            The file holding the bucket, created if missing.
+
+        rate : float (optional, Default=10.0)
+            The sustained number of requests a second, across processes.
+
+        burst : int (optional, Default=10)
+            The number of requests that can be sent at once after a
+            quiet spell, across processes.
+
+        ### Usage
+        ----
+            >>> rate_limiter = FileRateLimiter(path='/tmp/fiscal_data.bucket', rate=5)
+            >>> treasury_client = FederalTreasuryClient(rate_limiter=rate_limiter)
+        """
+
+        if fcntl is None:
+            raise ImportError('The `FileRateLimiter` needs `fcntl`, which is only available on POSIX systems.')
+
+        super().__init__(rate=rate, burst=burst)
+
+        self.path = path
+
+    def __repr__(self) -> str:
+        """String representation of the `FileRateLimiter` object."""
+
+        return '<FederalTreasuryClient.FileRateLimiter (path={path}, rate={rate}, burst={burst})>'.format(
+            path=self.path,
+            rate=self.rate,
+            burst=self.burst
+        )
+
+    def reserve(self) -> float:
+        """Takes a token from the shared bucket, and returns how long to wait.
+
+        ### Returns
+        ----
+        float:
+            The number of seconds to wait, 0 if a token was available.
+        """
+
+        # The thread lock spares the threads of a process from queuing on the file.
+        with self._lock, open(self.path, 'a+') as bucket:
+
+            fcntl.flock(bucket.fileno(), fcntl.LOCK_EX)
+
+            try:
+                # The wall clock, unlike the monotonic one, is shared by the processes.
+                now = time.time()
+
+                bucket.seek(0)
+                state = bucket.read().split()
+
+                try:
+                    tokens, updated = float(state[0]), float(state[1])
+                except (IndexError, ValueError):
+                    tokens, updated = float(self.burst), now
+
+                tokens, updated, delay = self._take(tokens=tokens, updated=updated, now=now)
+
+                bucket.seek(0)
+                bucket.truncate()
+                bucket.write('{tokens!r} {updated!r}'.format(tokens=tokens, updated=updated))
+                bucket.flush()
+
+            finally:
+                fcntl.flock(bucket.fileno(), fcntl.LOCK_UN)
+
+        return delay
@@ -1,11 +1,301 @@
 import json
+import time
+import random
 import requests
 import logging
 import pathlib
+import threading
 
+from typing import Any
 from typing import Dict
+from typing import Union
+from typing import Tuple
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait
+from email.utils import parsedate_to_datetime
 from datetime import datetime
+from datetime import timezone
 from datetime import date
+from treasury.streaming import RecordStream
+from treasury.streaming import STREAM_CHUNK_SIZE
+from treasury.csv_stream import CSV_FORMAT
+from treasury.csv_stream import CSVRecordStream
+from treasury.cache import canonical_key
+from treasury.typed import TypeDecoder
+from treasury.circuit import CircuitBreaker
+from treasury.circuit import CircuitOpenError
+from treasury.hedging import HedgingPolicy
+from treasury.coalescing import RequestCoalescer
+from treasury.concurrency import AdaptiveConcurrencyLimiter
+from treasury.rate_limit import RateLimiter
+from treasury.interning import StringInterner
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class JSONDecoder():
+
+    """
+    Overview:
+    ----
+    Decodes response bodies straight from their bytes. The fastest
+    installed backend is used, `orjson`, then `msgspec`, falling back
+    to the standard library `json` module.
+    """
+
+    BACKENDS = ('orjson', 'msgspec', 'json')
+
+    def __init__(self, backend: str = 'auto') -> None:
+        """Initializes the `JSONDecoder` object.
+
+        ### Parameters:
+        ----
+        backend (str, optional, Default='auto'): One of `'orjson'`,
+            `'msgspec'` or `'json'`, or `'auto'` to pick the fastest
+            one installed.
+
+        ### Usage:
+        ----
+            >>> treasury_client = FederalTreasuryClient(decoder=JSONDecoder(backend='json'))
+        """
+
+        if backend == 'auto':
+            backend = 'orjson' if orjson else 'msgspec' if msgspec else 'json'
+
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                'Unknown JSON backend `{backend}`, use one of {backends}.'.format(
+                    backend=backend,
+                    backends=self.BACKENDS
+                )
+            )
+
+        if backend == 'orjson' and orjson is None or backend == 'msgspec' and msgspec is None:
+            raise ImportError(
+                'The `{backend}` JSON backend is not installed.'.format(backend=backend)
+            )
+
+        self.backend = backend
+
+        if backend == 'orjson':
+            self._decode = orjson.loads
+        elif backend == 'msgspec':
+            self._decode = msgspec.json.Decoder().decode
+        else:
+            self._decode = json.loads
+
+    def __repr__(self) -> str:
+        """String representation of the `JSONDecoder` object."""
+
+        return '<FederalTreasuryClient.JSONDecoder (backend={backend})>'.format(backend=self.backend)
+
+    def decode(self, body: bytes) -> Any:
+        """Decodes a JSON body.
+
+        ### Parameters:
+        ----
+        body : bytes
+            The raw body of a response.
+
+        ### Returns:
+        ----
+        Any:
+            The decoded JSON values.
+        """
+
+        return self._decode(body)
+
+
+class RetryPolicy():
+
+    """
+    Overview:
+    ----
+    Describes how the `TreasurySession` retries failed requests. Transient
+    failures (connection errors, timeouts, 429 and 5xx responses) are retried
+    with an exponential backoff and random jitter, while the remaining 4xx
+    responses are treated as caller errors and are never retried.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 60.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+        retry_statuses: Tuple[int] = (429, 500, 502, 503, 504),
+        retry_methods: Tuple[str] = ('GET', 'HEAD', 'OPTIONS')
+    ) -> None:
+        """Initializes the `RetryPolicy` object.
+
+        ### Parameters:
+        ----
+        max_attempts (int, optional, Default=5): The total number of
+            attempts made for a single request, including the first one.
+            Set to `1` to disable retries.
+
+        backoff_factor (float, optional, Default=0.5): The base delay in
+            seconds, attempt `n` waits up to `backoff_factor * 2 ** (n - 1)`.
+
+        backoff_max (float, optional, Default=60.0): The longest delay, in
+            seconds, ever waited between two attempts.
+
+        jitter (bool, optional, Default=True): If `True`, the delay is drawn
+            uniformly between zero and the backoff ("full jitter"), so workers
+            that failed together do not retry together.
+
+        respect_retry_after (bool, optional, Default=True): If `True`, a
+            `Retry-After` header sent by the API overrides the backoff.
+
+        retry_statuses (Tuple[int], optional): The HTTP status codes that
+            are considered transient.
+
+        retry_methods (Tuple[str], optional): The idempotent HTTP methods
+            that are safe to retry.
+
+        ### Usage:
+        ----
+            >>> retry_policy = RetryPolicy(max_attempts=8, backoff_factor=1.0)
+            >>> treasury_client = FederalTreasuryClient(retry_policy=retry_policy)
+        """
+
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(
+            method.upper() for method in retry_methods
+        )
+
+    def __repr__(self) -> str:
+        """String representation of the `RetryPolicy` object."""
+
+        str_representation = '<FederalTreasuryClient.RetryPolicy (max_attempts={attempts}, backoff_factor={factor})>'.format(
+            attempts=self.max_attempts,
+            factor=self.backoff_factor
+        )
+
+        return str_representation
+
+    def is_retryable(
+        self,
+        method: str,
+        attempt: int,
+        status_code: int = None,
+        error: Exception = None
+    ) -> bool:
+        """Determines whether a failed attempt should be retried.
+
+        ### Parameters:
+        ----
+        method : str
+            The HTTP method of the request.
+
+        attempt : int
+            The number of the attempt that just finished, starting at 1.
+
+        status_code : int (optional, Default=None)
+            The status code of the response, if one was received.
+
+        error : Exception (optional, Default=None)
+            The connection error or timeout raised, if any. Transport
+            errors are always considered transient.
+
+        ### Returns:
+        ----
+        bool:
+            `True` if another attempt should be made.
+        """
+
+        if attempt >= self.max_attempts:
+            return False
+
+        if method.upper() not in self.retry_methods:
+            return False
+
+        if error is not None:
+            return True
+
+        return status_code in self.retry_statuses
+
+    def compute_delay(self, attempt: int, retry_after: str = None) -> float:
+        """Computes how long to wait before the next attempt.
+
+        ### Parameters:
+        ----
+        attempt : int
+            The number of the attempt that just finished, starting at 1.
+
+        retry_after : str (optional, Default=None)
+            The raw `Retry-After` header of the response, either a
+            number of seconds or an HTTP date.
+
+        ### Returns:
+        ----
+        float:
+            The delay in seconds.
+        """
+
+        if self.respect_retry_after and retry_after:
+
+            delay = self.parse_retry_after(retry_after=retry_after)
+
+            if delay is not None:
+                return min(delay, self.backoff_max)
+
+        backoff = min(
+            self.backoff_max,
+            self.backoff_factor * (2 ** (attempt - 1))
+        )
+
+        if self.jitter:
+            return random.uniform(0, backoff)
+
+        return backoff
+
+    @staticmethod
+    def parse_retry_after(retry_after: str) -> Union[float, None]:
+        """Parses a `Retry-After` header into a number of seconds.
+
+        ### Parameters:
+        ----
+        retry_after : str
+            The raw header value.
+
+        ### Returns:
+        ----
+        Union[float, None]:
+            The delay in seconds, or `None` if the header could not be parsed.
+        """
+
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+        try:
+            retry_date = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo=timezone.utc)
+
+        return max(0.0, (retry_date - datetime.now(tz=timezone.utc)).total_seconds())
 
 
 class FederalTreasurySession():
@@ -18,18 +308,99 @@ class FederalTreasurySession():
     requests made to the Federal Treasury API.
     """
 
-    def __init__(self, client: object) -> None:
+    def __init__(
+        self,
+        client: object,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        retry_policy: RetryPolicy = None,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        cache: object = None,
+        memory_cache: object = None,
+        decoder: JSONDecoder = None,
+        type_decoder: TypeDecoder = None,
+        string_interner: StringInterner = None,
+        rate_limiter: RateLimiter = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter = None,
+        request_coalescer: RequestCoalescer = None,
+        hedging_policy: HedgingPolicy = None,
+        circuit_breaker: CircuitBreaker = None
+    ) -> None:
         """Initializes the `TreasurySession` client.
 
         ### Overview:
         ----
         The `TreasurySession` object handles all the requests made
-        for the different endpoints on the Federal Treasury API.
+        for the different endpoints on the Federal Treasury API. It
+        owns a single `requests.Session` backed by a connection pool,
+        so every service object on the client reuses the same TCP/TLS
+        connections instead of opening a new one for each request.
 
         ### Parameters:
         ----
         client (str): The `treasury.FederalTreasuryClient` Python Client.
 
+        pool_connections (int, optional, Default=10): The number of
+            host connection pools to cache.
+
+        pool_maxsize (int, optional, Default=10): The maximum number of
+            connections kept open per host.
+
+        pool_block (bool, optional, Default=False): If `True`, requests
+            will wait for a free connection once `pool_maxsize` is reached
+            instead of opening a throwaway one.
+
+        keep_alive (bool, optional, Default=True): If `True`, connections
+            are kept alive and returned to the pool after each request.
+
+        retry_policy (RetryPolicy, optional, Default=None): The policy used
+            to retry transient failures, defaults to `RetryPolicy()`.
+
+        connect_timeout (float, optional, Default=5.0): The number of seconds
+            to wait while establishing a connection.
+
+        read_timeout (float, optional, Default=30.0): The number of seconds
+            to wait for the server to send data.
+
+        cache (SQLiteResponseCache, optional, Default=None): A persistent
+            cache consulted before every GET request.
+
+        memory_cache (MemoryResponseCache, optional, Default=None): An
+            in-process cache of decoded responses, consulted before `cache`.
+
+        decoder (JSONDecoder, optional, Default=None): The decoder of the
+            response bodies, defaults to the fastest backend installed.
+
+        type_decoder (TypeDecoder, optional, Default=None): If set, the
+            string values of the records are converted to Python values
+            using the `meta['dataTypes']` of each page.
+
+        string_interner (StringInterner, optional, Default=None): If set,
+            the repeated strings of the records of each endpoint share one
+            object.
+
+        rate_limiter (RateLimiter, optional, Default=None): If set, every
+            request, retries included, waits for a token of this bucket.
+
+        concurrency_limiter (AdaptiveConcurrencyLimiter, optional, Default=None):
+            If set, caps the requests in flight to each endpoint family,
+            the cap tuned to the latency and errors of the family.
+
+        request_coalescer (RequestCoalescer, optional, Default=None): Lets
+            identical GET requests in flight share one call to the API,
+            defaults to a `RequestCoalescer()` of the session.
+
+        hedging_policy (HedgingPolicy, optional, Default=None): If set, a
+            GET request slower than the policy's percentile is sent again,
+            and the first response is used.
+
+        circuit_breaker (CircuitBreaker, optional, Default=None): If set,
+            the requests to an endpoint family that keeps failing fail fast,
+            or are served stale from `cache`, until it recovers.
+
         ### Usage:
         ----
             >>> treasury_client = FederalTreasuryClient()
@@ -44,6 +415,28 @@ class FederalTreasurySession():
         self.client: FederalTreasuryClient = client
         self.resource = 'https://api.fiscaldata.treasury.gov/services/api/fiscal_service'
 
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = cache
+        self.memory_cache = memory_cache
+        self.decoder: JSONDecoder = decoder or JSONDecoder()
+        self.type_decoder: TypeDecoder = type_decoder
+        self.string_interner: StringInterner = string_interner
+        self.rate_limiter: RateLimiter = rate_limiter
+        self.concurrency_limiter: AdaptiveConcurrencyLimiter = concurrency_limiter
+        self.request_coalescer: RequestCoalescer = request_coalescer or RequestCoalescer()
+        self.hedging_policy: HedgingPolicy = hedging_policy
+        self.circuit_breaker: CircuitBreaker = circuit_breaker
+
+        self._http_session: requests.Session = None
+        self._http_session_lock = threading.Lock()
+        self._hedging_executor: ThreadPoolExecutor = None
+
         if not pathlib.Path('logs').exists():
             pathlib.Path('logs').mkdir()
             pathlib.Path('logs/fred_api_log.log').touch()
@@ -63,6 +456,74 @@ class FederalTreasurySession():
 
         return str_representation
 
+    @property
+    def http_session(self) -> requests.Session:
+        """Returns the pooled `requests.Session` used for every request.
+
+        ### Overview:
+        ----
+        The session is created lazily on first use and then shared by
+        every service object, and every thread, using this `TreasurySession`.
+
+        ### Returns:
+        ----
+        requests.Session:
+            The long-lived session with the pooled adapter mounted.
+        """
+
+        if self._http_session is None:
+
+            with self._http_session_lock:
+
+                if self._http_session is None:
+                    self._http_session = self._build_http_session()
+
+        return self._http_session
+
+    def _build_http_session(self) -> requests.Session:
+        """Builds a new `requests.Session` with a pooled adapter mounted.
+
+        ### Returns:
+        ----
+        requests.Session:
+            A new session ready to send requests.
+        """
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+
+        http_session = requests.Session()
+        http_session.verify = True
+        http_session.mount('https://', adapter)
+        http_session.mount('http://', adapter)
+        http_session.headers.update(
+            {'Connection': 'keep-alive' if self.keep_alive else 'close'}
+        )
+
+        return http_session
+
+    def close(self) -> None:
+        """Closes the pooled session and releases all of its connections.
+
+        ### Overview:
+        ----
+        Calling `close()` is safe more than once, a new pool will be
+        created if the session is used again afterwards.
+        """
+
+        with self._http_session_lock:
+
+            if self._http_session is not None:
+                self._http_session.close()
+                self._http_session = None
+
+            if self._hedging_executor is not None:
+                self._hedging_executor.shutdown(wait=False)
+                self._hedging_executor = None
+
     def build_url(self, endpoint: str) -> str:
         """Builds the full url for the endpoint.
 
@@ -87,8 +548,9 @@ class FederalTreasurySession():
         endpoint: str,
         params: dict = None,
         data: dict = None,
-        json_payload: dict = None
-    ) -> Dict:
+        json_payload: dict = None,
+        stream: bool = False
+    ) -> Union[Dict, RecordStream]:
         """Handles all the requests in the library.
 
         ### Overview:
@@ -115,9 +577,16 @@ class FederalTreasurySession():
         json : dict (optional, Default=None)
             A json data payload for a request
 
+        stream : bool (optional, Default=False)
+            If `True`, the body is parsed as it arrives and a `RecordStream`
+            over the records is returned instead of the whole page, or a
+            `CSVRecordStream` if the `format` param is `'csv'`. Streamed
+            requests skip the caches.
+
         ### Returns:
         ----
-            A Dictionary object containing the JSON values.
+            A Dictionary object containing the JSON values, or a
+            `RecordStream` if `stream` is `True`.
         """
 
         # Build the URL.
@@ -127,6 +596,290 @@ class FederalTreasurySession():
             "URL: {url}".format(url=url)
         )
 
+        params = self.prepare_params(params=params)
+
+        if stream:
+
+            response = self.send_with_retries(
+                method=method,
+                url=url,
+                params=params,
+                data=data,
+                json_payload=json_payload,
+                stream=True,
+                endpoint=endpoint
+            )
+
+            # Errors are read whole and raised as usual.
+            if response.status_code >= 400:
+                self.process_response(response=response)
+
+            if params.get('format') == CSV_FORMAT:
+                return CSVRecordStream(
+                    chunks=response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                    response=response
+                )
+
+            return RecordStream(
+                chunks=response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                decode=self.decoder.decode,
+                response=response
+            )
+
+        # Serve the request from the caches, if we can.
+        cached_content = self.cache_lookup(method=method, endpoint=endpoint, params=params)
+
+        if cached_content is not None:
+            return cached_content
+
+        def fetch() -> Dict:
+            return self.fetch_content(
+                method=method,
+                url=url,
+                endpoint=endpoint,
+                params=params,
+                data=data,
+                json_payload=json_payload
+            )
+
+        # Identical GET requests in flight share one call.
+        if method.upper() == 'GET':
+            return self.request_coalescer.do(key=canonical_key(endpoint=endpoint, params=params), function=fetch)
+
+        return fetch()
+
+    def fetch_content(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        params: dict = None,
+        data: dict = None,
+        json_payload: dict = None
+    ) -> Dict:
+        """Sends a request, then decodes and caches its content.
+
+        ### Parameters:
+        ----
+        method : str
+            The Request method.
+
+        url : str
+            The full URL of the request.
+
+        endpoint : str
+            The API URL endpoint.
+
+        params : dict (optional, Default=None)
+            The cleaned URL params for the request.
+
+        data : dict (optional, Default=None)
+            A data payload for a request.
+
+        json_payload : dict (optional, Default=None)
+            A json data payload for a request.
+
+        ### Returns:
+        ----
+        Dict:
+            A Dictionary object containing the JSON values.
+        """
+
+        try:
+
+            if self.hedging_policy is not None and method.upper() == 'GET':
+                response = self.send_hedged(method=method, url=url, params=params, endpoint=endpoint)
+            else:
+                # Send the request, retrying any transient failures.
+                response = self.send_with_retries(
+                    method=method,
+                    url=url,
+                    params=params,
+                    data=data,
+                    json_payload=json_payload,
+                    endpoint=endpoint
+                )
+
+        except CircuitOpenError:
+
+            content = self.stale_content(method=method, endpoint=endpoint, params=params)
+
+            if content is None:
+                raise
+
+            return content
+
+        content = self.process_response(response=response, endpoint=endpoint)
+
+        self.cache_store(method=method, endpoint=endpoint, params=params, response=response, content=content)
+
+        return content
+
+    def cache_lookup(self, method: str, endpoint: str, params: dict) -> Union[Dict, None]:
+        """Looks up a GET request in the caches.
+
+        ### Overview:
+        ---
+        The in-memory cache is checked first, then the persistent cache,
+        whose hits are decoded and promoted to the in-memory cache.
+
+        ### Parameters:
+        ----
+        method : str
+            The Request method, only GET requests are cached.
+
+        endpoint : str
+            The API URL endpoint.
+
+        params : dict
+            The cleaned URL params for the request.
+
+        ### Returns:
+        ----
+        Union[Dict, None]:
+            The cached content, or `None` on a miss.
+        """
+
+        if method.upper() != 'GET':
+            return None
+
+        if self.memory_cache is not None:
+
+            content = self.memory_cache.get(endpoint=endpoint, params=params)
+
+            if content is not None:
+                return content
+
+        if self.cache is not None:
+
+            body = self.cache.get(endpoint=endpoint, params=params)
+
+            if body is not None:
+
+                logging.info('CACHE HIT: {endpoint}'.format(endpoint=endpoint))
+                content = self.load_content(body=body, endpoint=endpoint)
+
+                if self.memory_cache is not None:
+                    self.memory_cache.set(endpoint=endpoint, params=params, content=content, size=len(body))
+
+                return content
+
+        return None
+
+    def stale_content(self, method: str, endpoint: str, params: dict) -> Union[Dict, None]:
+        """Looks up an expired response in the persistent cache, for an endpoint whose circuit is open.
+
+        ### Parameters:
+        ----
+        method : str
+            The Request method, only GET requests are served stale.
+
+        endpoint : str
+            The API URL endpoint.
+
+        params : dict
+            The cleaned URL params for the request.
+
+        ### Returns:
+        ----
+        Union[Dict, None]:
+            The stale content, or `None` if the `CircuitBreaker` does not
+            serve stale content or the cache holds none.
+        """
+
+        if method.upper() != 'GET' or self.cache is None or not self.circuit_breaker.serve_stale:
+            return None
+
+        body = self.cache.get(endpoint=endpoint, params=params, allow_stale=True)
+
+        if body is None:
+            return None
+
+        logging.warning('CIRCUIT OPEN: serving a stale response for {endpoint}'.format(endpoint=endpoint))
+
+        return self.load_content(body=body, endpoint=endpoint)
+
+    def load_content(self, body: bytes, endpoint: str = None) -> Dict:
+        """Decodes a response body, typing and interning its records if asked to.
+
+        ### Parameters:
+        ----
+        body : bytes
+            The raw body of a response.
+
+        endpoint : str (optional, Default=None)
+            The API URL endpoint, whose strings are interned together.
+
+        ### Returns:
+        ----
+        Dict:
+            A Dictionary object containing the JSON values.
+        """
+
+        content = self.decoder.decode(body)
+
+        if self.type_decoder is not None:
+            content = self.type_decoder.decode(content=content, endpoint=endpoint)
+
+        if self.string_interner is not None and endpoint is not None:
+            content = self.string_interner.decode(content=content, endpoint=endpoint)
+
+        return content
+
+    def cache_store(self, method: str, endpoint: str, params: dict, response: object, content: Dict) -> None:
+        """Stores a successful GET request in the caches.
+
+        ### Parameters:
+        ----
+        method : str
+            The Request method, only GET requests are cached.
+
+        endpoint : str
+            The API URL endpoint.
+
+        params : dict
+            The cleaned URL params for the request.
+
+        response : object
+            The successful `requests` or `httpx` response.
+
+        content : Dict
+            The decoded content of the response.
+        """
+
+        if method.upper() != 'GET' or not response.content:
+            return
+
+        if self.memory_cache is not None:
+            self.memory_cache.set(endpoint=endpoint, params=params, content=content, size=len(response.content))
+
+        if self.cache is not None:
+            self.cache.set(endpoint=endpoint, params=params, body=response.content)
+
+    def prepare_params(self, params: dict = None) -> dict:
+        """Cleans up the URL params before they are sent.
+
+        ### Overview:
+        ---
+        Returns a new dictionary, leaving the caller's untouched, with
+        `None` values dropped, dates converted to ISO strings and list
+        values joined.
+
+        ### Parameters:
+        ----
+        params : dict (optional, Default=None)
+            The URL params for the request.
+
+        ### Returns:
+        ----
+        dict:
+            The cleaned URL params.
+        """
+
+        params = {
+            key: value for key, value in (params or {}).items() if value is not None
+        }
+
         if 'realtime_start' in params and isinstance(params['realtime_start'], datetime):
             params['realtime_start'] = params['realtime_start'].date().isoformat()
 
@@ -150,51 +903,334 @@ class FederalTreasurySession():
             "PARAMS: {params}".format(params=params_cleaned)
         )
 
-        # Define a new session.
-        request_session = requests.Session()
-        request_session.verify = True
-
-        # Define a new request.
-        request_request = requests.Request(
-            method=method.upper(),
-            url=url,
-            params=params,
-            data=data,
-            json=json_payload
-        ).prepare()
-
-        # Send the request.
-        response: requests.Response = request_session.send(
-            request=request_request
-        )
+        return params
+
+    def process_response(self, response: requests.Response, endpoint: str = None) -> Dict:
+        """Turns the final response into content, or raises an error.
+
+        ### Parameters:
+        ----
+        response : requests.Response
+            The final response received from the API.
 
-        # Close the session.
-        request_session.close()
+        endpoint : str (optional, Default=None)
+            The API URL endpoint that was requested.
+
+        ### Raises:
+        ----
+        requests.HTTPError:
+            If the response has an error status code.
+
+        ### Returns:
+        ----
+        Dict:
+            A Dictionary object containing the JSON values.
+        """
+
+        response_ok = response.status_code < 400
 
         # If it's okay and no details.
-        if response.ok and len(response.content) > 0:
-            return response.json()
+        if response_ok and len(response.content) > 0:
+            return self.load_content(body=response.content, endpoint=endpoint)
 
-        elif len(response.content) > 0 and response.ok:
+        elif len(response.content) == 0 and response_ok:
             return {
                 'message': 'response successful',
                 'status_code': response.status_code
             }
 
-        elif not response.ok:
+        # Define the error dict.
+        error_dict = {
+            'error_code': response.status_code,
+            'response_url': str(response.url),
+            'response_body': self._parse_error_body(response=response),
+            'response_request': dict(response.request.headers),
+            'response_method': response.request.method,
+        }
 
-            # Define the error dict.
-            error_dict = {
-                'error_code': response.status_code,
-                'response_url': response.url,
-                'response_body': json.loads(response.content.decode('ascii')),
-                'response_request': dict(response.request.headers),
-                'response_method': response.request.method,
-            }
+        # Log the error.
+        logging.error(
+            msg=json.dumps(obj=error_dict, indent=4)
+        )
 
-            # Log the error.
-            logging.error(
-                msg=json.dumps(obj=error_dict, indent=4)
-            )
+        raise requests.HTTPError(
+            '{code} Error for url: {url}'.format(
+                code=response.status_code,
+                url=response.url
+            ),
+            response=response
+        )
+
+    def send_hedged(self, method: str, url: str, endpoint: str, params: dict = None) -> requests.Response:
+        """Sends a GET request, and sends it again if it is slower than the `HedgingPolicy` allows.
+
+        ### Overview:
+        ---
+        Both requests run on the threads of the session, each with its
+        retries, and the first successful response is returned. The
+        delay before the hedge, and the latency recorded for the policy,
+        run from when an attempt starts, not from when it is queued. The
+        other one is cancelled if it has not started, otherwise its
+        response is closed as soon as it arrives, since a request sent
+        by `requests` cannot be interrupted.
+
+        ### Parameters:
+        ----
+        method : str
+            The Request method.
+
+        url : str
+            The full URL of the request.
+
+        endpoint : str
+            The API URL endpoint, whose latencies set the delay.
+
+        params : dict (optional, Default=None)
+            The URL params for the request.
+
+        ### Returns:
+        ----
+        requests.Response:
+            The first response received from the API.
+        """
+
+        policy = self.hedging_policy
+        executor = self.hedging_executor
+
+        def send(started: threading.Event) -> Tuple[requests.Response, float]:
+            started.set()
+            sent_at = time.monotonic()
+            response = self.send_with_retries(method=method, url=url, params=params, endpoint=endpoint)
+            return response, time.monotonic() - sent_at
+
+        first_started = threading.Event()
+        first = executor.submit(send, first_started)
+
+        # The delay runs from when the first attempt leaves the queue of the executor.
+        while not first_started.wait(timeout=0.1) and not first.done():
+            pass
+
+        pending = {first}
+        done, pending = wait(pending, timeout=policy.delay_for(endpoint=endpoint))
+
+        if not done and policy.try_hedge():
+            logging.info('HEDGE: {url}'.format(url=url))
+            pending.add(executor.submit(send, threading.Event()))
+
+        error = None
+
+        while True:
+
+            for future in done:
+
+                if future.exception() is None:
+
+                    response, latency = future.result()
+                    policy.record(endpoint=endpoint, latency=latency)
+
+                    for loser in pending:
+                        if not loser.cancel():
+                            loser.add_done_callback(_close_response)
+
+                    return response
+
+                error = error or future.exception()
+
+            if not pending:
+                raise error
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+    @property
+    def hedging_executor(self) -> ThreadPoolExecutor:
+        """The threads sending the hedged requests, created on first use."""
+
+        if self._hedging_executor is None:
+
+            with self._http_session_lock:
+
+                if self._hedging_executor is None:
+                    self._hedging_executor = ThreadPoolExecutor(
+                        max_workers=self.pool_maxsize,
+                        thread_name_prefix='treasury-hedging'
+                    )
+
+        return self._hedging_executor
+
+    def send_with_retries(
+        self,
+        method: str,
+        url: str,
+        params: dict = None,
+        data: dict = None,
+        json_payload: dict = None,
+        stream: bool = False,
+        endpoint: str = None
+    ) -> requests.Response:
+        """Sends a request, retrying it according to the `RetryPolicy`.
+
+        ### Overview:
+        ---
+        Connection errors, timeouts and retryable status codes are retried
+        after the delay computed by the policy. Once the attempts are used
+        up, the last error is raised or the last response is returned so
+        the caller can report it.
+
+        ### Parameters:
+        ----
+        method : str
+            The Request method.
+
+        url : str
+            The full URL of the request.
+
+        params : dict (optional, Default=None)
+            The URL params for the request.
+
+        data : dict (optional, Default=None)
+            A data payload for a request.
+
+        json_payload : dict (optional, Default=None)
+            A json data payload for a request.
+
+        stream : bool (optional, Default=False)
+            If `True`, the body is left on the socket to be read in chunks.
+
+        endpoint : str (optional, Default=None)
+            The API URL endpoint, whose family the `concurrency_limiter`
+            caps, if any.
+
+        ### Returns:
+        ----
+        requests.Response:
+            The final response received from the API.
+        """
+
+        breaker = self.circuit_breaker if endpoint is not None else None
+        probe = breaker.check(endpoint=endpoint) if breaker is not None else False
+
+        try:
+
+            attempt = 0
+
+            while True:
+
+                attempt += 1
+
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+
+                limited = self.concurrency_limiter is not None and endpoint is not None
+
+                if limited:
+                    self.concurrency_limiter.acquire(endpoint=endpoint)
+
+                started = time.monotonic()
+
+                # Left `None` if the attempt is cancelled, or fails on our side.
+                overloaded = None
+
+                try:
+                    response: requests.Response = self.http_session.request(
+                        method=method.upper(),
+                        url=url,
+                        params=params,
+                        data=data,
+                        json=json_payload,
+                        timeout=self.timeout,
+                        stream=stream
+                    )
+                    overloaded = response.status_code == 429 or response.status_code >= 500
+                except (requests.ConnectionError, requests.Timeout) as error:
+
+                    overloaded = True
+
+                    if not self.retry_policy.is_retryable(method=method, attempt=attempt, error=error):
+
+                        if breaker is not None:
+                            breaker.record_failure(endpoint=endpoint)
+
+                        raise
+
+                    delay = self.retry_policy.compute_delay(attempt=attempt)
+                    reason = repr(error)
+
+                else:
+
+                    if not self.retry_policy.is_retryable(
+                        method=method,
+                        attempt=attempt,
+                        status_code=response.status_code
+                    ):
+
+                        if breaker is not None:
+                            breaker.record_response(endpoint=endpoint, status_code=response.status_code)
+
+                        return response
+
+                    delay = self.retry_policy.compute_delay(
+                        attempt=attempt,
+                        retry_after=response.headers.get('Retry-After')
+                    )
+                    reason = 'status code {code}'.format(code=response.status_code)
+
+                    # Release the connection back to the pool before waiting.
+                    response.close()
+
+                finally:
+
+                    if limited and overloaded is None:
+                        self.concurrency_limiter.abandon(endpoint=endpoint)
+                    elif limited:
+                        self.concurrency_limiter.release(
+                            endpoint=endpoint,
+                            latency=time.monotonic() - started,
+                            overloaded=overloaded
+                        )
+
+                logging.warning(
+                    'RETRY: attempt {attempt} for {url} failed with {reason}, retrying in {delay:.2f}s'.format(
+                        attempt=attempt,
+                        url=url,
+                        reason=reason,
+                        delay=delay
+                    )
+                )
+
+                time.sleep(delay)
+
+        except BaseException:
+
+            # A probe cancelled, or failing on our side, did not test the API.
+            if probe:
+                breaker.abandon(endpoint=endpoint)
+
+            raise
+
+    @staticmethod
+    def _parse_error_body(response: object) -> Union[dict, str]:
+        """Decodes the body of an error response for logging.
+
+        ### Parameters:
+        ----
+        response : object
+            The failed response, either a `requests` or `httpx` response.
+
+        ### Returns:
+        ----
+        Union[dict, str]:
+            The JSON body if there is one, otherwise the raw text.
+        """
+
+        try:
+            return response.json()
+        except ValueError:
+            return response.text
+
+
+def _close_response(future: Future) -> None:
+    """Closes the response of a hedged request that lost the race."""
 
-            raise requests.HTTPError()
+    if not future.cancelled() and future.exception() is None:
+        response, _ = future.result()
+        response.close()
@@ -0,0 +1,461 @@
+import re
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Union
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import AsyncIterable
+from typing import AsyncIterator
+
+# The number of bytes read from the socket at a time.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_NON_WHITESPACE = re.compile(rb'\S')
+_STRUCTURE = re.compile(rb'[{}\[\]"]')
+_STRING_END = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb'[,}\]\s]')
+
+# A run of flat records, the shape of every endpoint, matched in one
+# pass so they can be decoded together rather than scanned one by one.
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_FLAT_RECORDS = re.compile(
+    rb'(?:\s*(?:,\s*)?\{[^{}\[\]"]*(?:' + _STRING + rb'[^{}\[\]"]*)*\})*'
+)
+
+_QUOTE = ord('"')
+_COMMA = ord(',')
+_COLON = ord(':')
+_OPEN_BRACE = ord('{')
+_CLOSE_BRACE = ord('}')
+_OPEN_BRACKET = ord('[')
+_CLOSE_BRACKET = ord(']')
+
+
+def _string_end(buffer: bytearray, start: int) -> int:
+    """Finds the end of the string opened at `start`, or -1 if it is cut off."""
+
+    position = start + 1
+
+    while True:
+
+        match = _STRING_END.search(buffer, position)
+
+        if match is None:
+            return -1
+
+        if buffer[match.start()] == _QUOTE:
+            return match.end()
+
+        # Skip the escaped character.
+        position = match.start() + 2
+
+        if position > len(buffer):
+            return -1
+
+
+def _value_end(buffer: bytearray, start: int) -> int:
+    """Finds the end of the JSON value starting at `start`, or -1 if it is cut off."""
+
+    first = buffer[start]
+
+    if first == _QUOTE:
+        return _string_end(buffer=buffer, start=start)
+
+    if first != _OPEN_BRACE and first != _OPEN_BRACKET:
+        match = _SCALAR_END.search(buffer, start)
+        return match.start() if match else -1
+
+    depth = 0
+    position = start
+
+    while True:
+
+        match = _STRUCTURE.search(buffer, position)
+
+        if match is None:
+            return -1
+
+        character = buffer[match.start()]
+
+        if character == _QUOTE:
+
+            position = _string_end(buffer=buffer, start=match.start())
+
+            if position == -1:
+                return -1
+
+            continue
+
+        if character == _OPEN_BRACE or character == _OPEN_BRACKET:
+            depth += 1
+        else:
+            depth -= 1
+
+        position = match.end()
+
+        if depth == 0:
+            return position
+
+
+class RecordParser():
+
+    """
+    Overview:
+    ----
+    An incremental parser of the responses of the API. It is fed the
+    body chunk by chunk, and hands back each record of the `data` array
+    as soon as it is complete, so only one record, and the chunk it came
+    in, is held in memory at a time. The other top level values, `meta`
+    and `links`, are decoded whole when they are reached.
+    """
+
+    def __init__(self, decode: Callable[[bytes], Any], array_key: str = 'data') -> None:
+        """Initializes the `RecordParser` object.
+
+        ### Parameters
+        ----
+        decode : Callable[[bytes], Any]
+            Decodes one complete JSON value, for example `JSONDecoder().decode`.
+
+        array_key : str (optional, Default='data')
+            The top level key of the array whose elements are streamed.
+        """
+
+        self.decode = decode
+        self.array_key = array_key
+        self.content: Dict[str, Any] = {}
+
+        self._buffer = bytearray()
+        self._position = 0
+        self._state = 'start'
+        self._key = None
+
+    def __repr__(self) -> str:
+        """String representation of the `RecordParser` object."""
+
+        return '<FederalTreasuryClient.RecordParser (state={state}, buffered={buffered})>'.format(
+            state=self._state,
+            buffered=len(self._buffer) - self._position
+        )
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole document has been parsed."""
+
+        return self._state == 'done'
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Parses the next chunk of the body.
+
+        ### Parameters
+        ----
+        chunk : bytes
+            The next bytes of the body.
+
+        ### Returns
+        ----
+        List[Any]:
+            The records completed by this chunk.
+        """
+
+        # Drop what was already parsed before growing the buffer.
+        if self._position:
+            del self._buffer[:self._position]
+            self._position = 0
+
+        self._buffer += chunk
+
+        return list(self._parse())
+
+    def close(self) -> None:
+        """Checks that the body ended with the document.
+
+        ### Raises
+        ----
+        ValueError:
+            If the body was cut off.
+        """
+
+        if self._state != 'done':
+            raise ValueError(
+                'The response body ended before the JSON document, {size} bytes left unparsed.'.format(
+                    size=len(self._buffer) - self._position
+                )
+            )
+
+    def _parse(self) -> Iterator[Any]:
+        """Parses as much of the buffer as possible."""
+
+        buffer = self._buffer
+
+        while True:
+
+            match = _NON_WHITESPACE.search(buffer, self._position)
+
+            if match is None:
+                self._position = len(buffer)
+                return
+
+            self._position = position = match.start()
+            character = buffer[position]
+            state = self._state
+
+            if state == 'element':
+
+                end = _FLAT_RECORDS.match(buffer, position).end()
+
+                if end > position:
+                    self._position = end
+                    yield from self.decode(b'[' + bytes(buffer[position:end]).lstrip(b', \t\r\n') + b']')
+                    continue
+
+                if character == _COMMA:
+                    self._position += 1
+                elif character == _CLOSE_BRACKET:
+                    self._position += 1
+                    self._state = 'key'
+                else:
+
+                    end = _value_end(buffer=buffer, start=position)
+
+                    if end == -1:
+                        return
+
+                    self._position = end
+                    yield self.decode(bytes(buffer[position:end]))
+
+            elif state == 'key':
+
+                if character == _COMMA:
+                    self._position += 1
+                elif character == _CLOSE_BRACE:
+                    self._position += 1
+                    self._state = 'done'
+                elif character == _QUOTE:
+
+                    end = _string_end(buffer=buffer, start=position)
+
+                    if end == -1:
+                        return
+
+                    self._key = self.decode(bytes(buffer[position:end]))
+                    self._position = end
+                    self._state = 'colon'
+
+                else:
+                    self._unexpected(character=character)
+
+            elif state == 'colon':
+
+                if character != _COLON:
+                    self._unexpected(character=character)
+
+                self._position += 1
+                self._state = 'value'
+
+            elif state == 'value':
+
+                if self._key == self.array_key and character == _OPEN_BRACKET:
+                    self._position += 1
+                    self._state = 'element'
+                    continue
+
+                end = _value_end(buffer=buffer, start=position)
+
+                if end == -1:
+                    return
+
+                self.content[self._key] = self.decode(bytes(buffer[position:end]))
+                self._position = end
+                self._state = 'key'
+
+            elif state == 'start':
+
+                if character != _OPEN_BRACE:
+                    self._unexpected(character=character)
+
+                self._position += 1
+                self._state = 'key'
+
+            else:
+                self._unexpected(character=character)
+
+    def _unexpected(self, character: int) -> None:
+        """Raises on a character that does not belong in a response."""
+
+        raise ValueError(
+            'Unexpected character {character!r} while parsing a {state} of the response.'.format(
+                character=chr(character),
+                state=self._state
+            )
+        )
+
+
+class RecordStream():
+
+    """
+    Overview:
+    ----
+    Iterates over the records of a streamed response. The `meta` and
+    `links` of the response are `None` until the parser reaches them,
+    which is after the records, so read them once the stream is
+    exhausted. The connection is released when the stream is exhausted
+    or closed.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        decode: Callable[[bytes], Any],
+        response: object = None
+    ) -> None:
+        """Initializes the `RecordStream` object.
+
+        ### Parameters
+        ----
+        chunks : Iterable[bytes]
+            The chunks of the body, for example `response.iter_content()`.
+
+        decode : Callable[[bytes], Any]
+            Decodes one complete JSON value.
+
+        response : object (optional, Default=None)
+            The streamed response, closed once the stream is done.
+
+        ### Usage
+        ----
+            >>> with treasury_client.stream_records(other_data_service.debt_to_penny, page_size=10000) as stream:
+                    for record in stream:
+                        print(record['record_date'])
+            >>> stream.meta['total-count']
+        """
+
+        self.chunks = chunks
+        self.response = response
+        self.parser = RecordParser(decode=decode)
+
+    def __repr__(self) -> str:
+        """String representation of the `RecordStream` object."""
+
+        return '<FederalTreasuryClient.RecordStream (done={done})>'.format(done=self.parser.done)
+
+    def __enter__(self) -> 'RecordStream':
+        """Returns the stream."""
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Releases the connection of the stream."""
+
+        self.close()
+
+    def __iter__(self) -> Iterator[dict]:
+        """Yields the records as they are parsed."""
+
+        try:
+
+            for chunk in self.chunks:
+                yield from self.parser.feed(chunk=chunk)
+
+            self.parser.close()
+
+        finally:
+            self.close()
+
+    @property
+    def meta(self) -> Union[Dict, None]:
+        """The `meta` of the response, once it has been reached."""
+
+        return self.parser.content.get('meta')
+
+    @property
+    def links(self) -> Union[Dict, None]:
+        """The `links` of the response, once they have been reached."""
+
+        return self.parser.content.get('links')
+
+    def close(self) -> None:
+        """Releases the connection of the stream."""
+
+        if self.response is not None:
+            self.response.close()
+
+
+class AsyncRecordStream(RecordStream):
+
+    """
+    Overview:
+    ----
+    The asyncio counterpart of the `RecordStream`, iterated with
+    `async for` over the chunks of an `httpx` streamed response.
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterable[bytes],
+        decode: Callable[[bytes], Any],
+        response: object = None
+    ) -> None:
+        """Initializes the `AsyncRecordStream` object.
+
+        ### Parameters
+        ----
+        chunks : AsyncIterable[bytes]
+            The chunks of the body, for example `response.aiter_bytes()`.
+
+        decode : Callable[[bytes], Any]
+            Decodes one complete JSON value.
+
+        response : object (optional, Default=None)
+            The streamed `httpx.Response`, closed once the stream is done.
+        """
+
+        super().__init__(chunks=chunks, decode=decode, response=response)
+
+    def __repr__(self) -> str:
+        """String representation of the `AsyncRecordStream` object."""
+
+        return '<FederalTreasuryClient.AsyncRecordStream (done={done})>'.format(done=self.parser.done)
+
+    def __enter__(self) -> None:
+        """An `AsyncRecordStream` can only be used with `async with`."""
+
+        raise TypeError('Use `async with` with an `AsyncRecordStream`.')
+
+    def __iter__(self) -> None:
+        """An `AsyncRecordStream` can only be iterated with `async for`."""
+
+        raise TypeError('Use `async for` with an `AsyncRecordStream`.')
+
+    async def __aenter__(self) -> 'AsyncRecordStream':
+        """Returns the stream."""
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Releases the connection of the stream."""
+
+        await self.aclose()
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        """Yields the records as they are parsed."""
+
+        try:
+
+            async for chunk in self.chunks:
+                for record in self.parser.feed(chunk=chunk):
+                    yield record
+
+            self.parser.close()
+
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Releases the connection of the stream."""
+
+        if self.response is not None:
+            await self.response.aclose()
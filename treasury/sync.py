@@ -0,0 +1,463 @@
+import re
+import json
+import sqlite3
+import hashlib
+import inspect
+import logging
+import pathlib
+import threading
+
+from typing import Dict
+from typing import List
+from typing import Union
+from typing import Callable
+from typing import NamedTuple
+from collections import Counter
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+
+from treasury.pagination import Paginator
+from treasury.pagination import resolve_request
+
+
+class SyncResult(NamedTuple):
+
+    """The outcome of syncing one dataset."""
+
+    dataset: str
+    endpoint: str
+    since: Union[str, None]
+    rows_fetched: int
+    rows_added: int
+    rows_updated: int
+    rows_removed: int
+
+
+def dataset_name(method: Callable) -> str:
+    """Names the local table of a bound endpoint method.
+
+    ### Parameters
+    ----
+    method : Callable
+        A bound endpoint method, for example `other_data_service.debt_to_penny`.
+
+    ### Returns
+    ----
+    str:
+        The name of the table, for example `other_data__debt_to_penny`.
+    """
+
+    service_name = re.sub(r'(?<!^)(?=[A-Z])', '_', type(method.__self__).__name__).lower()
+
+    return '{service}__{method}'.format(service=service_name, method=method.__name__)
+
+
+def endpoint_methods(service: object) -> List[Callable]:
+    """Lists the endpoint methods of a service.
+
+    ### Parameters
+    ----
+    service : object
+        A service object, for example `treasury_client.other_data()`.
+
+    ### Returns
+    ----
+    List[Callable]:
+        The bound endpoint methods of the service.
+    """
+
+    return [
+        getattr(service, name)
+        for name, _ in inspect.getmembers(type(service), inspect.isfunction)
+        if not name.startswith('_')
+    ]
+
+
+class SyncEngine():
+
+    """
+    Overview:
+    ----
+    Mirrors datasets into a local SQLite database. The first sync of a
+    dataset downloads its full history, later syncs only request the
+    records dated after the latest one stored, minus a look-back window
+    that catches revisions. The records of that window are replaced by
+    the fresh ones, and the rows added, updated and removed are reported.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, pathlib.Path] = 'data/treasury_mirror.sqlite',
+        lookback_days: int = 30,
+        page_size: Union[int, str] = 'auto',
+        busy_timeout: float = 30.0
+    ) -> None:
+        """Initializes the `SyncEngine` object.
+
+        ### Parameters
+        ----
+        path : Union[str, pathlib.Path] (optional, Default='data/treasury_mirror.sqlite')
+            The path of the SQLite database, created if needed.
+
+        lookback_days : int (optional, Default=30)
+            The number of days before the latest stored `record_date`
+            that are downloaded again to catch revisions.
+
+        page_size : Union[int, str] (optional, Default='auto')
+            The page size of the requests, see `Paginator.iter_pages`.
+
+        busy_timeout : float (optional, Default=30.0)
+            The number of seconds to wait on a database locked by
+            another process.
+
+        ### Usage
+        ----
+            >>> sync_engine = SyncEngine(path='data/treasury_mirror.sqlite')
+            >>> sync_engine.sync(treasury_client.other_data().debt_to_penny)
+            >>> sync_engine.sync_service(treasury_client.daily_treasury_statements())
+        """
+
+        self.path = pathlib.Path(path)
+        self.lookback_days = lookback_days
+        self.page_size = page_size
+        self.busy_timeout = busy_timeout
+
+        self._local = threading.local()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS _datasets (
+                    dataset TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    data_types TEXT,
+                    max_record_date TEXT,
+                    synced_at TEXT
+                )
+                """
+            )
+
+    def __repr__(self) -> str:
+        """String representation of the `SyncEngine` object."""
+
+        str_representation = '<FederalTreasuryClient.SyncEngine (path={path})>'.format(
+            path=self.path
+        )
+
+        return str_representation
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The SQLite connection of the current thread."""
+
+        connection = getattr(self._local, 'connection', None)
+
+        if connection is None:
+
+            connection = sqlite3.connect(str(self.path), timeout=self.busy_timeout)
+            connection.execute('PRAGMA journal_mode=WAL')
+
+            self._local.connection = connection
+
+        return connection
+
+    def close(self) -> None:
+        """Closes the SQLite connection of the current thread."""
+
+        connection = getattr(self._local, 'connection', None)
+
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def columns(self, dataset: str) -> List[str]:
+        """Lists the record fields stored for a dataset.
+
+        ### Parameters
+        ----
+        dataset : str
+            The name of the dataset table.
+
+        ### Returns
+        ----
+        List[str]:
+            The stored fields, empty if the dataset was never synced.
+        """
+
+        rows = self.connection.execute(
+            'PRAGMA table_info({table})'.format(table=quote_identifier(dataset))
+        ).fetchall()
+
+        return [row[1] for row in rows if not row[1].startswith('_')]
+
+    def dataset_info(self, dataset: str) -> Union[Dict, None]:
+        """Returns what is known about a synced dataset.
+
+        ### Parameters
+        ----
+        dataset : str
+            The name of the dataset table.
+
+        ### Returns
+        ----
+        Union[Dict, None]:
+            The endpoint, `meta['dataTypes']`, latest `record_date` and
+            time of the last sync, or `None` if it was never synced.
+        """
+
+        row = self.connection.execute(
+            'SELECT endpoint, data_types, max_record_date, synced_at FROM _datasets WHERE dataset = ?',
+            (dataset,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            'endpoint': row[0],
+            'data_types': json.loads(row[1]) if row[1] else {},
+            'max_record_date': row[2],
+            'synced_at': row[3]
+        }
+
+    def sync(self, method: Callable, lookback_days: int = None, filters: List[str] = None) -> SyncResult:
+        """Brings the local copy of one dataset up to date.
+
+        ### Parameters
+        ----
+        method : Callable
+            A bound endpoint method, for example `other_data_service.debt_to_penny`.
+
+        lookback_days : int (optional, Default=None)
+            Overrides the look-back window of the engine for this sync.
+
+        filters : List[str] (optional, Default=None)
+            Extra filters restricting which records are mirrored.
+
+        ### Raises
+        ----
+        ValueError:
+            If the session of the method converts records with a
+            `TypeDecoder`, the local copy stores the API's strings.
+
+        ### Returns
+        ----
+        SyncResult:
+            The number of rows fetched, added, updated and removed.
+
+        ### Usage
+        ----
+            >>> sync_engine.sync(treasury_client.other_data().debt_to_penny)
+            SyncResult(dataset='other_data__debt_to_penny', ..., rows_added=1, rows_updated=0, rows_removed=0)
+        """
+
+        if getattr(method.__self__.treasury_session, 'type_decoder', None) is not None:
+            raise ValueError(
+                'The `SyncEngine` mirrors the raw strings of the API, use a client without a `type_decoder`.'
+            )
+
+        dataset = dataset_name(method=method)
+        endpoint = resolve_request(method).endpoint
+        lookback_days = self.lookback_days if lookback_days is None else lookback_days
+
+        info = self.dataset_info(dataset=dataset)
+        max_record_date = info['max_record_date'] if info else None
+
+        since = None
+        filters = list(filters or [])
+
+        if max_record_date:
+            since = (date.fromisoformat(max_record_date) - timedelta(days=lookback_days)).isoformat()
+            filters.append('record_date:gte:{since}'.format(since=since))
+
+        logging.info(
+            'SYNC: {dataset} since {since}'.format(dataset=dataset, since=since or 'the beginning')
+        )
+
+        pages = Paginator().iter_pages(
+            method,
+            filters=filters or None,
+            sort=['record_date'],
+            page_size=self.page_size
+        )
+
+        connection = self.connection
+        counts = Counter()
+        data_types = info['data_types'] if info else {}
+
+        with connection:
+
+            # The stored rows of the window, before they are replaced.
+            old_hashes = Counter()
+
+            if since is not None and self.columns(dataset=dataset):
+
+                old_hashes.update(
+                    row[0] for row in connection.execute(
+                        'SELECT _row_hash FROM {table} WHERE record_date >= ?'.format(table=quote_identifier(dataset)),
+                        (since,)
+                    )
+                )
+
+                connection.execute(
+                    'DELETE FROM {table} WHERE record_date >= ?'.format(table=quote_identifier(dataset)),
+                    (since,)
+                )
+
+            columns = self.columns(dataset=dataset)
+
+            for content in pages:
+
+                data_types = (content.get('meta') or {}).get('dataTypes') or data_types
+                records = content.get('data') or []
+
+                if not records:
+                    continue
+
+                columns = self._ensure_columns(dataset=dataset, columns=columns, record=records[0])
+                rows = []
+
+                for record in records:
+
+                    row_hash = record_hash(record=record)
+
+                    if old_hashes[row_hash] > 0:
+                        old_hashes[row_hash] -= 1
+                    elif max_record_date and record.get('record_date', '') <= max_record_date:
+                        counts['changed'] += 1
+                    else:
+                        counts['added'] += 1
+
+                    counts['fetched'] += 1
+                    rows.append([record.get(column) for column in columns] + [row_hash])
+
+                connection.executemany(
+                    'INSERT INTO {table} ({columns}, _row_hash) VALUES ({placeholders})'.format(
+                        table=quote_identifier(dataset),
+                        columns=', '.join(quote_identifier(column) for column in columns),
+                        placeholders=', '.join('?' * (len(columns) + 1))
+                    ),
+                    rows
+                )
+
+            new_max = connection.execute(
+                'SELECT MAX(record_date) FROM {table}'.format(table=quote_identifier(dataset))
+            ).fetchone()[0] if columns else None
+
+            connection.execute(
+                'INSERT OR REPLACE INTO _datasets (dataset, endpoint, data_types, max_record_date, synced_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (dataset, endpoint, json.dumps(data_types), new_max, datetime.now().isoformat())
+            )
+
+        # A changed record of the window replaces one that disappeared.
+        rows_vanished = sum(old_hashes.values())
+        rows_updated = min(counts['changed'], rows_vanished)
+
+        result = SyncResult(
+            dataset=dataset,
+            endpoint=endpoint,
+            since=since,
+            rows_fetched=counts['fetched'],
+            rows_added=counts['added'] + counts['changed'] - rows_updated,
+            rows_updated=rows_updated,
+            rows_removed=rows_vanished - rows_updated
+        )
+
+        logging.info('SYNC: {result}'.format(result=result))
+
+        return result
+
+    def sync_service(self, service: object, lookback_days: int = None) -> List[SyncResult]:
+        """Brings the local copy of every dataset of a service up to date.
+
+        ### Parameters
+        ----
+        service : object
+            A service object, for example `treasury_client.daily_treasury_statements()`.
+
+        lookback_days : int (optional, Default=None)
+            Overrides the look-back window of the engine for this sync.
+
+        ### Returns
+        ----
+        List[SyncResult]:
+            The result of each dataset.
+        """
+
+        return [
+            self.sync(method=method, lookback_days=lookback_days)
+            for method in endpoint_methods(service=service)
+        ]
+
+    def _ensure_columns(self, dataset: str, columns: List[str], record: dict) -> List[str]:
+        """Creates the dataset table, or adds the fields it is missing.
+
+        ### Parameters
+        ----
+        dataset : str
+            The name of the dataset table.
+
+        columns : List[str]
+            The fields already stored.
+
+        record : dict
+            A record of the dataset.
+
+        ### Returns
+        ----
+        List[str]:
+            The stored fields, including the new ones.
+        """
+
+        table = quote_identifier(dataset)
+
+        if not columns:
+
+            columns = list(record)
+
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS {table} ({columns}, _row_hash TEXT)'.format(
+                    table=table,
+                    columns=', '.join(quote_identifier(column) for column in columns)
+                )
+            )
+            self.connection.execute(
+                'CREATE INDEX IF NOT EXISTS {index} ON {table} (record_date)'.format(
+                    index=quote_identifier(dataset + '__record_date'),
+                    table=table
+                )
+            )
+
+            return columns
+
+        for column in record:
+
+            if column not in columns:
+
+                self.connection.execute(
+                    'ALTER TABLE {table} ADD COLUMN {column}'.format(
+                        table=table,
+                        column=quote_identifier(column)
+                    )
+                )
+                columns.append(column)
+
+        return columns
+
+
+def quote_identifier(identifier: str) -> str:
+    """Quotes a table or column name for SQLite."""
+
+    return '"{identifier}"'.format(identifier=identifier.replace('"', '""'))
+
+
+def record_hash(record: dict) -> str:
+    """Hashes the content of a record, to spot revised records."""
+
+    return hashlib.sha1(
+        json.dumps(record, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    ).hexdigest()
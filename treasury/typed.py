@@ -0,0 +1,344 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from typing import Callable
+from functools import partial
+from functools import lru_cache
+from datetime import date
+from decimal import Decimal
+from decimal import ROUND_HALF_EVEN
+from decimal import InvalidOperation
+
+# The `dataTypes` read as whole numbers.
+INTEGER_TYPES = frozenset(['INTEGER', 'YEAR', 'MONTH', 'DAY', 'QUARTER'])
+
+# The `dataTypes` read as decimal numbers, the currencies come as
+# `CURRENCY`, `CURRENCY0`, `CURRENCY3` and so on.
+NUMBER_TYPES = frozenset(['NUMBER', 'PERCENTAGE'])
+
+# The unit of the currency amounts of the endpoints under each prefix,
+# the Daily Treasury Statement reports its amounts in millions of dollars.
+AMOUNT_UNITS = {'/v1/accounting/dts/': 1000000}
+
+# The range of the whole numbers held in an `int64`.
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+@lru_cache(maxsize=8192)
+def parse_date(value: str) -> date:
+    """Parses a `DATE` value, the dates of a dataset repeat a lot so they are cached."""
+
+    return date.fromisoformat(value)
+
+
+def parse_integer(value: str) -> int:
+    """Parses an `INTEGER`, `YEAR`, `MONTH`, `DAY` or `QUARTER` value."""
+
+    try:
+        return int(value)
+    except ValueError:
+        return int(_strip_number(value=value))
+
+
+def parse_decimal(value: str) -> Decimal:
+    """Parses a `CURRENCY`, `NUMBER` or `PERCENTAGE` value exactly."""
+
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        return Decimal(_strip_number(value=value))
+
+
+def parse_float(value: str) -> float:
+    """Parses a `CURRENCY`, `NUMBER` or `PERCENTAGE` value as a float."""
+
+    try:
+        return float(value)
+    except ValueError:
+        return float(_strip_number(value=value))
+
+
+def parse_cents(value: str, unit: int = 1) -> int:
+    """Parses a `CURRENCY` value into a whole number of cents.
+
+    ### Overview
+    ----
+    Amounts with at most two decimals, all of them in practice, are read
+    by one `int` call on their digits, without building a `Decimal`.
+    Longer ones are rounded half to even through a `Decimal`.
+
+    ### Parameters
+    ----
+    value : str
+        The amount, for example `'31458430741793.28'`.
+
+    unit : int (optional, Default=1)
+        The number of dollars in one unit of the amount, `1000000` for
+        amounts in millions.
+
+    ### Raises
+    ----
+    OverflowError:
+        If the number of cents does not fit in an `int64`.
+
+    ### Returns
+    ----
+    int:
+        The amount in cents, `3145843074179328` for the example.
+    """
+
+    whole, _, fraction = value.partition('.')
+
+    try:
+        if len(fraction) > 2 or not value[-1:].isdigit():
+            raise ValueError(value)
+        cents = int(whole + fraction + '00'[len(fraction):]) * unit
+    except ValueError:
+        amount = Decimal(_strip_number(value=value)) * unit * 100
+        cents = int(amount.quantize(Decimal(1), rounding=ROUND_HALF_EVEN))
+
+    if not INT64_MIN <= cents <= INT64_MAX:
+        raise OverflowError(
+            'The amount `{value}` is too large for a 64 bit number of cents.'.format(value=value)
+        )
+
+    return cents
+
+
+def amount_unit(endpoint: str, units: Dict[str, int] = None) -> int:
+    """Finds the unit of the currency amounts of an endpoint.
+
+    ### Parameters
+    ----
+    endpoint : str
+        The API URL endpoint, `None` if unknown.
+
+    units : Dict[str, int] (optional, Default=None)
+        The unit of the endpoints under each prefix, defaults to `AMOUNT_UNITS`.
+
+    ### Returns
+    ----
+    int:
+        The number of dollars in one unit of the amounts, 1 if the
+        endpoint matches no prefix.
+    """
+
+    for prefix, unit in (AMOUNT_UNITS if units is None else units).items():
+        if endpoint and endpoint.startswith(prefix):
+            return unit
+
+    return 1
+
+
+def _strip_number(value: str) -> str:
+    """Removes the dollar signs, thousands separators and percent signs of a formatted number."""
+
+    return value.replace('$', '').replace(',', '').replace('%', '').strip()
+
+
+def converter_for(
+    data_type: str,
+    decimal: bool = True,
+    cents: bool = False,
+    unit: int = 1
+) -> Union[Callable[[str], object], None]:
+    """Picks the converter of one of the `meta['dataTypes']`.
+
+    ### Parameters
+    ----
+    data_type : str
+        The type descriptor, for example `'DATE'` or `'CURRENCY0'`.
+
+    decimal : bool (optional, Default=True)
+        If `True`, numbers are read as `Decimal`, otherwise as `float`.
+
+    cents : bool (optional, Default=False)
+        If `True`, currencies are read as whole numbers of cents, see `parse_cents`.
+
+    unit : int (optional, Default=1)
+        The number of dollars in one unit of the currencies read as cents.
+
+    ### Returns
+    ----
+    Union[Callable[[str], object], None]:
+        The converter, or `None` if values of this type stay strings.
+    """
+
+    data_type = (data_type or '').upper()
+
+    if data_type == 'DATE':
+        return parse_date
+
+    if data_type in INTEGER_TYPES:
+        return parse_integer
+
+    if cents and data_type.startswith('CURRENCY'):
+        return parse_cents if unit == 1 else partial(parse_cents, unit=unit)
+
+    if data_type in NUMBER_TYPES or data_type.startswith('CURRENCY'):
+        return parse_decimal if decimal else parse_float
+
+    return None
+
+
+@lru_cache(maxsize=256)
+def record_converters(
+    data_types: Tuple[Tuple[str, str], ...],
+    decimal: bool = True,
+    cents: bool = False,
+    unit: int = 1
+) -> Tuple[Tuple[str, Union[Callable[[str], object], None]], ...]:
+    """Builds, once per dataset, the converter of each field.
+
+    ### Parameters
+    ----
+    data_types : Tuple[Tuple[str, str], ...]
+        The items of `meta['dataTypes']`.
+
+    decimal : bool (optional, Default=True)
+        If `True`, numbers are read as `Decimal`, otherwise as `float`.
+
+    cents : bool (optional, Default=False)
+        If `True`, currencies are read as whole numbers of cents.
+
+    unit : int (optional, Default=1)
+        The number of dollars in one unit of the currencies read as cents.
+
+    ### Returns
+    ----
+    Tuple[Tuple[str, Union[Callable[[str], object], None]], ...]:
+        The field names, with their converter or `None` for strings.
+    """
+
+    return tuple(
+        (field, converter_for(data_type=data_type, decimal=decimal, cents=cents, unit=unit))
+        for field, data_type in data_types
+    )
+
+
+class TypeDecoder():
+
+    """
+    Overview:
+    ----
+    Converts the string values of the API to Python values, using the
+    `meta['dataTypes']` sent with every page. Dates become `date`,
+    whole numbers `int`, currencies and other numbers `Decimal` (or
+    `float`, or currencies as `int` cents), and `"null"` becomes `None`. The converters of a dataset
+    are built once and reused for every page of it.
+    """
+
+    def __init__(self, decimal: bool = True, cents: bool = False, units: Dict[str, int] = None) -> None:
+        """Initializes the `TypeDecoder` object.
+
+        ### Parameters
+        ----
+        decimal : bool (optional, Default=True)
+            If `True`, currencies and numbers are read as exact `Decimal`
+            values, otherwise as `float`, which is faster to do maths on.
+
+        cents : bool (optional, Default=False)
+            If `True`, currencies are read as exact whole numbers of cents,
+            which fit in an `int64` and sum much faster than `Decimal`.
+
+        units : Dict[str, int] (optional, Default=None)
+            The number of dollars in one unit of the currencies of the
+            endpoints under each prefix, when read as cents. Defaults to
+            `AMOUNT_UNITS`, the Daily Treasury Statement being in millions.
+
+        ### Usage
+        ----
+            >>> treasury_client = FederalTreasuryClient(type_decoder=TypeDecoder())
+            >>> treasury_client.other_data().debt_to_penny()['data'][0]['record_date']
+            datetime.date(2023, 3, 31)
+            >>> treasury_client = FederalTreasuryClient(type_decoder=TypeDecoder(cents=True))
+            >>> treasury_client.other_data().debt_to_penny()['data'][0]['tot_pub_debt_out_amt']
+            3145843074179328
+        """
+
+        self.decimal = decimal
+        self.cents = cents
+        self.units = AMOUNT_UNITS if units is None else units
+
+    def __repr__(self) -> str:
+        """String representation of the `TypeDecoder` object."""
+
+        return '<FederalTreasuryClient.TypeDecoder (decimal={decimal}, cents={cents})>'.format(
+            decimal=self.decimal,
+            cents=self.cents
+        )
+
+    def decode(self, content: Dict, endpoint: str = None) -> Dict:
+        """Converts the records of a page, in place.
+
+        ### Parameters
+        ----
+        content : Dict
+            A decoded page of the API, with its `data` and `meta`.
+
+        endpoint : str (optional, Default=None)
+            The API URL endpoint of the page, which sets the unit of its
+            currencies read as cents.
+
+        ### Returns
+        ----
+        Dict:
+            The same page, with typed records.
+        """
+
+        if not isinstance(content, dict) or not isinstance(content.get('data'), list):
+            return content
+
+        data_types = (content.get('meta') or {}).get('dataTypes')
+
+        if data_types:
+            self.decode_records(records=content['data'], data_types=data_types, endpoint=endpoint)
+
+        return content
+
+    def decode_records(self, records: List[dict], data_types: Dict[str, str], endpoint: str = None) -> List[dict]:
+        """Converts records, in place, using the `dataTypes` of their dataset.
+
+        ### Parameters
+        ----
+        records : List[dict]
+            The records, for example those of a `RecordStream`.
+
+        data_types : Dict[str, str]
+            The `meta['dataTypes']` of the dataset.
+
+        endpoint : str (optional, Default=None)
+            The API URL endpoint of the records, which sets the unit of
+            their currencies read as cents.
+
+        ### Returns
+        ----
+        List[dict]:
+            The same records, typed.
+        """
+
+        converters = record_converters(
+            data_types=tuple(data_types.items()),
+            decimal=self.decimal,
+            cents=self.cents,
+            unit=amount_unit(endpoint=endpoint, units=self.units) if self.cents else 1
+        )
+
+        for record in records:
+
+            for field, converter in converters:
+
+                value = record.get(field)
+
+                if value is None:
+                    continue
+
+                # The API sends missing values as `"null"`, and as empty strings for numbers.
+                if value == 'null' or converter is not None and value == '':
+                    record[field] = None
+                elif converter is not None:
+                    record[field] = converter(value)
+
+        return records